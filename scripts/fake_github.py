@@ -0,0 +1,1080 @@
+#!/usr/bin/env python3
+"""In-memory GitHub stand-in for exercising sync_roadmap_to_github_project.py.
+
+Emulates the `gh` CLI surfaces the sync script uses (project view/field-list/
+item-list/item-add/item-create/item-edit/item-archive/field-create, issue
+list, label list/create/edit/delete) and the REST endpoints behind `gh api`
+(issues, labels, milestones, rate_limit). State lives in memory; every call
+is counted by operation with bytes sent and received. Rate budgets, secondary
+limits and timeouts can be injected, and recorded sessions (see the sync
+script's --record-session) can be replayed.
+
+The stand-in plugs in as the sync script's gh transport, so no network or gh
+binary is involved.
+
+Usage:
+    # Cold sync + incremental re-sync of a synthetic 10k-node roadmap
+    python fake_github.py bench --nodes 10000 --mode issue --touch 5
+
+    # Same, with a secondary rate limit on every 200th field edit
+    python fake_github.py bench --nodes 2000 --fault "secondary:project item-edit:every=200:retry_after=2"
+
+    # Replay a recorded session offline
+    python fake_github.py replay session.jsonl -- --mode issue --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qs, unquote, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import sync_roadmap_to_github_project as sync_script  # noqa: E402
+
+
+GRAPHQL_COMMANDS = {("project",), ("issue", "list"), ("label", "list")}
+DEFAULT_LIST_LIMIT = 30
+
+
+class GhFailure(Exception):
+    """Raised inside a handler to turn into a non-zero gh exit."""
+
+    def __init__(self, message: str, *, status: int = 422, headers: dict[str, str] | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class PartialGraphQL(GhFailure):
+    """Some aliases of a batched mutation failed: HTTP 200, errors beside data."""
+
+    def __init__(self, data: dict[str, Any], errors: list[dict[str, Any]]) -> None:
+        super().__init__(errors[0]["message"], status=200)
+        self.data = data
+        self.errors = errors
+
+
+@dataclass
+class Fault:
+    """Inject a failure into matching operations.
+
+    kind: secondary (403 + Retry-After), primary (budget exhausted until
+    reset), timeout (subprocess timeout), error (HTTP 502) or partial (one
+    alias of a batched mutation fails while the others apply).
+    """
+
+    kind: str
+    op: str = "*"
+    every: int = 0
+    probability: float = 0.0
+    retry_after: float = 1.0
+    seen: int = 0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Fault":
+        kind, _, rest = spec.partition(":")
+        op, _, opts = rest.partition(":")
+        fault = cls(kind=kind, op=op or "*")
+        for opt in filter(None, opts.split(":")):
+            key, _, value = opt.partition("=")
+            if key == "every":
+                fault.every = int(value)
+            elif key in ("p", "probability"):
+                fault.probability = float(value)
+            elif key == "retry_after":
+                fault.retry_after = float(value)
+        if not fault.every and not fault.probability:
+            fault.every = 1
+        return fault
+
+    def fires(self, op: str, rng: random.Random) -> bool:
+        if not fnmatch.fnmatch(op, self.op):
+            return False
+        self.seen += 1
+        if self.every and self.seen % self.every == 0:
+            return True
+        return bool(self.probability) and rng.random() < self.probability
+
+
+@dataclass
+class Budget:
+    limit: int
+    remaining: int
+    reset_at: float
+
+
+@dataclass
+class CallStats:
+    calls: Counter[str] = field(default_factory=Counter)
+    failures: Counter[str] = field(default_factory=Counter)
+    bytes_in: Counter[str] = field(default_factory=Counter)
+    bytes_out: Counter[str] = field(default_factory=Counter)
+
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def report(self) -> str:
+        lines = [f"{'operation':<34} {'calls':>7} {'fail':>5} {'sent':>10} {'recv':>12}"]
+        for op in sorted(self.calls, key=lambda k: -self.calls[k]):
+            lines.append(
+                f"{op:<34} {self.calls[op]:>7} {self.failures[op]:>5} "
+                f"{self.bytes_in[op]:>10,} {self.bytes_out[op]:>12,}"
+            )
+        lines.append(
+            f"{'TOTAL':<34} {self.total():>7} {sum(self.failures.values()):>5} "
+            f"{sum(self.bytes_in.values()):>10,} {sum(self.bytes_out.values()):>12,}"
+        )
+        return "\n".join(lines)
+
+
+class VirtualClock:
+    """Drop-in for the `time` module so rate-limit sleeps cost no wall time."""
+
+    def __init__(self) -> None:
+        self.offset = 0.0
+        self.slept = 0.0
+
+    def time(self) -> float:
+        return time.time() + self.offset
+
+    def monotonic(self) -> float:
+        return time.monotonic() + self.offset
+
+    def sleep(self, seconds: float) -> None:
+        self.offset += seconds
+        self.slept += seconds
+
+    def strftime(self, fmt: str, t: Any = None) -> str:
+        return time.strftime(fmt, t) if t is not None else time.strftime(fmt)
+
+    def localtime(self, seconds: float | None = None) -> time.struct_time:
+        return time.localtime(seconds)
+
+
+def _opt(args: list[str], name: str, default: str | None = None) -> str | None:
+    if name in args:
+        idx = args.index(name)
+        if idx + 1 < len(args):
+            return args[idx + 1]
+    return default
+
+
+class FakeGitHub:
+    """Stateful stand-in for one GitHub owner with a single project board."""
+
+    def __init__(
+        self,
+        *,
+        project_number: int = 1,
+        faults: list[Fault] | None = None,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+        core_limit: int = 5000,
+        graphql_limit: int = 5000,
+    ) -> None:
+        self.project_number = project_number
+        self.project_id = f"PVT_fake{project_number}"
+        self.faults = faults or []
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.stats = CallStats()
+        self.budgets = {
+            "core": Budget(core_limit, core_limit, clock() + 3600),
+            "graphql": Budget(graphql_limit, graphql_limit, clock() + 3600),
+        }
+        self.fields: dict[str, dict[str, Any]] = {}
+        self.items: dict[str, dict[str, Any]] = {}
+        self.issues: dict[str, dict[int, dict[str, Any]]] = defaultdict(dict)
+        self.labels: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        self.milestones: dict[str, dict[int, dict[str, Any]]] = defaultdict(dict)
+        self.seq = 0
+        # The sync fans some calls out over threads; GitHub serialises per resource anyway.
+        self.lock = threading.RLock()
+        self.partial_pending = False
+        self._add_field("Status", "ProjectV2SingleSelectField", ["Todo", "In progress", "Done"])
+        self._add_field("Priority", "ProjectV2SingleSelectField", ["P0", "P1", "P2"])
+        self._add_field("Start date", "ProjectV2Field", [])
+        self._add_field("Target date", "ProjectV2Field", [])
+
+    # -- helpers -----------------------------------------------------------
+
+    def _next(self, prefix: str) -> str:
+        self.seq += 1
+        return f"{prefix}_{self.seq:08d}"
+
+    def _add_field(self, name: str, field_type: str, options: list[str]) -> None:
+        field_id = self._next("PVTF")
+        self.fields[field_id] = {
+            "id": field_id,
+            "name": name,
+            "type": field_type,
+            "options": [{"id": self._next("OPT"), "name": opt} for opt in options],
+        }
+
+    def _timestamp(self) -> str:
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.clock()))
+
+    def _field_by_id(self, field_id: str) -> dict[str, Any]:
+        if field_id not in self.fields:
+            raise GhFailure(f"Could not resolve to a node with the global id of '{field_id}'")
+        return self.fields[field_id]
+
+    def _issue_by_url(self, url: str) -> tuple[str, dict[str, Any]]:
+        match = re.match(r"https://github.com/([^/]+/[^/]+)/issues/(\d+)$", url)
+        if not match or int(match.group(2)) not in self.issues[match.group(1)]:
+            raise GhFailure(f"Could not resolve to an Issue with the URL '{url}'")
+        return match.group(1), self.issues[match.group(1)][int(match.group(2))]
+
+    def _item_content(self, item: dict[str, Any]) -> dict[str, Any]:
+        if item["content_type"] == "Issue":
+            repo, number = item["issue"]
+            issue = self.issues[repo][number]
+            return {
+                "type": "Issue",
+                "number": number,
+                "title": issue["title"],
+                "body": issue["body"],
+                "url": issue["html_url"],
+                "repository": repo,
+            }
+        return {"type": "DraftIssue", "id": item["draft_id"], "title": item["title"], "body": item["body"]}
+
+    def _item_json(self, item: dict[str, Any]) -> dict[str, Any]:
+        content = self._item_content(item)
+        out: dict[str, Any] = {"id": item["id"], "title": content["title"], "content": content}
+        for field_id, value in item["values"].items():
+            info = self.fields[field_id]
+            if info["options"]:
+                value = next((o["name"] for o in info["options"] if o["id"] == value), value)
+            out[info["name"].lower()] = value
+        return out
+
+    def _rest_issue(self, issue: dict[str, Any]) -> dict[str, Any]:
+        repo = issue["repo"]
+        return {
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue["body"],
+            "state": issue["state"],
+            "labels": [dict(self.labels[repo].get(n, {"name": n})) for n in sorted(issue["labels"])],
+            "milestone": self.milestones[repo].get(issue["milestone"]) if issue["milestone"] else None,
+            "html_url": issue["html_url"],
+            "updated_at": issue["updated_at"],
+        }
+
+    def _set_issue_labels(self, repo: str, issue: dict[str, Any], names: list[str]) -> None:
+        for name in names:
+            if name not in self.labels[repo]:
+                self.labels[repo][name] = {"name": name, "color": "ededed", "description": ""}
+        issue["labels"] = set(names)
+
+    # -- transport ---------------------------------------------------------
+
+    def op_name(self, args: list[str]) -> str:
+        if args[:1] == ["api"]:
+            method = _opt(args, "-X", "GET")
+            endpoint = urlparse(args[1]).path
+            endpoint = re.sub(r"^repos/[^/]+/[^/]+/", "", endpoint)
+            endpoint = re.sub(r"/\d+", "/{n}", endpoint)
+            endpoint = re.sub(r"^labels/.+", "labels/{name}", endpoint)
+            return f"api {method} {endpoint}"
+        return " ".join(args[:2])
+
+    def resource(self, args: list[str]) -> str | None:
+        if args[:2] == ["api", "rate_limit"]:
+            return None
+        if args[:2] == ["api", "graphql"]:
+            return "graphql"
+        if args[:1] == ["api"] or args[:2] in (["label", "create"], ["label", "edit"], ["label", "delete"]):
+            return "core"
+        if tuple(args[:1]) in GRAPHQL_COMMANDS or tuple(args[:2]) in GRAPHQL_COMMANDS:
+            return "graphql"
+        return None
+
+    def _headers(self, resource: str | None) -> dict[str, str]:
+        if resource is None:
+            return {}
+        budget = self.budgets[resource]
+        return {
+            "X-RateLimit-Limit": str(budget.limit),
+            "X-RateLimit-Remaining": str(budget.remaining),
+            "X-RateLimit-Reset": str(int(budget.reset_at)),
+            "X-RateLimit-Used": str(budget.limit - budget.remaining),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def __call__(self, cmd: list[str], input_data: str | None, timeout: float) -> subprocess.CompletedProcess[str]:
+        with self.lock:
+            return self._call(cmd, input_data, timeout)
+
+    def _call(self, cmd: list[str], input_data: str | None, timeout: float) -> subprocess.CompletedProcess[str]:
+        args = cmd[1:] if cmd[:1] == ["gh"] else list(cmd)
+        include = "--include" in args
+        args = [a for a in args if a != "--include"]
+        op = self.op_name(args)
+        resource = self.resource(args)
+        self.stats.calls[op] += 1
+        self.stats.bytes_in[op] += len(" ".join(cmd)) + len(input_data or "")
+
+        status, stdout, stderr = 200, "", ""
+        failed = False
+        headers: dict[str, str] = {}
+        try:
+            self._charge(resource)
+            for fault in self.faults:
+                if fault.fires(op, self.rng):
+                    self._inject(fault, cmd, timeout)
+            body = self.handle(args, input_data)
+            stdout = body if isinstance(body, str) else json.dumps(body)
+        except PartialGraphQL as exc:
+            # gh prints the body and exits non-zero when the response has errors.
+            failed = True
+            stderr = f"gh: {exc}"
+            stdout = json.dumps({"data": exc.data, "errors": exc.errors})
+        except GhFailure as exc:
+            failed = True
+            status = exc.status
+            headers = exc.headers
+            stderr = f"gh: {exc} (HTTP {status})" if args[:1] == ["api"] else f"GraphQL: {exc}"
+            stdout = json.dumps({"message": str(exc)}) if args[:1] == ["api"] else ""
+        except subprocess.TimeoutExpired:
+            self.stats.failures[op] += 1
+            raise
+
+        if include and args[:1] == ["api"]:
+            all_headers = {**self._headers(resource), **headers}
+            head = [f"HTTP/2.0 {status} {'OK' if status < 400 else 'Error'}"]
+            head.extend(f"{k}: {v}" for k, v in all_headers.items())
+            stdout = "\r\n".join(head) + "\r\n\r\n" + stdout
+        self.stats.bytes_out[op] += len(stdout)
+        if failed:
+            self.stats.failures[op] += 1
+            raise subprocess.CalledProcessError(1, cmd, output=stdout, stderr=stderr)
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    def _charge(self, resource: str | None) -> None:
+        if resource is None:
+            return
+        budget = self.budgets[resource]
+        now = self.clock()
+        if now >= budget.reset_at:
+            budget.remaining = budget.limit
+            budget.reset_at = now + 3600
+        if budget.remaining <= 0:
+            raise GhFailure(
+                "API rate limit exceeded",
+                status=403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(budget.reset_at))},
+            )
+        budget.remaining -= 1
+
+    def _inject(self, fault: Fault, cmd: list[str], timeout: float) -> None:
+        if fault.kind == "partial":
+            self.partial_pending = True
+            return
+        if fault.kind == "timeout":
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if fault.kind == "secondary":
+            raise GhFailure(
+                "You have exceeded a secondary rate limit",
+                status=403,
+                headers={"Retry-After": str(int(fault.retry_after))},
+            )
+        if fault.kind == "primary":
+            # Exhaust every budget until the advertised reset, so _charge refills them then.
+            reset_at = self.clock() + fault.retry_after
+            for budget in self.budgets.values():
+                budget.remaining = 0
+                budget.reset_at = reset_at
+            raise GhFailure(
+                "API rate limit exceeded",
+                status=403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(reset_at))},
+            )
+        raise GhFailure("Server Error", status=502)
+
+    # -- command dispatch --------------------------------------------------
+
+    def handle(self, args: list[str], input_data: str | None) -> Any:
+        if args[:1] == ["api"]:
+            return self.handle_api(args, input_data)
+        command = " ".join(args[:2])
+        handler = {
+            "project view": self.project_view,
+            "project field-list": self.project_field_list,
+            "project field-create": self.project_field_create,
+            "project item-list": self.project_item_list,
+            "project item-add": self.project_item_add,
+            "project item-create": self.project_item_create,
+            "project item-edit": self.project_item_edit,
+            "project item-archive": self.project_item_archive,
+            "issue list": self.issue_list,
+            "label list": self.label_list,
+            "label create": self.label_create,
+            "label edit": self.label_edit,
+            "label delete": self.label_delete,
+        }.get(command)
+        if handler is None:
+            raise GhFailure(f"fake_github: unsupported command '{command}'", status=400)
+        return handler(args)
+
+    def project_view(self, args: list[str]) -> Any:
+        return {"id": self.project_id, "number": self.project_number, "title": "Fake roadmap board"}
+
+    def project_field_list(self, args: list[str]) -> Any:
+        return {"fields": list(self.fields.values()), "totalCount": len(self.fields)}
+
+    def project_field_create(self, args: list[str]) -> Any:
+        name = _opt(args, "--name") or ""
+        self._add_field(name, "ProjectV2Field", [])
+        return ""
+
+    def project_item_list(self, args: list[str]) -> Any:
+        limit = int(_opt(args, "--limit", str(DEFAULT_LIST_LIMIT)) or DEFAULT_LIST_LIMIT)
+        live = [item for item in self.items.values() if not item["archived"]]
+        return {"items": [self._item_json(item) for item in live[:limit]], "totalCount": len(live)}
+
+    def project_item_add(self, args: list[str]) -> Any:
+        repo, issue = self._issue_by_url(_opt(args, "--url") or "")
+        for item in self.items.values():
+            if item["content_type"] == "Issue" and item["issue"] == (repo, issue["number"]):
+                item["archived"] = False
+                return {"id": item["id"], **self._item_content(item)}
+        item_id = self._next("PVTI")
+        self.items[item_id] = {
+            "id": item_id,
+            "content_type": "Issue",
+            "issue": (repo, issue["number"]),
+            "values": {},
+            "archived": False,
+            "created_at": self._timestamp(),
+        }
+        return {"id": item_id, **self._item_content(self.items[item_id])}
+
+    def project_item_create(self, args: list[str]) -> Any:
+        item_id = self._next("PVTI")
+        self.items[item_id] = {
+            "id": item_id,
+            "content_type": "DraftIssue",
+            "draft_id": self._next("DI"),
+            "title": _opt(args, "--title") or "",
+            "body": _opt(args, "--body") or "",
+            "values": {},
+            "archived": False,
+            "created_at": self._timestamp(),
+        }
+        return {"id": item_id, "title": self.items[item_id]["title"], "body": self.items[item_id]["body"], "type": "DraftIssue"}
+
+    def project_item_edit(self, args: list[str]) -> Any:
+        target = _opt(args, "--id") or ""
+        if "--field-id" not in args:
+            draft = next((i for i in self.items.values() if i.get("draft_id") == target), None)
+            if draft is None:
+                raise GhFailure(f"Could not resolve to a DraftIssue with the id '{target}'")
+            title = _opt(args, "--title")
+            if not title:
+                # Mirrors the gh CLI bug that blocks body-only draft edits.
+                raise GhFailure("Title can't be blank")
+            draft["title"] = title
+            if "--body" in args:
+                draft["body"] = _opt(args, "--body") or ""
+            return ""
+        item = self.items.get(target)
+        if item is None:
+            raise GhFailure(f"Could not resolve to a ProjectV2Item with the id '{target}'")
+        field_id = _opt(args, "--field-id") or ""
+        self._field_by_id(field_id)
+        if "--clear" in args:
+            item["values"].pop(field_id, None)
+        else:
+            for flag in ("--single-select-option-id", "--date", "--text", "--number"):
+                if flag in args:
+                    item["values"][field_id] = _opt(args, flag)
+        return ""
+
+    def project_item_archive(self, args: list[str]) -> Any:
+        item = self.items.get(_opt(args, "--id") or "")
+        if item is None:
+            raise GhFailure("Could not resolve to a ProjectV2Item")
+        item["archived"] = True
+        return ""
+
+    def issue_list(self, args: list[str]) -> Any:
+        repo = _opt(args, "--repo") or ""
+        limit = int(_opt(args, "--limit", str(DEFAULT_LIST_LIMIT)) or DEFAULT_LIST_LIMIT)
+        search = _opt(args, "--search")
+        if search:
+            search = re.sub(r"\bin:\w+", "", search).replace('"', "").strip()
+        state = (_opt(args, "--state", "open") or "open").lower()
+        wanted = (_opt(args, "--json") or "number").split(",")
+        out: list[dict[str, Any]] = []
+        for issue in sorted(self.issues[repo].values(), key=lambda i: -i["number"]):
+            if state != "all" and issue["state"] != state:
+                continue
+            if search and search not in issue["title"] and search not in issue["body"]:
+                continue
+            rest = self._rest_issue(issue)
+            full = {
+                "number": rest["number"],
+                "title": rest["title"],
+                "body": rest["body"],
+                "state": rest["state"].upper(),
+                "labels": rest["labels"],
+                "milestone": rest["milestone"],
+                "url": rest["html_url"],
+                "updatedAt": rest["updated_at"],
+            }
+            out.append({key: full.get(key) for key in wanted})
+            if len(out) >= limit:
+                break
+        return out
+
+    def label_list(self, args: list[str]) -> Any:
+        repo = _opt(args, "--repo") or ""
+        limit = int(_opt(args, "--limit", str(DEFAULT_LIST_LIMIT)) or DEFAULT_LIST_LIMIT)
+        wanted = (_opt(args, "--json") or "name").split(",")
+        labels = sorted(self.labels[repo].values(), key=lambda label: label["name"])[:limit]
+        return [{key: label.get(key) for key in wanted} for label in labels]
+
+    def label_create(self, args: list[str]) -> Any:
+        repo = _opt(args, "--repo") or ""
+        name = args[2]
+        if name in self.labels[repo]:
+            raise GhFailure(f"label with name \"{name}\" already exists")
+        self.labels[repo][name] = {
+            "name": name,
+            "color": (_opt(args, "--color") or "ededed").lower(),
+            "description": _opt(args, "--description") or "",
+        }
+        return ""
+
+    def label_edit(self, args: list[str]) -> Any:
+        repo = _opt(args, "--repo") or ""
+        label = self.labels[repo].get(args[2])
+        if label is None:
+            raise GhFailure(f"label \"{args[2]}\" not found")
+        if "--color" in args:
+            label["color"] = (_opt(args, "--color") or "").lower()
+        if "--description" in args:
+            label["description"] = _opt(args, "--description") or ""
+        return ""
+
+    def label_delete(self, args: list[str]) -> Any:
+        repo = _opt(args, "--repo") or ""
+        if self.labels[repo].pop(args[2], None) is None:
+            raise GhFailure(f"label \"{args[2]}\" not found")
+        for issue in self.issues[repo].values():
+            issue["labels"].discard(args[2])
+        return ""
+
+    # -- REST --------------------------------------------------------------
+
+    def handle_api(self, args: list[str], input_data: str | None) -> Any:
+        method = _opt(args, "-X", "GET") or "GET"
+        parsed = urlparse(args[1])
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        payload = json.loads(input_data) if input_data else {}
+        path = parsed.path
+        if path == "rate_limit":
+            return {
+                "resources": {
+                    name: {"limit": b.limit, "remaining": b.remaining, "reset": int(b.reset_at), "used": b.limit - b.remaining}
+                    for name, b in self.budgets.items()
+                }
+            }
+        if path == "graphql":
+            return self.handle_graphql(payload)
+        match = re.match(r"^repos/([^/]+/[^/]+)/(issues|milestones|labels)(?:/(.+))?$", path)
+        if not match:
+            raise GhFailure(f"Not Found: {path}", status=404)
+        repo, collection, ident = match.groups()
+        handler = getattr(self, f"rest_{collection}")
+        return handler(repo, method, ident, query, payload)
+
+    def handle_graphql(self, payload: dict[str, Any]) -> Any:
+        match = re.match(r"\s*(query|mutation)\s+(\w+)", payload.get("query", ""))
+        handler = getattr(self, f"gql_{match.group(2)}", None) if match else None
+        if handler is None:
+            raise GhFailure("fake_github: GraphQL document not emulated", status=400)
+        try:
+            return {"data": handler(payload.get("variables") or {}, payload["query"])}
+        finally:
+            self.partial_pending = False
+
+    def _aliased(self, aliases: list[tuple[str, Callable[[], Any]]]) -> dict[str, Any]:
+        """Run each alias of a batched mutation on its own, as GitHub does.
+
+        A failing alias is null in `data` and reported in `errors`; the others
+        still apply. A pending partial fault fails the middle alias.
+        """
+        out: dict[str, Any] = {}
+        errors: list[dict[str, Any]] = []
+        for index, (alias, run) in enumerate(aliases):
+            try:
+                if self.partial_pending and index == len(aliases) // 2:
+                    raise GhFailure("Something went wrong while executing your query.")
+                out[alias] = run()
+            except GhFailure as exc:
+                out[alias] = None
+                errors.append({"message": str(exc), "path": [alias]})
+        if errors:
+            raise PartialGraphQL(out, errors)
+        return out
+
+    def gql_RoadmapRepoIssues(self, variables: dict[str, Any], query: str) -> Any:
+        repo = f"{variables['owner']}/{variables['name']}"
+        issues = [self.issues[repo][n] for n in sorted(self.issues[repo])]
+        start = int(variables.get("cursor") or 0)
+        page = issues[start : start + 100]
+        nodes = [
+            {
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"].upper(),
+                "url": issue["html_url"],
+                "updatedAt": issue["updated_at"],
+                "labels": {"nodes": [{"name": name} for name in sorted(issue["labels"])]},
+                "milestone": {"title": self.milestones[repo][issue["milestone"]]["title"]}
+                if issue["milestone"] in self.milestones[repo]
+                else None,
+            }
+            for issue in page
+        ]
+        end = start + len(page)
+        return {
+            "repository": {
+                "issues": {"pageInfo": {"hasNextPage": end < len(issues), "endCursor": str(end)}, "nodes": nodes}
+            }
+        }
+
+    def gql_RoadmapIssueBodies(self, variables: dict[str, Any], query: str) -> Any:
+        repo = f"{variables['owner']}/{variables['name']}"
+        out: dict[str, Any] = {}
+        for alias, number in re.findall(r"(\w+): issue\(number: (\d+)\)", query):
+            issue = self.issues[repo].get(int(number))
+            out[alias] = {"body": issue["body"], "updatedAt": issue["updated_at"]} if issue else None
+        return {"repository": out}
+
+    def gql_RoadmapDraftBatch(self, variables: dict[str, Any], query: str) -> Any:
+        return self._aliased(
+            [
+                (alias, lambda mutation=mutation, inputs=inputs: self._draft_mutation(variables, mutation, inputs))
+                for alias, mutation, inputs in re.findall(r"(\w+): (\w+)\(input: \{([^}]*)\}\)", query)
+            ]
+        )
+
+    def _draft_mutation(self, variables: dict[str, Any], mutation: str, inputs: str) -> Any:
+        args = {key: variables.get(var) for key, var in re.findall(r"(\w+): \$(\w+)", inputs)}
+        if mutation == "addProjectV2DraftIssue":
+            if args["projectId"] != self.project_id:
+                raise GhFailure(f"Could not resolve to a node with the global id of '{args['projectId']}'")
+            item_id = self._next("PVTI")
+            self.items[item_id] = {
+                "id": item_id,
+                "content_type": "DraftIssue",
+                "draft_id": self._next("DI"),
+                "title": args["title"],
+                "body": args.get("body") or "",
+                "values": {},
+                "archived": False,
+                "created_at": self._timestamp(),
+            }
+            return {"projectItem": {"id": item_id, "content": {"id": self.items[item_id]["draft_id"]}}}
+        if mutation == "updateProjectV2DraftIssue":
+            draft = next((i for i in self.items.values() if i.get("draft_id") == args["draftIssueId"]), None)
+            if draft is None:
+                raise GhFailure(f"Could not resolve to a DraftIssue with the id '{args['draftIssueId']}'")
+            if "title" in args:
+                draft["title"] = args["title"]
+            if "body" in args:
+                draft["body"] = args["body"] or ""
+            return {"draftIssue": {"id": draft["draft_id"]}}
+        raise GhFailure(f"fake_github: mutation {mutation} not emulated", status=400)
+
+    def gql_RoadmapDraftIds(self, variables: dict[str, Any], query: str) -> Any:
+        out: dict[str, Any] = {}
+        for alias, var in re.findall(r"(\w+): node\(id: \$(\w+)\)", query):
+            item = self.items.get(variables.get(var) or "")
+            draft_id = item.get("draft_id") if item else None
+            out[alias] = {"content": {"id": draft_id} if draft_id else {}} if item else None
+        return out
+
+    def gql_RoadmapGcItems(self, variables: dict[str, Any], query: str) -> Any:
+        if variables.get("project") != self.project_id:
+            return {"node": None}
+        items = [item for item in self.items.values() if not item["archived"]]
+        start = int(variables.get("cursor") or 0)
+        page = items[start : start + 100]
+        nodes = []
+        for item in page:
+            content = self._item_content(item)
+            if content["type"] == "Issue":
+                content = {"__typename": "Issue", "number": content["number"], "title": content["title"], "url": content["url"]}
+            else:
+                content = {"__typename": "DraftIssue", "title": content["title"]}
+            nodes.append({"id": item["id"], "createdAt": item.get("created_at"), "isArchived": False, "content": content})
+        end = start + len(page)
+        return {
+            "node": {
+                "items": {
+                    "pageInfo": {"hasNextPage": end < len(items), "endCursor": str(end)},
+                    "nodes": nodes,
+                }
+            }
+        }
+
+    def gql_RoadmapArchiveBatch(self, variables: dict[str, Any], query: str) -> Any:
+        return self._aliased(
+            [
+                (alias, lambda project_var=project_var, item_var=item_var: self._archive(variables, project_var, item_var))
+                for alias, project_var, item_var in re.findall(
+                    r"(\w+): archiveProjectV2Item\(input: \{projectId: \$(\w+), itemId: \$(\w+)\}\)", query
+                )
+            ]
+        )
+
+    def _archive(self, variables: dict[str, Any], project_var: str, item_var: str) -> Any:
+        if variables.get(project_var) != self.project_id:
+            raise GhFailure(f"Could not resolve to a node with the global id of '{variables.get(project_var)}'")
+        item = self.items.get(variables.get(item_var) or "")
+        if item is None:
+            raise GhFailure("Could not resolve to a ProjectV2Item")
+        item["archived"] = True
+        return {"item": {"id": item["id"]}}
+
+    def gql_RoadmapPullItems(self, variables: dict[str, Any], query: str) -> Any:
+        if variables.get("project") != self.project_id:
+            return {"node": None}
+        items = [item for item in self.items.values() if not item["archived"]]
+        start = int(variables.get("cursor") or 0)
+        page = items[start : start + 100]
+        nodes = []
+        for item in page:
+            content = self._item_content(item)
+            if content["type"] == "Issue":
+                repo, number = item["issue"]
+                issue = self.issues[repo][number]
+                content = {
+                    "__typename": "Issue",
+                    "number": number,
+                    "title": issue["title"],
+                    "body": issue["body"],
+                    "state": issue["state"].upper(),
+                    "stateReason": (issue.get("state_reason") or "").upper() or None,
+                    "url": issue["html_url"],
+                }
+            else:
+                content = {"__typename": "DraftIssue", "id": content["id"], "title": content["title"], "body": content["body"]}
+            values = []
+            for field_id, value in item["values"].items():
+                info = self.fields[field_id]
+                if info["options"]:
+                    name = next((o["name"] for o in info["options"] if o["id"] == value), None)
+                    values.append({"name": name, "field": {"name": info["name"]}})
+                elif re.match(r"\d{4}-\d{2}-\d{2}$", str(value)):
+                    values.append({"date": value, "field": {"name": info["name"]}})
+                else:
+                    values.append({})
+            nodes.append({"id": item["id"], "isArchived": False, "fieldValues": {"nodes": values}, "content": content})
+        end = start + len(page)
+        return {
+            "node": {
+                "items": {
+                    "pageInfo": {"hasNextPage": end < len(items), "endCursor": str(end)},
+                    "nodes": nodes,
+                }
+            }
+        }
+
+    @staticmethod
+    def _page(rows: list[Any], query: dict[str, str]) -> list[Any]:
+        per_page = min(int(query.get("per_page", 30)), 100)
+        page = max(int(query.get("page", 1)), 1)
+        return rows[(page - 1) * per_page : page * per_page]
+
+    def rest_issues(self, repo: str, method: str, ident: str | None, query: dict[str, str], payload: dict[str, Any]) -> Any:
+        issues = self.issues[repo]
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.clock()))
+        if ident is None and method == "POST":
+            number = len(issues) + 1
+            issue = {
+                "repo": repo,
+                "number": number,
+                "title": payload["title"],
+                "body": payload.get("body", ""),
+                "state": "open",
+                "labels": set(),
+                "milestone": payload.get("milestone"),
+                "html_url": f"https://github.com/{repo}/issues/{number}",
+                "updated_at": now,
+            }
+            self._set_issue_labels(repo, issue, payload.get("labels", []))
+            issues[number] = issue
+            return self._rest_issue(issue)
+        if ident is None:
+            state = query.get("state", "open")
+            ordered = sorted(issues.values(), key=lambda i: i["number"], reverse=query.get("direction") == "desc")
+            rows = [self._rest_issue(i) for i in ordered if state == "all" or i["state"] == state]
+            return self._page(rows, query)
+        issue = issues.get(int(ident))
+        if issue is None:
+            raise GhFailure("Not Found", status=404)
+        if method == "PATCH":
+            for key in ("title", "body", "state", "state_reason"):
+                if key in payload:
+                    issue[key] = payload[key]
+            if "milestone" in payload:
+                issue["milestone"] = payload["milestone"]
+            if "labels" in payload:
+                self._set_issue_labels(repo, issue, payload["labels"])
+            issue["updated_at"] = now
+        return self._rest_issue(issue)
+
+    def rest_milestones(self, repo: str, method: str, ident: str | None, query: dict[str, str], payload: dict[str, Any]) -> Any:
+        milestones = self.milestones[repo]
+        if ident is None and method == "POST":
+            if any(m["title"] == payload["title"] for m in milestones.values()):
+                raise GhFailure("Validation Failed: already_exists")
+            number = max(milestones, default=0) + 1
+            milestones[number] = {
+                "number": number,
+                "title": payload["title"],
+                "description": payload.get("description"),
+                "due_on": payload.get("due_on"),
+                "state": payload.get("state", "open"),
+            }
+            return milestones[number]
+        if ident is None:
+            return self._page([milestones[n] for n in sorted(milestones)], query)
+        milestone = milestones.get(int(ident))
+        if milestone is None:
+            raise GhFailure("Not Found", status=404)
+        if method == "DELETE":
+            del milestones[int(ident)]
+            return ""
+        if method == "PATCH":
+            milestone.update({k: v for k, v in payload.items() if k in {"title", "description", "due_on", "state"}})
+        return milestone
+
+    def rest_labels(self, repo: str, method: str, ident: str | None, query: dict[str, str], payload: dict[str, Any]) -> Any:
+        labels = self.labels[repo]
+        if ident is None and method == "POST":
+            if payload["name"] in labels:
+                raise GhFailure("Validation Failed: already_exists")
+            labels[payload["name"]] = {
+                "name": payload["name"],
+                "color": payload.get("color", "ededed").lower(),
+                "description": payload.get("description", ""),
+            }
+            return labels[payload["name"]]
+        if ident is None:
+            return self._page([labels[n] for n in sorted(labels)], query)
+        ident = unquote(ident)
+        label = labels.get(ident)
+        if label is None:
+            raise GhFailure("Not Found", status=404)
+        if method == "DELETE":
+            del labels[ident]
+            for issue in self.issues[repo].values():
+                issue["labels"].discard(ident)
+            return ""
+        if method == "PATCH":
+            label.update({k: v for k, v in payload.items() if k in {"color", "description"}})
+        return label
+
+
+class ReplayTransport:
+    """Answer gh calls from a session recorded with --record-session.
+
+    Exchanges are matched on (command, input) in recorded order, so
+    repeated identical calls replay their successive responses.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.queues: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self.stats = CallStats()
+        self.misses = 0
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                record = json.loads(line)
+                self.queues[self._key(record["cmd"], record.get("input"))].append(record)
+
+    @staticmethod
+    def _key(cmd: list[str], input_data: str | None) -> str:
+        return json.dumps([cmd, input_data])
+
+    def __call__(self, cmd: list[str], input_data: str | None, timeout: float) -> subprocess.CompletedProcess[str]:
+        op = " ".join(cmd[1:3])
+        self.stats.calls[op] += 1
+        self.stats.bytes_in[op] += len(" ".join(cmd)) + len(input_data or "")
+        queue = self.queues.get(self._key(cmd, input_data))
+        if not queue:
+            self.misses += 1
+            self.stats.failures[op] += 1
+            raise subprocess.CalledProcessError(1, cmd, output="", stderr="fake_github replay: no recorded response")
+        record = queue.popleft()
+        if record.get("timeout"):
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        self.stats.bytes_out[op] += len(record.get("stdout", ""))
+        if record.get("returncode", 0):
+            self.stats.failures[op] += 1
+            raise subprocess.CalledProcessError(
+                record["returncode"], cmd, output=record.get("stdout", ""), stderr=record.get("stderr", "")
+            )
+        return subprocess.CompletedProcess(cmd, 0, stdout=record.get("stdout", ""), stderr=record.get("stderr", ""))
+
+
+def synthetic_model(nodes: int, *, seed: int = 0, as_of: str = "2026-01-01") -> dict[str, Any]:
+    """A roadmap shaped like semantic-roadmap.json, scaled to `nodes` nodes."""
+    rng = random.Random(seed)
+    kinds = ["initiative"] * 2 + ["work_item"] * 6 + ["milestone", "outcome"]
+    statuses = ["planned", "planned", "in_progress", "blocked", "done"]
+    horizons = ["0-30d", "30-90d", "90-180d", "180-365d"]
+    out_nodes: list[dict[str, Any]] = []
+    for i in range(nodes):
+        kind = kinds[i % len(kinds)]
+        node: dict[str, Any] = {
+            "id": f"{kind.replace('_', '')}.synthetic-{i:05d}",
+            "kind": kind,
+            "title": f"Synthetic {kind} {i}",
+            "summary": f"Generated node {i} for sync benchmarking. " * rng.randint(1, 4),
+            "status": rng.choice(statuses),
+            "priority": rng.choice(["P0", "P1", "P2", "P3"]),
+            "horizon": rng.choice(horizons),
+            "owner": f"owner.team-{i % 7}",
+            "tags": [f"pilot-{i % 13}"],
+        }
+        if kind == "milestone":
+            node["due_date"] = (date.fromisoformat(as_of) + timedelta(days=rng.randint(10, 360))).isoformat()
+        out_nodes.append(node)
+    ids = [n["id"] for n in out_nodes]
+    milestones = [n["id"] for n in out_nodes if n["kind"] == "milestone"]
+    edges: list[dict[str, Any]] = []
+    for i, node_id in enumerate(ids):
+        if i > 0:
+            edges.append({"from": node_id, "to": ids[rng.randrange(0, i)], "type": "depends_on"})
+        if milestones and out_nodes[i]["kind"] == "work_item":
+            edges.append({"from": node_id, "to": rng.choice(milestones), "type": "delivers"})
+        if i > 1 and rng.random() < 0.3:
+            edges.append({"from": node_id, "to": ids[rng.randrange(0, i)], "type": "informs"})
+    return {
+        "roadmap_id": "synthetic",
+        "program": "Synthetic benchmark",
+        "version": "0.0.1",
+        "as_of": as_of,
+        "nodes": out_nodes,
+        "edges": [e for e in edges if e["from"] != e["to"]],
+    }
+
+
+def touch_nodes(model: dict[str, Any], count: int, seed: int = 1) -> None:
+    rng = random.Random(seed)
+    for node in rng.sample(model["nodes"], min(count, len(model["nodes"]))):
+        node["status"] = "done" if node.get("status") != "done" else "in_progress"
+
+
+def run_sync(transport: Any, clock: VirtualClock, sync_args: list[str]) -> tuple[int, float]:
+    sync_script.time = clock  # type: ignore[assignment]
+    token = sync_script._ACTIVE_TRANSPORT.set(transport)
+    started = time.perf_counter()
+    try:
+        code = sync_script.main(sync_args)
+    finally:
+        sync_script._ACTIVE_TRANSPORT.reset(token)
+    return code, time.perf_counter() - started
+
+
+def bench(args: argparse.Namespace) -> int:
+    clock = VirtualClock()
+    fake = FakeGitHub(faults=[Fault.parse(spec) for spec in args.fault], seed=args.seed, clock=clock.time)
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = Path(tmp) / "model.json"
+        model = synthetic_model(args.nodes, seed=args.seed) if not args.model else json.loads(args.model.read_text())
+        model_path.write_text(json.dumps(model))
+        base = [
+            "--owner", "fake-org",
+            "--project", "1",
+            "--repo", "fake-org/roadmap",
+            "--mode", args.mode,
+            "--model", str(model_path),
+            "--state-file", str(Path(tmp) / "state.sqlite"),
+            "--journal", str(Path(tmp) / "journal.jsonl"),
+            "--kinds", args.kinds,
+            "--apply",
+            *args.sync_args,
+        ]
+        results: list[tuple[str, CallStats, float, float, int]] = []
+        for run in range(args.runs):
+            label = "cold" if run == 0 else f"re-sync #{run} (touched {args.touch})"
+            if run > 0 and args.touch:
+                touch_nodes(model, args.touch, seed=args.seed + run)
+                model_path.write_text(json.dumps(model))
+            fake.stats = CallStats()
+            slept_before = clock.slept
+            if args.quiet:
+                with open("/dev/null", "w") as devnull:
+                    stdout, sys.stdout = sys.stdout, devnull
+                    try:
+                        code, elapsed = run_sync(fake, clock, base)
+                    finally:
+                        sys.stdout = stdout
+            else:
+                code, elapsed = run_sync(fake, clock, base)
+            results.append((label, fake.stats, elapsed, clock.slept - slept_before, code))
+    for label, stats, elapsed, slept, code in results:
+        print(f"\n=== {label}: exit={code} wall={elapsed:.2f}s virtual_sleep={slept:.1f}s ===")
+        print(stats.report())
+    return max(code for *_, code in results)
+
+
+def replay(args: argparse.Namespace) -> int:
+    transport = ReplayTransport(args.session)
+    code, elapsed = run_sync(transport, VirtualClock(), args.sync_args)
+    print(f"\n=== replay: exit={code} wall={elapsed:.2f}s unmatched={transport.misses} ===")
+    print(transport.stats.report())
+    return code or (1 if transport.misses else 0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="In-memory GitHub stand-in for roadmap sync benchmarking.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    bench_parser = sub.add_parser("bench", help="Run the sync against a fresh in-memory GitHub.")
+    bench_parser.add_argument("--nodes", type=int, default=1000, help="Synthetic roadmap size.")
+    bench_parser.add_argument("--model", type=Path, default=None, help="Use a real roadmap model instead.")
+    bench_parser.add_argument("--mode", choices=["draft", "issue"], default="issue")
+    bench_parser.add_argument("--kinds", default="initiative,work_item,milestone")
+    bench_parser.add_argument("--runs", type=int, default=2, help="Cold run plus N-1 re-syncs.")
+    bench_parser.add_argument("--touch", type=int, default=1, help="Nodes to change between runs.")
+    bench_parser.add_argument("--fault", action="append", default=[], help="kind:op-glob[:every=N][:p=0.1][:retry_after=S]")
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--quiet", action="store_true", help="Suppress per-item sync output.")
+    bench_parser.add_argument("sync_args", nargs="*", help="Extra sync script arguments (after --).")
+
+    replay_parser = sub.add_parser("replay", help="Run the sync against a recorded session.")
+    replay_parser.add_argument("session", type=Path)
+    replay_parser.add_argument("sync_args", nargs="*", help="Sync script arguments (after --).")
+
+    args = parser.parse_args()
+    if args.command == "bench":
+        return bench(args)
+    return replay(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,10 @@
 Index BKC codebase into KOI knowledge graph via tree-sitter extraction.
 
 Uses the koi-processor TreeSitterExtractor as a library (not CLI) to
-extract code entities and edges, then writes results to JSON artifacts.
+extract code entities and edges, then writes results to JSONL artifacts
+(<repo>_artifacts.jsonl: a {"header": ...} line, then one {"entity": ...},
+{"edge": ...} or {"error": ...} object per line) that
+load_code_index_to_koi.py streams into KOI.
 
 Usage:
     python index_bkc_codebase.py --dry-run
@@ -189,6 +192,15 @@ def extract_file_manifest(repo_path: Path, language: str) -> dict:
     }
 
 
+def write_artifact(f, result: dict) -> None:
+    """Write an extraction result as JSONL: header first, then entities, edges and errors."""
+    header = {key: value for key, value in result.items() if key not in ("entities", "edges", "errors")}
+    f.write(json.dumps({"header": header}) + "\n")
+    for kind, key in (("entity", "entities"), ("edge", "edges"), ("error", "errors")):
+        for record in result.get(key, []):
+            f.write(json.dumps({kind: record}) + "\n")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Index BKC codebase via tree-sitter")
     parser.add_argument("--repos", nargs="*", help="Filter repos by path substring (default: all)")
@@ -236,9 +248,9 @@ def main():
 
         # Write artifact
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_file = output_dir / f"{repo_config['name']}_artifacts.json"
+        output_file = output_dir / f"{repo_config['name']}_artifacts.jsonl"
         with open(output_file, "w") as f:
-            json.dump(result, f, indent=2)
+            write_artifact(f, result)
 
         entity_count = len(result.get("entities", []))
         edge_count = len(result.get("edges", []))
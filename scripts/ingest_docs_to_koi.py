@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+Ingest the docs corpus into KOI knowledge graph as heading-aware chunks.
+
+Streams every markdown file under docs/ line by line, splits it into chunks
+along its heading structure, embeds the chunks in batches and bulk-upserts
+them with the same staging/COPY/merge/mark-sweep machinery as
+ingest_roadmap_to_koi.py (source `docs-ingest`).
+
+Each document becomes a `Document` entity (`doc:<doc_id>`) and each chunk a
+`DocChunk` entity whose id comes from its heading path, so it survives edits
+elsewhere in the file:
+
+    doc:<doc_id>#<heading>/<subheading>[-<n>][~<part>]
+
+`-<n>` disambiguates repeated headings and `~<part>` numbers the pieces of a
+section longer than --max-chunk-chars. doc_id, doc kind/status, depends_on
+and roadmap links come from docs/_meta/doc-graph.json (regenerate it with
+`build_semantic_roadmap.py --docs`); files without a doc_id are keyed by path.
+Relationships: chunk --part_of--> document, document --depends_on--> document,
+document --informs--> roadmap node.
+
+Only chunks whose text changed (or whose embedding model changed) are
+re-embedded; chunks whose metadata changed are upserted without a new
+embedding. Files are read one at a time and changed chunks are embedded and
+staged in windows of --window chunks, so memory use does not grow with the
+size of the corpus or of any one memo.
+
+Usage:
+    # Preview (no DB changes)
+    python ingest_docs_to_koi.py --db octo_koi --dry-run
+
+    # Apply
+    python ingest_docs_to_koi.py --db octo_koi --apply
+
+    # Offline, with deterministic local embeddings
+    python ingest_docs_to_koi.py --db octo_koi --apply --embedding-provider local-hash
+
+Environment: as for ingest_roadmap_to_koi.py (POSTGRES_*, EMBEDDING_*).
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import ingest_roadmap_to_koi as koi  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+log = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[1]
+DOCS_DIR = ROOT / "docs"
+DOC_GRAPH_PATH = DOCS_DIR / "_meta" / "doc-graph.json"
+
+DOCS_SOURCE = "docs-ingest"
+DOC_URI_PREFIX = "doc:"
+# Bump when chunking or the row layout changes, to force one full re-ingest.
+DOCS_FORMAT_VERSION = 1
+
+DEFAULT_MAX_CHUNK_CHARS = 2000         # ~500 tokens
+DEFAULT_WINDOW = 1000                  # changed chunks embedded + staged at a time
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+def slugify(text: str) -> str:
+    slug = re.sub(r"[^\w\s-]", "", text.lower()).strip()
+    return re.sub(r"[\s_-]+", "-", slug) or "section"
+
+
+# ---------------------------------------------------------------------------
+# Chunking
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Chunk:
+    chunk_id: str
+    heading_path: list[str]
+    part: int
+    text: str
+
+
+@dataclass
+class DocInfo:
+    path: str                  # relative to the repo root, e.g. docs/foundations/x.md
+    doc_key: str
+    doc_id: Optional[str]
+    title: str = ""
+    meta: dict[str, Any] = field(default_factory=dict)
+    roadmap_nodes: list[str] = field(default_factory=list)
+
+
+def split_paragraphs(lines: list[str], max_chars: int) -> list[str]:
+    """Pack a section's paragraphs into pieces of at most max_chars (long paragraphs are cut)."""
+    paragraphs: list[str] = []
+    current: list[str] = []
+    in_fence = False
+    for line in lines:
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if current:
+                paragraphs.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        paragraphs.append("\n".join(current))
+
+    pieces: list[str] = []
+    buf = ""
+    for para in paragraphs:
+        while len(para) > max_chars:
+            cut = para.rfind("\n", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if buf:
+                pieces.append(buf)
+                buf = ""
+            pieces.append(para[:cut])
+            para = para[cut:].lstrip("\n")
+        if buf and len(buf) + 2 + len(para) > max_chars:
+            pieces.append(buf)
+            buf = ""
+        buf = f"{buf}\n\n{para}" if buf else para
+    if buf:
+        pieces.append(buf)
+    return pieces
+
+
+def iter_chunks(lines: Iterator[str], max_chars: int = DEFAULT_MAX_CHUNK_CHARS) -> Iterator[Chunk]:
+    """Yield heading-aware chunks from markdown lines, holding one section at a time.
+
+    YAML frontmatter is skipped and headings inside fenced code are ignored.
+    """
+    stack: list[tuple[int, str]] = []
+    seen: dict[str, int] = {}
+    section: list[str] = []
+    in_fence = False
+    first = True
+    in_frontmatter = False
+
+    def flush() -> Iterator[Chunk]:
+        path = [title for _, title in stack]
+        base = "/".join(slugify(t) for t in path) or "_intro"
+        n = seen.get(base, 0) + 1
+        section_id = base if n == 1 else f"{base}-{n}"
+        # A repeat's suffix can spell another heading's slug ("Step", "Step 2", "Step").
+        while n > 1 and section_id in seen:
+            n += 1
+            section_id = f"{base}-{n}"
+        seen[base] = n
+        seen.setdefault(section_id, 1)
+        for part, piece in enumerate(split_paragraphs(section, max_chars)):
+            chunk_id = section_id if part == 0 else f"{section_id}~{part}"
+            yield Chunk(chunk_id, path, part, piece)
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+        if first:
+            first = False
+            if line.strip() == "---":
+                in_frontmatter = True
+                continue
+        if in_frontmatter:
+            if line.strip() in ("---", "..."):
+                in_frontmatter = False
+            continue
+        if FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if match:
+            yield from flush()
+            section = []
+            level = len(match.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, match.group(2)))
+            continue
+        section.append(line)
+    yield from flush()
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def load_doc_graph(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        log.warning(f"{path} not found — doc_ids and roadmap links unavailable "
+                    "(run build_semantic_roadmap.py --docs)")
+        return {"nodes": {}, "roadmap_links": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def iter_doc_files(docs_dir: Path) -> Iterator[Path]:
+    for md_path in sorted(docs_dir.rglob("*.md")):
+        if md_path.name.startswith(".") or "_meta" in md_path.parts:
+            continue
+        yield md_path
+
+
+def doc_info_for(md_path: Path, docs_dir: Path, doc_graph: dict[str, Any], by_path: dict[str, str]) -> DocInfo:
+    # doc-graph.json paths look like docs/<...>.md, whatever directory the corpus is read from.
+    rel = f"docs/{md_path.relative_to(docs_dir).as_posix()}"
+    doc_id = by_path.get(rel)
+    doc_key = doc_id or rel.removeprefix("docs/").removesuffix(".md")
+    info = DocInfo(path=rel, doc_key=doc_key, doc_id=doc_id,
+                   roadmap_nodes=sorted(set(doc_graph.get("roadmap_links", {}).get(rel, []))))
+    if doc_id:
+        info.meta = doc_graph["nodes"][doc_id]
+    return info
+
+
+def doc_uri(doc_key: str, chunk_id: Optional[str] = None) -> str:
+    uri = f"{DOC_URI_PREFIX}{doc_key}"
+    return f"{uri}#{chunk_id}" if chunk_id else uri
+
+
+def corpus_hash(files: list[Path], doc_graph_path: Path, model_key: Optional[str],
+                embedding_store: str, max_chars: int) -> str:
+    """Hash of every file's bytes plus the settings that shape rows, read one file at a time."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"model": model_key, "store": embedding_store, "max_chars": max_chars,
+                              "format": DOCS_FORMAT_VERSION}).encode())
+    for path in [doc_graph_path, *files]:
+        digest.update(str(path).encode())
+        if path.exists():
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 16), b""):
+                    digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_doc_items(files: list[Path], docs_dir: Path, doc_graph: dict[str, Any], max_chars: int,
+                   report: dict[str, int]) -> Iterator[tuple[dict, list[tuple[str, str, str]]]]:
+    """Yield (entity, relationships) per document and per chunk, one file in memory at a time."""
+    by_path = {node["file_path"]: doc_id for doc_id, node in doc_graph.get("nodes", {}).items()}
+    keys_seen: set[str] = set()
+    for md_path in files:
+        info = doc_info_for(md_path, docs_dir, doc_graph, by_path)
+        if info.doc_key in keys_seen:
+            log.warning(f"  Duplicate doc key '{info.doc_key}' ({info.path}), skipping")
+            continue
+        keys_seen.add(info.doc_key)
+        report["docs"] += 1
+        document = doc_uri(info.doc_key)
+        base_meta = {"doc_key": info.doc_key, "doc_path": info.path}
+        if info.doc_id:
+            base_meta.update(doc_id=info.doc_id, doc_kind=info.meta.get("doc_kind"),
+                             doc_status=info.meta.get("status"))
+        if info.roadmap_nodes:
+            base_meta["roadmap_node_ids"] = info.roadmap_nodes
+
+        chunk_count = 0
+        with open(md_path, encoding="utf-8", errors="replace") as f:
+            for chunk in iter_chunks(f, max_chars):
+                if not info.title and chunk.heading_path:
+                    info.title = chunk.heading_path[0]
+                label = " > ".join(chunk.heading_path) or info.doc_key
+                chunk_count += 1
+                report["chunks"] += 1
+                yield {
+                    "uri": doc_uri(info.doc_key, chunk.chunk_id),
+                    "entity_type": "DocChunk",
+                    "name": f"{info.title or info.doc_key}: {label}" if chunk.heading_path else info.doc_key,
+                    "first_seen_rid": f"docs:{info.doc_key}",
+                    "text": f"{label}\n\n{chunk.text}",
+                    "metadata": {**base_meta, "chunk_id": chunk.chunk_id,
+                                 "heading_path": chunk.heading_path, "chunk_part": chunk.part,
+                                 "text": chunk.text},
+                }, [(doc_uri(info.doc_key, chunk.chunk_id), "part_of", document)]
+
+        rels = [(document, "depends_on", doc_uri(dep)) for dep in info.meta.get("depends_on", [])]
+        rels += [(document, "informs", koi.uri_for_node(node_id)) for node_id in info.roadmap_nodes]
+        title = info.title or info.doc_key
+        yield {
+            "uri": document,
+            "entity_type": "Document",
+            "name": title,
+            "first_seen_rid": f"docs:{info.doc_key}",
+            "text": title,
+            "metadata": {**base_meta, "doc_title": title, "chunk_count": chunk_count},
+        }, rels
+
+
+def row_fingerprint(entity: dict, embedding_store: str) -> str:
+    return koi.content_hash({"type": entity["entity_type"], "name": entity["name"],
+                             "metadata": entity["metadata"], "store": embedding_store,
+                             "format": DOCS_FORMAT_VERSION})
+
+
+def text_fingerprint(entity: dict, model_key: Optional[str]) -> Optional[str]:
+    return koi.content_hash({"text": entity["text"], "model": model_key}) if model_key else None
+
+
+# ---------------------------------------------------------------------------
+# Ingest
+# ---------------------------------------------------------------------------
+
+def stage_window(cur, window: list[dict], embed: list[bool], embedder, cache,
+                 stats: dict[str, Any]) -> None:
+    """Embed the chunks flagged in `embed` (streamed as batches finish) and COPY the window."""
+    plain = [e for e, needs in zip(window, embed) if not needs]
+    if plain:
+        stats["entities_staged"] += koi.stage_entities(cur, plain, [None] * len(plain))
+    to_embed = [e for e, needs in zip(window, embed) if needs]
+    if not to_embed:
+        return
+    stream = koi.EmbeddingStream(embedder, [e["text"] for e in to_embed], cache)
+    try:
+        for indices, vectors in stream:
+            batch = [to_embed[i] for i in indices]
+            for entity, vector in zip(batch, vectors):
+                if vector is None:
+                    # Not recorded as embedded, so the next run retries it.
+                    entity["metadata"].pop("doc_embedded", None)
+                    stats["embeddings_failed"] += 1
+                else:
+                    stats["embeddings_created"] += 1
+            stats["entities_staged"] += koi.stage_entities(cur, batch, vectors)
+    finally:
+        stream.close()
+
+
+def ingest_docs(args, dry_run: bool = True) -> dict[str, Any]:
+    docs_dir = Path(args.docs_dir)
+    doc_graph_path = Path(args.doc_graph)
+    doc_graph = load_doc_graph(doc_graph_path)
+    files = list(iter_doc_files(docs_dir))
+    report = {"docs": 0, "chunks": 0}
+    log.info(f"Docs corpus: {len(files)} markdown files under {docs_dir}")
+
+    if dry_run:
+        log.info("=== DRY RUN — no DB changes ===")
+        rels = 0
+        for entity, entity_rels in iter_doc_items(files, docs_dir, doc_graph, args.max_chunk_chars, report):
+            rels += len(entity_rels)
+        log.info(f"  Would upsert {report['docs']} documents, {report['chunks']} chunks, {rels} relationships")
+        return {**report, "relationships": rels}
+
+    embedder = koi.make_embedding_client(args)
+    model_key = embedder.model_key if embedder else None
+
+    conn = koi.get_db_connection(args)
+    conn.autocommit = False
+    cur = conn.cursor()
+    has_embeddings_table = koi.check_entity_embeddings_table(cur)
+    conn.rollback()
+    try:
+        embedding_store = koi.resolve_embedding_store(args.embedding_store, has_embeddings_table)
+    except ValueError as e:
+        log.error(str(e))
+        sys.exit(1)
+
+    stats: dict[str, Any] = {"docs": 0, "chunks": 0, "entities_staged": 0, "entities_upserted": 0,
+                             "entities_unchanged": 0, "embeddings_created": 0, "embeddings_reused": 0,
+                             "embeddings_failed": 0, "rels_created": 0, "rels_removed": 0,
+                             "stale_removed": 0, "corpus_unchanged": False}
+
+    koi.ensure_ingest_schema(cur)
+    graph_hash = corpus_hash(files, doc_graph_path, model_key, embedding_store, args.max_chunk_chars)
+    stored_hash = koi.load_graph_hash(cur, DOCS_SOURCE)
+    stored = koi.load_fingerprints(cur, DOCS_SOURCE, "doc_fingerprint", "doc_embedded")
+    conn.commit()
+    if stored_hash == graph_hash and not args.force:
+        log.info(f"Docs corpus unchanged since last ingest (hash: {graph_hash[:12]}) — nothing to do")
+        cur.close()
+        conn.close()
+        stats["corpus_unchanged"] = True
+        return stats
+
+    cache = None
+    if embedder and embedder.cacheable and not args.no_embedding_cache:
+        cache = koi.EmbeddingCache(Path(args.embedding_cache), max_entries=args.embedding_cache_max)
+
+    live_uris: list[str] = []
+    try:
+        koi.create_staging_tables(cur)
+        window: list[dict] = []
+        embed: list[bool] = []
+        rels: list[tuple[str, str, str]] = []
+        for entity, entity_rels in iter_doc_items(files, docs_dir, doc_graph, args.max_chunk_chars, report):
+            live_uris.append(entity["uri"])
+            rels.extend(entity_rels)
+            if len(rels) >= koi.COPY_CHUNK_ROWS:
+                koi.stage_relationships(cur, rels)
+                rels = []
+            entity["metadata"]["doc_fingerprint"] = row_fingerprint(entity, embedding_store)
+            text_fp = text_fingerprint(entity, model_key)
+            if text_fp:
+                entity["metadata"]["doc_embedded"] = text_fp
+            old_row, old_text = stored.get(entity["uri"], (None, None))
+            needs_embedding = bool(text_fp) and (args.force or old_text != text_fp)
+            if not needs_embedding and old_row == entity["metadata"]["doc_fingerprint"] and not args.force:
+                stats["entities_unchanged"] += 1
+                continue
+            if text_fp and not needs_embedding:
+                stats["embeddings_reused"] += 1
+            window.append(entity)
+            embed.append(needs_embedding)
+            if len(window) >= args.window:
+                stage_window(cur, window, embed, embedder, cache, stats)
+                window, embed = [], []
+        stage_window(cur, window, embed, embedder, cache, stats)
+        koi.stage_relationships(cur, rels)
+        stats.update(docs=report["docs"], chunks=report["chunks"])
+        log.info(f"  {report['docs']} documents, {report['chunks']} chunks; staged {stats['entities_staged']} "
+                 f"({stats['embeddings_created']} embedded, {stats['embeddings_reused']} kept their embedding), "
+                 f"{stats['entities_unchanged']} unchanged")
+
+        generation = koi.next_generation(cur, DOCS_SOURCE)
+        stats["entities_upserted"] = koi.merge_entities(cur, generation, embedding_store,
+                                                        has_embeddings_table=has_embeddings_table,
+                                                        source=DOCS_SOURCE,
+                                                        clear_other_store=args.clear_other_embedding_store)
+        koi.stage_live_entities(cur, live_uris)
+        stats["rels_created"], stats["rels_removed"] = koi.sync_relationships(cur, source=DOCS_SOURCE)
+        swept = koi.sweep_stale_entities(cur, generation, has_embeddings_table, source=DOCS_SOURCE)
+        stats["stale_removed"] = swept["entities"]
+        # Chunks whose embedding failed were stored unembedded; without the saved
+        # corpus hash the next run gets past the early exit and retries them.
+        if not stats["embeddings_failed"]:
+            koi.save_graph_hash(cur, graph_hash, source=DOCS_SOURCE)
+        conn.commit()
+        log.info("--- Committed to database ---")
+    except Exception as e:
+        conn.rollback()
+        log.error(f"Transaction failed, rolled back: {e}")
+        raise
+    finally:
+        if cache:
+            cache.close()
+        cur.close()
+        conn.close()
+
+    log.info("--- Summary ---")
+    log.info(f"  Entities: {stats['entities_upserted']} upserted, {stats['entities_unchanged']} unchanged, "
+             f"{stats['stale_removed']} stale removed")
+    log.info(f"  Embeddings: {stats['embeddings_created']} created, {stats['embeddings_reused']} reused, "
+             f"{stats['embeddings_failed']} failed")
+    log.info(f"  Relationships: {stats['rels_created']} created, {stats['rels_removed']} removed")
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest docs corpus into KOI knowledge graph")
+    parser.add_argument("--db", required=True, help="PostgreSQL database name (e.g. octo_koi)")
+    parser.add_argument("--host", default=None, help="DB host (default: env POSTGRES_HOST or localhost)")
+    parser.add_argument("--port", default=None, type=int, help="DB port (default: env POSTGRES_PORT or 5432)")
+    parser.add_argument("--user", default=None, help="DB user (default: env POSTGRES_USER or postgres)")
+    parser.add_argument("--password", default=None, help="DB password (default: env POSTGRES_PASSWORD)")
+    parser.add_argument("--docs-dir", default=str(DOCS_DIR), help="Markdown corpus root (default: docs/)")
+    parser.add_argument("--doc-graph", default=str(DOC_GRAPH_PATH),
+                        help="doc-graph.json with doc_ids and roadmap links (default: docs/_meta/doc-graph.json)")
+    parser.add_argument("--max-chunk-chars", type=int, default=DEFAULT_MAX_CHUNK_CHARS,
+                        help="Split sections longer than this at paragraph boundaries")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help="Changed chunks embedded and staged per window")
+    parser.add_argument("--dry-run", action="store_true", help="Preview changes without applying")
+    parser.add_argument("--apply", action="store_true", help="Apply changes")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-embed and upsert every chunk even if the corpus is unchanged")
+    koi.add_embedding_arguments(parser)
+
+    args = parser.parse_args()
+
+    if not args.dry_run and not args.apply:
+        log.error("Must specify --dry-run or --apply")
+        sys.exit(1)
+
+    ingest_docs(args, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,30 @@ Ingest semantic roadmap into KOI knowledge graph.
 
 Uses direct PostgreSQL access (matching the KOI entity_registry schema)
 to upsert roadmap nodes as entities with OpenAI embeddings, create
-relationships from edges, and clean up stale data via mark/sweep.
+relationships from edges, and clean up stale data via mark/sweep: each
+run stamps a new generation on the rows it merges, stages the URIs of all
+live nodes, and the sweep is one DELETE of older-generation rows that are
+not in that live set. Unchanged rows are never rewritten.
+Rows are streamed with COPY into temporary staging tables and merged
+with a few set-based INSERT ... SELECT ... ON CONFLICT statements, one
+savepoint per batch: a batch the DB rejects is bisected down to its bad
+rows, which are reported (--reject-report) while everything else commits.
+Embeddings are requested in token-budgeted batches over one pooled HTTP
+session, with bounded concurrency and retry. Finished batches are staged
+while later ones are still in flight, so the run takes about as long as the
+slower of embedding and DB writes rather than their sum.
+Offline nodes and CI can use a local backend instead: deterministic hashed
+n-gram features (--embedding-provider local-hash, no dependencies) or a CPU
+sentence-transformers model if that package is installed.
+Unchanged texts are answered from an on-disk cache (.cache/) instead.
+Vectors stay float32 from the API response to the DB: they are staged with
+COPY BINARY in pgvector's wire format and written to one authoritative
+table (--embedding-store, default entity_registry, the column the KOI
+readers use), not to both entity_registry and entity_embeddings. The copy
+in the other table is only cleared with --clear-other-embedding-store.
+A run whose graph hash matches the last ingest exits early; otherwise only
+nodes whose fingerprint (text, metadata, embedding model) changed are
+re-embedded and upserted.
 
 Usage:
     # Preview (no DB changes)
@@ -13,30 +36,51 @@ Usage:
     # Apply to Octo node
     python ingest_roadmap_to_koi.py --db octo_koi --apply
 
+    # Apply without network access (deterministic local embeddings)
+    python ingest_roadmap_to_koi.py --db octo_koi --apply --embedding-provider local-hash
+
     # Apply with smoke checks (requires KOI API to be running)
     python ingest_roadmap_to_koi.py --db octo_koi --apply --smoke --api http://localhost:8351
 
+    # Retrieval latency under load (see koi_load_test.py)
+    python koi_load_test.py run --api http://localhost:8351 --duration 60 --threshold "chat.p95<=4000"
+
     # Specify custom roadmap file and DB connection
     python ingest_roadmap_to_koi.py --db octo_koi --apply \
         --roadmap /path/to/roadmap-data.json \
         --host localhost --port 5432 --user postgres --password postgres
 
 Environment:
-    OPENAI_API_KEY  — Required for embedding generation
+    OPENAI_API_KEY  — Required for embedding generation with the openai provider
+    EMBEDDING_API_KEY — Overrides OPENAI_API_KEY (e.g. for an openai-compatible server)
+    EMBEDDING_PROVIDER — openai (default), openai-compatible, local-hash or sentence-transformers
+    EMBEDDING_BASE_URL — Embeddings API base URL (default: https://api.openai.com/v1)
     POSTGRES_HOST   — DB host (default: localhost)
     POSTGRES_PORT   — DB port (default: 5432)
     POSTGRES_USER   — DB user (default: postgres)
     POSTGRES_PASSWORD — DB password (default: postgres)
-    EMBEDDING_MODEL — OpenAI model (default: text-embedding-ada-002)
+    EMBEDDING_MODEL — OpenAI model (default: text-embedding-ada-002; all-MiniLM-L6-v2
+                      for sentence-transformers)
+    EMBEDDING_DIM   — Vector dimension (default: the model's; 1536 for local-hash)
+    EMBEDDING_STORE — entity_registry (default), entity_embeddings or auto
 """
 
 import argparse
+import base64
 import hashlib
+import io
 import json
 import logging
 import os
+import queue
 import re
+import sqlite3
+import struct
 import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
@@ -71,6 +115,11 @@ EDGE_TO_PREDICATE = {
 
 ROADMAP_URI_PREFIX = "roadmap:"
 ROADMAP_SOURCE = "roadmap-ingest"
+# Bump when the entity row layout changes, to force one full re-ingest.
+INGEST_FINGERPRINT_VERSION = 2
+
+DEFAULT_EMBEDDING_CACHE = Path(__file__).resolve().parents[1] / ".cache" / "koi-embedding-cache.sqlite"
+DEFAULT_EMBEDDING_CACHE_MAX = 200_000
 
 
 def uri_for_node(node_id: str) -> str:
@@ -94,28 +143,464 @@ def content_hash(data: dict) -> str:
 # Embedding generation
 # ---------------------------------------------------------------------------
 
-def generate_embedding(text: str, model: str) -> Optional[list[float]]:
-    """Generate embedding via OpenAI API."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        return None
+# Provider name -> (default base URL, API key required, base64 responses).
+# Any server speaking the OpenAI /embeddings protocol (vLLM, Ollama, a local
+# test stand-in) can be used via "openai-compatible" and --embedding-base-url;
+# not all of them honour encoding_format=base64, so it asks for JSON floats.
+EMBEDDING_PROVIDERS = {
+    "openai": ("https://api.openai.com/v1", True, True),
+    "openai-compatible": (None, False, False),
+}
 
-    try:
+# In-process backends that need no network: provider name -> default model.
+LOCAL_EMBEDDING_PROVIDERS = {
+    "local-hash": "hashed-ngrams-v1",
+    "sentence-transformers": "all-MiniLM-L6-v2",
+}
+DEFAULT_HASH_EMBEDDING_DIM = 1536      # same width as text-embedding-ada-002
+
+# Table that holds the authoritative copy of each roadmap embedding.
+EMBEDDING_STORES = ("entity_registry", "entity_embeddings")
+
+DEFAULT_EMBEDDING_BATCH_TOKENS = 50_000
+DEFAULT_EMBEDDING_BATCH_SIZE = 512     # OpenAI caps a request at 2048 inputs
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+DEFAULT_EMBEDDING_RETRIES = 5
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap upper-ish token estimate (~4 chars/token for English BPE)."""
+    return len(text) // 4 + 1
+
+
+def batch_by_tokens(texts: list[str], max_tokens: int, max_items: int) -> list[list[int]]:
+    """Group text indices into batches under a token budget and item cap."""
+    batches: list[list[int]] = []
+    current: list[int] = []
+    budget = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (budget + tokens > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, budget = [], 0
+        current.append(i)
+        budget += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def float32_vector(values) -> array:
+    """Embedding as a float32 array (base64 little-endian blob or JSON floats)."""
+    if isinstance(values, str):
+        vector = array("f")
+        vector.frombytes(base64.b64decode(values))
+        if sys.byteorder == "big":
+            vector.byteswap()
+        return vector
+    return array("f", values)
+
+
+# An embedding backend is any object with:
+#   model_key          — identifies the vector space (cache and fingerprint key)
+#   requests_made      — API requests / inference batches issued so far
+#   cacheable          — whether answering from EmbeddingCache is worth it
+#   concurrency        — how many embed_batch calls may run at once
+#   batches(texts)     — split texts into index groups, one per embed_batch call
+#   embed_batch(texts) — one float32 array per text, in order; raises on failure
+# EmbeddingStream drives any backend; embed_texts collects its output.
+
+
+def batch_by_size(count: int, size: int) -> list[list[int]]:
+    return [list(range(start, min(start + size, count))) for start in range(0, count, size)]
+
+
+class EmbeddingClient:
+    """Batched client for an OpenAI-style /embeddings endpoint.
+
+    One pooled HTTP session is shared by all workers. Texts are normalized
+    and grouped into batches by estimated tokens; 429/5xx responses are
+    retried with backoff (honouring Retry-After).
+    """
+
+    def __init__(self, model: str, base_url: str, api_key: Optional[str] = None,
+                 batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS,
+                 batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+                 concurrency: int = DEFAULT_EMBEDDING_CONCURRENCY,
+                 retries: int = DEFAULT_EMBEDDING_RETRIES,
+                 timeout: float = 60.0, base64_vectors: bool = False,
+                 dimensions: Optional[int] = None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.model = model
+        self.url = base_url.rstrip("/") + "/embeddings"
+        # Same model name on different servers can mean different vectors.
+        self.model_key = f"{model}@{base_url.rstrip('/')}"
+        if dimensions:
+            self.model_key += f"#{dimensions}"
+        self.dimensions = dimensions
+        self.cacheable = True
+        self.batch_tokens = batch_tokens
+        self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
+        self.retries = retries
+        self.timeout = timeout
+        self.base64_vectors = base64_vectors
+        self.requests_made = 0
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+    def _post(self, inputs: list[str]) -> list[array]:
         import requests
-        resp = requests.post(
-            "https://api.openai.com/v1/embeddings",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={"model": model, "input": normalize_text(text)},
-            timeout=30,
+
+        payload: dict[str, Any] = {"model": self.model, "input": inputs}
+        if self.base64_vectors:
+            # ~4 bytes/dimension on the wire instead of ~20 for JSON floats.
+            payload["encoding_format"] = "base64"
+        if self.dimensions:
+            payload["dimensions"] = self.dimensions
+        delay = 1.0
+        for attempt in range(self.retries + 1):
+            try:
+                with self._lock:
+                    self.requests_made += 1
+                resp = self.session.post(self.url, json=payload, timeout=self.timeout)
+                if resp.status_code in RETRYABLE_STATUS and attempt < self.retries:
+                    wait = float(resp.headers.get("Retry-After") or delay)
+                    log.warning(f"  Embedding request got HTTP {resp.status_code}, retrying in {wait:.1f}s")
+                    time.sleep(wait)
+                    delay = min(delay * 2, 60.0)
+                    continue
+                resp.raise_for_status()
+                data = sorted(resp.json()["data"], key=lambda row: row["index"])
+                if len(data) != len(inputs):
+                    raise ValueError(f"expected {len(inputs)} embeddings, got {len(data)}")
+                return [float32_vector(row["embedding"]) for row in data]
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.retries:
+                    raise
+                log.warning(f"  Embedding request failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, 60.0)
+        raise RuntimeError("unreachable")
+
+    def batches(self, texts: list[str]) -> list[list[int]]:
+        return batch_by_tokens([normalize_text(t) for t in texts], self.batch_tokens, self.batch_size)
+
+    def embed_batch(self, texts: list[str]) -> list[array]:
+        return self._post([normalize_text(t) for t in texts])
+
+
+class HashingEmbedder:
+    """Deterministic local embeddings from hashed word and character n-grams.
+
+    Each word and each character trigram of the normalized text is hashed
+    (blake2b, so results are stable across processes and machines) into one
+    of `dim` signed buckets, and the vector is L2-normalized. Texts sharing
+    vocabulary land close together — enough for tests, benchmarks and
+    offline pilot nodes, not a substitute for a semantic model.
+    """
+
+    def __init__(self, dim: int = DEFAULT_HASH_EMBEDDING_DIM, batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE):
+        self.dim = dim
+        self.batch_size = batch_size
+        self.model_key = f"{LOCAL_EMBEDDING_PROVIDERS['local-hash']}#{dim}"
+        self.requests_made = 0
+        self.cacheable = False  # cheaper to recompute than to look up
+        self.concurrency = 1    # CPU-bound under the GIL
+
+    def features(self, text: str) -> list[str]:
+        words = normalize_text(text).split()
+        grams = [f"w:{w}" for w in words]
+        for word in words:
+            padded = f"<{word}>"
+            grams.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return grams
+
+    def embed_one(self, text: str) -> array:
+        vector = array("f", bytes(4 * self.dim))
+        for gram in self.features(text):
+            h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "little")
+            vector[h % self.dim] += 1.0 if (h >> 63) & 1 else -1.0
+        norm = sum(x * x for x in vector) ** 0.5
+        if norm:
+            for i, x in enumerate(vector):
+                if x:
+                    vector[i] = x / norm
+        return vector
+
+    def batches(self, texts: list[str]) -> list[list[int]]:
+        return batch_by_size(len(texts), self.batch_size)
+
+    def embed_batch(self, texts: list[str]) -> list[array]:
+        self.requests_made += 1
+        return [self.embed_one(t) for t in texts]
+
+
+class SentenceTransformerEmbedder:
+    """CPU sentence-embedding model via the optional sentence-transformers package."""
+
+    def __init__(self, model: str, dim: Optional[int] = None,
+                 batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE):
+        from sentence_transformers import SentenceTransformer
+
+        # truncate_dim keeps the leading dimensions (Matryoshka-trained models).
+        self.model = SentenceTransformer(model, device="cpu", truncate_dim=dim)
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.batch_size = batch_size
+        self.model_key = f"sentence-transformers:{model}#{self.dim}"
+        self.requests_made = 0
+        self.cacheable = True
+        self.concurrency = 1    # the model parallelizes internally
+
+    def batches(self, texts: list[str]) -> list[list[int]]:
+        return batch_by_size(len(texts), self.batch_size)
+
+    def embed_batch(self, texts: list[str]) -> list[array]:
+        self.requests_made += 1
+        matrix = self.model.encode([normalize_text(t) for t in texts], batch_size=self.batch_size,
+                                   convert_to_numpy=True, normalize_embeddings=True)
+        results: list[array] = []
+        for row in matrix:
+            vector = array("f")
+            vector.frombytes(row.astype("<f4").tobytes())
+            if sys.byteorder == "big":
+                vector.byteswap()
+            results.append(vector)
+        return results
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk embedding cache keyed by (model, sha256(normalize_text(text))).
+
+    Vectors are stored as float32 blobs in SQLite. Every hit refreshes the
+    entry's last-used time, and `close()` evicts the least recently used
+    entries beyond `max_entries`.
+    """
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            );
+            CREATE INDEX IF NOT EXISTS embedding_cache_lru ON embedding_cache (last_used);
+        """)
+
+    def get_many(self, model: str, keys: list[str]) -> dict[str, array]:
+        found: dict[str, array] = {}
+        unique = sorted(set(keys))
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT text_hash, vector FROM embedding_cache "
+                f"WHERE model = ? AND text_hash IN ({','.join('?' * len(chunk))})",
+                [model, *chunk],
+            ).fetchall()
+            for key, blob in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                found[key] = vector
+        if found:
+            now = time.time()
+            self.conn.executemany(
+                "UPDATE embedding_cache SET last_used = ? WHERE model = ? AND text_hash = ?",
+                [(now, model, key) for key in found],
+            )
+            self.conn.commit()
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, model: str, items: dict[str, array]) -> None:
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (model, text_hash, dim, vector, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(model, key, len(vec), array("f", vec).tobytes(), now) for key, vec in items.items()],
         )
-        resp.raise_for_status()
-        return resp.json()["data"][0]["embedding"]
-    except Exception as e:
-        log.warning(f"  Embedding generation failed for '{text[:50]}': {e}")
+        self.conn.commit()
+
+    def evict(self) -> int:
+        (count,) = self.conn.execute("SELECT count(*) FROM embedding_cache").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM embedding_cache WHERE rowid IN "
+                "(SELECT rowid FROM embedding_cache ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+            self.conn.commit()
+            self.evicted += excess
+        return max(excess, 0)
+
+    def close(self) -> None:
+        self.evict()
+        self.conn.close()
+
+
+class EmbeddingStream:
+    """Embed texts in the background, yielding (indices, vectors) chunks as they finish.
+
+    Cache hits come first as one chunk. Misses (deduplicated by normalized
+    text) are split into the backend's batches and run on up to
+    `embedder.concurrency` worker threads; finished batches wait in a queue of
+    `depth` entries, so workers stall instead of buffering when the consumer
+    (the DB writer) falls behind. A batch that fails after retries yields
+    None for its texts, so those entities are stored without embeddings.
+    Workers start on construction; always `close()` (iterating to the end
+    does it too).
+    """
+
+    def __init__(self, embedder, texts: list[str], cache: Optional[EmbeddingCache] = None,
+                 depth: Optional[int] = None):
+        self.embedder = embedder
+        self.cache = cache
+        self.total = len(texts)
+        keys = [text_key(t) for t in texts]
+        cached = cache.get_many(embedder.model_key, keys) if cache else {}
+        self.hits = [i for i, key in enumerate(keys) if key in cached]
+        self.hit_vectors = [cached[keys[i]] for i in self.hits]
+        groups: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            if key not in cached:
+                groups.setdefault(key, []).append(i)
+        self.miss_keys = list(groups)
+        self.miss_groups = list(groups.values())
+        self.miss_texts = [texts[group[0]] for group in self.miss_groups]
+        if cache:
+            log.info(f"  Embedding cache: {len(self.hits)} hits, {self.total - len(self.hits)} misses")
+        self.batches = embedder.batches(self.miss_texts) if self.miss_texts else []
+        self.embedded = len(self.hits)
+        self.queue: queue.Queue = queue.Queue(maxsize=depth or 2 * embedder.concurrency)
+        self.stop = threading.Event()
+        self.pool: Optional[ThreadPoolExecutor] = None
+        if self.batches:
+            self.pool = ThreadPoolExecutor(max_workers=embedder.concurrency)
+            for batch in self.batches:
+                self.pool.submit(self._run, batch)
+
+    def _run(self, batch: list[int]) -> None:
+        if self.stop.is_set():
+            return
+        try:
+            vectors: list[Optional[array]] = list(self.embedder.embed_batch([self.miss_texts[i] for i in batch]))
+        except Exception as e:
+            log.warning(f"  Embedding batch of {len(batch)} failed "
+                        f"(first: '{self.miss_texts[batch[0]][:50]}'): {e}")
+            vectors = [None] * len(batch)
+        while not self.stop.is_set():
+            try:
+                self.queue.put((batch, vectors), timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self):
+        try:
+            if self.hits:
+                yield self.hits, self.hit_vectors
+            for _ in self.batches:
+                batch, vectors = self.queue.get()
+                fresh = {self.miss_keys[i]: v for i, v in zip(batch, vectors) if v is not None}
+                if self.cache and fresh:
+                    self.cache.put_many(self.embedder.model_key, fresh)
+                indices: list[int] = []
+                out: list[Optional[array]] = []
+                for i, vector in zip(batch, vectors):
+                    for j in self.miss_groups[i]:
+                        indices.append(j)
+                        out.append(vector)
+                self.embedded += sum(1 for v in out if v is not None)
+                yield indices, out
+            log.info(f"  Embedded {self.embedded}/{self.total} texts in {len(self.batches)} batches "
+                     f"({self.embedder.requests_made} requests)")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self.stop.set()
+        if self.pool:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+            self.pool = None
+
+
+def embed_texts(embedder, texts: list[str],
+                cache: Optional[EmbeddingCache] = None) -> list[Optional[array]]:
+    """Embed texts with any backend, answering from the cache first and only sending misses."""
+    results: list[Optional[array]] = [None] * len(texts)
+    for indices, vectors in EmbeddingStream(embedder, texts, cache):
+        for i, vector in zip(indices, vectors):
+            results[i] = vector
+    return results
+
+
+def make_embedding_client(args):
+    """Build the configured embedding backend, or None if embeddings are unavailable."""
+    provider = args.embedding_provider or os.getenv("EMBEDDING_PROVIDER", "openai")
+    dim = args.embedding_dim or (int(os.getenv("EMBEDDING_DIM")) if os.getenv("EMBEDDING_DIM") else None)
+    if provider == "local-hash":
+        dim = dim or DEFAULT_HASH_EMBEDDING_DIM
+        log.info(f"Embedding backend: local hashed n-grams (dim {dim})")
+        return HashingEmbedder(dim, batch_size=args.embedding_batch_size)
+    if provider == "sentence-transformers":
+        model = os.getenv("EMBEDDING_MODEL") or LOCAL_EMBEDDING_PROVIDERS[provider]
+        try:
+            backend = SentenceTransformerEmbedder(model, dim, batch_size=args.embedding_batch_size)
+        except ImportError:
+            log.error("sentence-transformers is not installed (pip install sentence-transformers), "
+                      "or use --embedding-provider local-hash")
+            sys.exit(1)
+        log.info(f"Embedding backend: sentence-transformers {model} on CPU (dim {backend.dim})")
+        return backend
+    if provider not in EMBEDDING_PROVIDERS:
+        known = ", ".join([*EMBEDDING_PROVIDERS, *LOCAL_EMBEDDING_PROVIDERS])
+        log.error(f"Unknown embedding provider '{provider}' (choose from {known})")
+        sys.exit(1)
+    model = os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
+    default_url, needs_key, base64_vectors = EMBEDDING_PROVIDERS[provider]
+    base_url = args.embedding_base_url or os.getenv("EMBEDDING_BASE_URL") or default_url
+    api_key = os.getenv("EMBEDDING_API_KEY") or os.getenv("OPENAI_API_KEY")
+    if not base_url:
+        log.warning(f"No base URL for embedding provider '{provider}' — entities will be stored without embeddings")
         return None
+    if needs_key and not api_key:
+        log.warning("OPENAI_API_KEY not set — entities will be stored without embeddings "
+                    "(use --embedding-provider local-hash for offline embeddings)")
+        return None
+    log.info(f"Embedding model: {model} via {provider} ({base_url})")
+    return EmbeddingClient(
+        model, base_url, api_key,
+        batch_tokens=args.embedding_batch_tokens,
+        batch_size=args.embedding_batch_size,
+        concurrency=args.embedding_concurrency,
+        retries=args.embedding_retries,
+        base64_vectors=base64_vectors,
+        dimensions=dim,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -134,119 +619,465 @@ def get_db_connection(args):
     )
 
 
-def upsert_entity(cur, uri: str, entity_type: str, name: str, text: str,
-                  metadata: dict, embedding: Optional[list[float]],
-                  has_embeddings_table: bool = False) -> bool:
-    """Upsert a roadmap entity into entity_registry (+ entity_embeddings if available)."""
-    normalized = normalize_text(name)
-    metadata_json = json.dumps(metadata)
+COPY_CHUNK_ROWS = 10_000
 
-    try:
-        if embedding:
-            embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
-            cur.execute("""
-                INSERT INTO entity_registry (
-                    fuseki_uri, entity_text, entity_type, normalized_text,
-                    source, first_seen_rid, metadata, embedding
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb, %s::vector)
-                ON CONFLICT (fuseki_uri) DO UPDATE SET
-                    entity_text = EXCLUDED.entity_text,
-                    entity_type = EXCLUDED.entity_type,
-                    normalized_text = EXCLUDED.normalized_text,
-                    metadata = EXCLUDED.metadata,
-                    embedding = EXCLUDED.embedding
-            """, (uri, name, entity_type, normalized, ROADMAP_SOURCE,
-                  f"roadmap:{metadata.get('roadmap_version', 'unknown')}",
-                  metadata_json, embedding_str))
-        else:
-            cur.execute("""
-                INSERT INTO entity_registry (
-                    fuseki_uri, entity_text, entity_type, normalized_text,
-                    source, first_seen_rid, metadata
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb)
-                ON CONFLICT (fuseki_uri) DO UPDATE SET
-                    entity_text = EXCLUDED.entity_text,
-                    entity_type = EXCLUDED.entity_type,
-                    normalized_text = EXCLUDED.normalized_text,
-                    metadata = EXCLUDED.metadata
-            """, (uri, name, entity_type, normalized, ROADMAP_SOURCE,
-                  f"roadmap:{metadata.get('roadmap_version', 'unknown')}",
-                  metadata_json))
-
-        # Also upsert into entity_embeddings if table exists and embedding was generated
-        if embedding and has_embeddings_table:
-            embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
+
+def copy_value(value: Any) -> str:
+    """Render one value for COPY text format."""
+    if value is None:
+        return r"\N"
+    if isinstance(value, dict):
+        value = json.dumps(value)
+    elif isinstance(value, (list, tuple)):
+        value = "[" + ",".join(repr(float(x)) for x in value) + "]"
+    else:
+        value = str(value)
+    return (value.replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def copy_rows(cur, table: str, columns: list[str], rows) -> int:
+    """Stream rows into a table with COPY FROM STDIN, COPY_CHUNK_ROWS per round-trip."""
+    total = 0
+    buf = io.StringIO()
+    pending = 0
+    for row in rows:
+        buf.write("\t".join(copy_value(v) for v in row) + "\n")
+        pending += 1
+        if pending >= COPY_CHUNK_ROWS:
+            buf.seek(0)
+            cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+            total += pending
+            buf, pending = io.StringIO(), 0
+    if pending:
+        buf.seek(0)
+        cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+        total += pending
+    return total
+
+
+PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0)
+PGCOPY_TRAILER = struct.pack(">h", -1)
+
+
+def binary_text(value: Any) -> bytes:
+    return str(value).encode("utf-8")
+
+
+def binary_jsonb(value: Any) -> bytes:
+    # jsonb binary input is a version byte followed by the JSON text.
+    return b"\x01" + json.dumps(value).encode("utf-8")
+
+
+def binary_vector(value: array) -> bytes:
+    """pgvector binary input: int16 dim, int16 unused, big-endian float32 values."""
+    vector = array("f", value)
+    if sys.byteorder == "little":
+        vector.byteswap()
+    return struct.pack(">hh", len(vector), 0) + vector.tobytes()
+
+
+def copy_binary_rows(cur, table: str, columns: list[str], encoders: list, rows) -> int:
+    """Like copy_rows, but in COPY BINARY format with one encoder per column."""
+    total = 0
+    pending = 0
+    field_count = struct.pack(">h", len(columns))
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT binary)"
+
+    def flush(buf: io.BytesIO) -> None:
+        buf.write(PGCOPY_TRAILER)
+        buf.seek(0)
+        cur.copy_expert(sql, buf)
+
+    buf = io.BytesIO(PGCOPY_HEADER)
+    buf.seek(0, io.SEEK_END)
+    for row in rows:
+        buf.write(field_count)
+        for encode, value in zip(encoders, row):
+            if value is None:
+                buf.write(struct.pack(">i", -1))
+            else:
+                data = encode(value)
+                buf.write(struct.pack(">i", len(data)))
+                buf.write(data)
+        pending += 1
+        if pending >= COPY_CHUNK_ROWS:
+            flush(buf)
+            total += pending
+            buf, pending = io.BytesIO(PGCOPY_HEADER), 0
+            buf.seek(0, io.SEEK_END)
+    if pending:
+        flush(buf)
+        total += pending
+    return total
+
+
+DEFAULT_APPLY_BATCH_SIZE = 500
+
+
+def apply_batches(cur, rows: list, apply, rejected: list[dict], describe,
+                  batch_size: int = DEFAULT_APPLY_BATCH_SIZE) -> int:
+    """Write `rows` in savepoint-wrapped batches, isolating the rows that fail.
+
+    apply(cur, batch) writes one batch and returns its row count. A batch that
+    raises is rolled back to its savepoint and bisected until each failing row
+    is alone; those are appended to `rejected` as describe(row) plus the error,
+    and every other row is written. (Without the savepoint, psycopg2 leaves the
+    transaction aborted after the first error and nothing can be committed.)
+    """
+    applied = 0
+    pending = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)][::-1]
+    while pending:
+        batch = pending.pop()
+        cur.execute("SAVEPOINT koi_apply_batch")
+        try:
+            applied += apply(cur, batch)
+        except Exception as e:
+            cur.execute("ROLLBACK TO SAVEPOINT koi_apply_batch")
+            if len(batch) > 1:
+                mid = len(batch) // 2
+                pending += [batch[mid:], batch[:mid]]
+            else:
+                message = str(e).strip()
+                rejected.append({
+                    **describe(batch[0]),
+                    "error": message.splitlines()[0] if message else type(e).__name__,
+                    "sqlstate": getattr(e, "pgcode", None),
+                })
+        cur.execute("RELEASE SAVEPOINT koi_apply_batch")
+    return applied
+
+
+def create_staging_tables(cur) -> None:
+    """Session-local staging tables, dropped when the ingest transaction ends."""
+    cur.execute("""
+        CREATE TEMP TABLE koi_entity_stage (
+            fuseki_uri text,
+            entity_text text,
+            entity_type text,
+            normalized_text text,
+            first_seen_rid text,
+            metadata jsonb,
+            embedding vector
+        ) ON COMMIT DROP;
+        CREATE TEMP TABLE koi_rel_stage (
+            subject_uri text,
+            predicate text,
+            object_uri text
+        ) ON COMMIT DROP;
+        CREATE TEMP TABLE koi_live_stage (
+            fuseki_uri text PRIMARY KEY
+        ) ON COMMIT DROP;
+    """)
+
+
+def stage_entities(cur, entities: list[dict], embeddings: list[Optional[array]]) -> int:
+    rows = (
+        (e["uri"], e["name"], e["entity_type"], normalize_text(e["name"]),
+         e["first_seen_rid"], e["metadata"], emb)
+        for e, emb in zip(entities, embeddings)
+    )
+    return copy_binary_rows(cur, "koi_entity_stage",
+                            ["fuseki_uri", "entity_text", "entity_type", "normalized_text",
+                             "first_seen_rid", "metadata", "embedding"],
+                            [binary_text] * 5 + [binary_jsonb, binary_vector], rows)
+
+
+def resolve_embedding_store(requested: str, has_embeddings_table: bool) -> str:
+    """Pick the authoritative embedding table; "auto" prefers entity_embeddings."""
+    if requested == "auto":
+        return "entity_embeddings" if has_embeddings_table else "entity_registry"
+    if requested == "entity_embeddings" and not has_embeddings_table:
+        raise ValueError("--embedding-store entity_embeddings, but that table does not exist")
+    return requested
+
+
+def describe_entity(row: tuple[dict, Optional[array]]) -> dict:
+    return {"kind": "entity", "uri": row[0]["uri"]}
+
+
+def describe_relationship(rel: tuple[str, str, str]) -> dict:
+    return {"kind": "relationship", "subject": rel[0], "predicate": rel[1], "object": rel[2]}
+
+
+def merge_entity_batch(cur, rows: list[tuple[dict, Optional[array]]], generation: int,
+                       embedding_store: str = "entity_registry", has_embeddings_table: bool = False,
+                       source: str = ROADMAP_SOURCE, clear_other_store: bool = False) -> int:
+    """Stage and merge one batch of (entity, embedding) rows; the unit apply_batches retries."""
+    cur.execute("DELETE FROM koi_entity_stage")  # TRUNCATE would swap the relfilenode every batch
+    stage_entities(cur, [entity for entity, _ in rows], [embedding for _, embedding in rows])
+    cur.execute("ANALYZE koi_entity_stage")  # small batch: lets the merge joins use the registry's indexes
+    return merge_entities(cur, generation, embedding_store, has_embeddings_table=has_embeddings_table,
+                          source=source, clear_other_store=clear_other_store)
+
+
+def merge_entities(cur, generation: int, embedding_store: str = "entity_registry",
+                   has_embeddings_table: bool = False, source: str = ROADMAP_SOURCE,
+                   clear_other_store: bool = False) -> int:
+    """Merge staged entities into entity_registry set-wise.
+
+    Each vector is written once, to `embedding_store`. The other table's
+    copy is left alone for whatever still reads it, unless
+    `clear_other_store` asks for a re-embedded node's stale copy to go.
+    A node staged without an embedding keeps the one it already has.
+    Merged rows are stamped with the run's `generation`.
+    """
+    in_registry = embedding_store == "entity_registry"
+    cur.execute(f"""
+        INSERT INTO entity_registry (
+            fuseki_uri, entity_text, entity_type, normalized_text,
+            source, first_seen_rid, metadata, embedding, generation
+        )
+        SELECT DISTINCT ON (fuseki_uri)
+            fuseki_uri, entity_text, entity_type, normalized_text,
+            %s, first_seen_rid, metadata,
+            {"embedding" if in_registry else "NULL::vector"}, %s
+        FROM koi_entity_stage
+        ORDER BY fuseki_uri
+        ON CONFLICT (fuseki_uri) DO UPDATE SET
+            entity_text = EXCLUDED.entity_text,
+            entity_type = EXCLUDED.entity_type,
+            normalized_text = EXCLUDED.normalized_text,
+            metadata = EXCLUDED.metadata,
+            embedding = {"COALESCE(EXCLUDED.embedding, entity_registry.embedding)"
+                         if in_registry else "entity_registry.embedding"},
+            generation = EXCLUDED.generation
+    """, (source, generation))
+    merged = cur.rowcount
+
+    if not in_registry:
+        if clear_other_store:
             cur.execute("""
-                INSERT INTO entity_embeddings (entity_uri, embedding)
-                VALUES (%s, %s::vector)
-                ON CONFLICT (entity_uri) DO UPDATE SET
-                    embedding = EXCLUDED.embedding
-            """, (uri, embedding_str))
+                UPDATE entity_registry r SET embedding = NULL
+                FROM koi_entity_stage s
+                WHERE r.fuseki_uri = s.fuseki_uri
+                  AND s.embedding IS NOT NULL AND r.embedding IS NOT NULL
+            """)
+        cur.execute("""
+            INSERT INTO entity_embeddings (entity_uri, embedding)
+            SELECT DISTINCT ON (fuseki_uri) fuseki_uri, embedding
+            FROM koi_entity_stage
+            WHERE embedding IS NOT NULL
+            ORDER BY fuseki_uri
+            ON CONFLICT (entity_uri) DO UPDATE SET
+                embedding = EXCLUDED.embedding
+        """)
+    elif has_embeddings_table and clear_other_store:
+        cur.execute("""
+            DELETE FROM entity_embeddings e
+            USING koi_entity_stage s
+            WHERE e.entity_uri = s.fuseki_uri AND s.embedding IS NOT NULL
+        """)
+    return merged
 
-        return True
-    except Exception as e:
-        log.error(f"  Failed to upsert {uri}: {e}")
-        return False
 
+def stage_relationships(cur, rels: list[tuple[str, str, str]]) -> int:
+    return copy_rows(cur, "koi_rel_stage", ["subject_uri", "predicate", "object_uri"], rels)
 
-def create_relationship(cur, subject_uri: str, predicate: str, object_uri: str) -> bool:
-    """Create a relationship in entity_relationships."""
-    if subject_uri == object_uri:
-        log.warning(f"  Skipping self-referential: {subject_uri} --{predicate}--> {object_uri}")
-        return False
 
-    try:
-        cur.execute("""
-            INSERT INTO entity_relationships (subject_uri, predicate, object_uri, source)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (subject_uri, predicate, object_uri) DO NOTHING
-        """, (subject_uri, predicate, object_uri, ROADMAP_SOURCE))
-        return True
-    except Exception as e:
-        log.warning(f"  Failed to create rel {subject_uri} --{predicate}--> {object_uri}: {e}")
-        return False
+def insert_relationships(cur, rels: list[tuple[str, str, str]], source: str = ROADMAP_SOURCE) -> int:
+    cur.execute("""
+        INSERT INTO entity_relationships (subject_uri, predicate, object_uri, source)
+        SELECT s, p, o, %s FROM unnest(%s::text[], %s::text[], %s::text[]) AS t(s, p, o)
+        ON CONFLICT (subject_uri, predicate, object_uri) DO NOTHING
+    """, (source, [r[0] for r in rels], [r[1] for r in rels], [r[2] for r in rels]))
+    return cur.rowcount
+
+
+def sync_relationships(cur, source: str = ROADMAP_SOURCE,
+                       rejected: Optional[list[dict]] = None) -> tuple[int, int]:
+    """Bring `source`'s edges in line with the staged set; returns (created, removed).
+
+    Anti-joins against the staging table touch only edges that vanished or
+    appeared, so unchanged edges are never rewritten and concurrent readers
+    never see the graph without its edges. With a `rejected` list, new edges
+    are inserted through apply_batches and the ones that fail are recorded
+    there instead of aborting the transaction.
+    """
+    cur.execute("ANALYZE koi_rel_stage")
+    cur.execute("""
+        DELETE FROM entity_relationships r
+        WHERE r.source = %s
+          AND NOT EXISTS (
+              SELECT 1 FROM koi_rel_stage s
+              WHERE s.subject_uri = r.subject_uri
+                AND s.predicate = r.predicate
+                AND s.object_uri = r.object_uri
+          )
+    """, (source,))
+    removed = cur.rowcount
+    new_edges_sql = """
+        SELECT DISTINCT s.subject_uri, s.predicate, s.object_uri
+        FROM koi_rel_stage s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM entity_relationships r
+            WHERE r.subject_uri = s.subject_uri
+              AND r.predicate = s.predicate
+              AND r.object_uri = s.object_uri
+        )
+    """
+    if rejected is not None:
+        cur.execute(new_edges_sql + " ORDER BY 1, 2, 3")
+        created = apply_batches(cur, cur.fetchall(),
+                                lambda c, batch: insert_relationships(c, batch, source),
+                                rejected, describe_relationship)
+        return created, removed
+    cur.execute(f"""
+        INSERT INTO entity_relationships (subject_uri, predicate, object_uri, source)
+        SELECT subject_uri, predicate, object_uri, %s FROM ({new_edges_sql}) new_edges
+        ON CONFLICT (subject_uri, predicate, object_uri) DO NOTHING
+    """, (source,))
+    return cur.rowcount, removed
+
+
+def stage_live_entities(cur, uris: list[str]) -> int:
+    """Stage the URIs of every live entity, merged this run or not, for the sweep.
+
+    Unchanged rows are not stamped: an UPDATE of the indexed generation
+    column rewrites the row and its index entries (no HOT update), which on
+    a stable corpus would be nearly every row, every run.
+    """
+    staged = copy_rows(cur, "koi_live_stage", ["fuseki_uri"], ((uri,) for uri in sorted(set(uris))))
+    cur.execute("ANALYZE koi_live_stage")
+    return staged
+
+
+def sweep_stale_entities(cur, generation: int, has_embeddings_table: bool = False,
+                         source: str = ROADMAP_SOURCE) -> dict[str, int]:
+    """Delete stale `source` entities, with their embeddings and edges.
+
+    A row is stale if this run did not merge it (older generation) and it is
+    not in koi_live_stage. Unchanged rows keep their old generation, so on a
+    stable corpus that filter matches nearly the whole source and the
+    anti-join against the staged live set does the real work: the sweep
+    costs O(live entities of `source`) per run, not O(stale). That is
+    chosen over stamping every live row with the current generation, which
+    would let a `generation <> current` sweep touch only stale rows but
+    rewrite every row and its index entries each run; staging is a COPY
+    into a temp table. Callers that merge every live row can leave
+    koi_live_stage empty. Returns counts per table.
+    """
+    embeddings_cte = """
+        , swept_embeddings AS (
+            DELETE FROM entity_embeddings e
+            USING swept s
+            WHERE e.entity_uri = s.fuseki_uri
+            RETURNING 1
+        )""" if has_embeddings_table else ""
+    cur.execute(f"""
+        WITH swept AS (
+            DELETE FROM entity_registry
+            WHERE source = %(source)s
+              -- not merged this run; unchanged live rows still match and are
+              -- kept by the anti-join below
+              AND (generation < %(generation)s OR generation IS NULL)
+              AND NOT EXISTS (
+                  SELECT 1 FROM koi_live_stage l WHERE l.fuseki_uri = entity_registry.fuseki_uri
+              )
+            RETURNING fuseki_uri
+        ), swept_relationships AS (
+            DELETE FROM entity_relationships r
+            WHERE r.source = %(source)s
+              AND (r.subject_uri IN (SELECT fuseki_uri FROM swept)
+                   OR r.object_uri IN (SELECT fuseki_uri FROM swept))
+            RETURNING 1
+        ){embeddings_cte}
+        SELECT
+            (SELECT count(*) FROM swept),
+            {"(SELECT count(*) FROM swept_embeddings)" if has_embeddings_table else "0"},
+            (SELECT count(*) FROM swept_relationships)
+    """, {"source": source, "generation": generation})
+    entities, embeddings, relationships = cur.fetchone()
+    return {"entities": entities, "embeddings": embeddings, "relationships": relationships}
+
+
+def node_fingerprint(entity: dict, model_key: Optional[str], embedding_store: str) -> str:
+    """Fingerprint of what an entity row is built from: text, metadata, embedding model/table."""
+    return content_hash({
+        "type": entity["entity_type"],
+        "name": entity["name"],
+        "text": entity["text"],
+        "metadata": entity["metadata"],
+        "model": model_key,
+        "store": embedding_store,
+        "format": INGEST_FINGERPRINT_VERSION,
+    })
+
+
+def ensure_generation_column(cur) -> None:
+    """Add entity_registry.generation and its (source, generation) index once.
+
+    Checked via the catalog first, so routine runs take no DDL lock on the
+    shared registry table.
+    """
+    cur.execute("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'entity_registry' AND column_name = 'generation'
+          AND table_schema = ANY(current_schemas(false))
+    """)
+    if cur.fetchone():
+        return
+    log.info("Adding entity_registry.generation for mark/sweep (one-time)")
+    cur.execute("ALTER TABLE entity_registry ADD COLUMN IF NOT EXISTS generation bigint")
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS entity_registry_source_generation_idx
+        ON entity_registry (source, generation)
+    """)
 
 
-def sweep_stale_entities(cur, upserted_uris: set[str],
-                        has_embeddings_table: bool = False) -> int:
-    """Delete roadmap entities not in the current upsert set."""
-    # Find all existing roadmap URIs
+def ensure_ingest_schema(cur) -> None:
+    """Per-source ingest state (graph hash, generation counter) and the generation column."""
     cur.execute("""
-        SELECT fuseki_uri FROM entity_registry
-        WHERE fuseki_uri LIKE %s
-    """, (f"{ROADMAP_URI_PREFIX}%",))
-    existing_uris = {row[0] for row in cur.fetchall()}
+        CREATE TABLE IF NOT EXISTS roadmap_ingest_state (
+            source text PRIMARY KEY,
+            graph_hash text NOT NULL,
+            updated_at timestamptz NOT NULL DEFAULT now()
+        );
+        ALTER TABLE roadmap_ingest_state ADD COLUMN IF NOT EXISTS generation bigint NOT NULL DEFAULT 0;
+    """)
+    ensure_generation_column(cur)
 
-    stale = existing_uris - upserted_uris
-    if not stale:
-        log.info("  No stale entities found")
-        return 0
 
-    log.info(f"  Found {len(stale)} stale roadmap entities to remove")
-    stale_list = list(stale)
+def load_graph_hash(cur, source: str = ROADMAP_SOURCE) -> Optional[str]:
+    cur.execute("SELECT graph_hash FROM roadmap_ingest_state WHERE source = %s", (source,))
+    row = cur.fetchone()
+    return row[0] if row else None
 
-    for uri in stale_list:
-        log.info(f"    Removing: {uri}")
 
-    # Delete from entity_embeddings first (only if table exists)
-    if has_embeddings_table:
-        cur.execute("""
-            DELETE FROM entity_embeddings WHERE entity_uri = ANY(%s)
-        """, (stale_list,))
+def load_fingerprints(cur, source: str, *keys: str) -> dict[str, tuple[Optional[str], ...]]:
+    """Per-entity fingerprint values stored under `keys` in metadata, by URI."""
+    columns = ", ".join(f"metadata->>'{key}'" for key in keys)
+    cur.execute(f"SELECT fuseki_uri, {columns} FROM entity_registry WHERE source = %s", (source,))
+    return {row[0]: row[1:] for row in cur.fetchall()}
 
-    # Delete relationships where both sides are roadmap URIs
-    cur.execute("""
-        DELETE FROM entity_relationships
-        WHERE source = %s
-          AND (subject_uri = ANY(%s) OR object_uri = ANY(%s))
-    """, (ROADMAP_SOURCE, stale_list, stale_list))
 
-    # Delete the entities
+def load_ingest_state(cur) -> tuple[Optional[str], dict[str, str]]:
+    """Last ingested graph hash and the per-entity fingerprints stored in metadata."""
+    ensure_ingest_schema(cur)
+    graph_hash = load_graph_hash(cur)
+    stored = load_fingerprints(cur, ROADMAP_SOURCE, "roadmap_fingerprint")
+    return graph_hash, {uri: fp for uri, (fp,) in stored.items() if fp}
+
+
+def next_generation(cur, source: str = ROADMAP_SOURCE) -> int:
+    """Allocate this run's generation; the row lock also serializes concurrent ingests."""
     cur.execute("""
-        DELETE FROM entity_registry WHERE fuseki_uri = ANY(%s)
-    """, (stale_list,))
+        INSERT INTO roadmap_ingest_state (source, graph_hash, generation)
+        VALUES (%s, '', 1)
+        ON CONFLICT (source) DO UPDATE SET generation = roadmap_ingest_state.generation + 1
+        RETURNING generation
+    """, (source,))
+    return cur.fetchone()[0]
+
 
-    return len(stale)
+def save_graph_hash(cur, graph_hash: str, source: str = ROADMAP_SOURCE) -> None:
+    cur.execute("""
+        INSERT INTO roadmap_ingest_state (source, graph_hash, updated_at)
+        VALUES (%s, %s, now())
+        ON CONFLICT (source) DO UPDATE SET
+            graph_hash = EXCLUDED.graph_hash,
+            updated_at = EXCLUDED.updated_at
+    """, (source, graph_hash))
 
 
 def check_entity_embeddings_table(cur) -> bool:
@@ -279,13 +1110,6 @@ def ingest_roadmap(args, roadmap_path: str, dry_run: bool = True) -> dict:
 
     log.info(f"Roadmap v{version} — {len(nodes)} nodes, {len(edges)} edges (hash: {data_hash[:12]})")
 
-    embedding_model = os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002")
-    has_openai = bool(os.getenv("OPENAI_API_KEY"))
-    if has_openai:
-        log.info(f"Embedding model: {embedding_model}")
-    else:
-        log.warning("OPENAI_API_KEY not set — entities will be stored without embeddings")
-
     if dry_run:
         log.info("=== DRY RUN — no DB changes ===")
         stats = {"entities_upserted": 0, "entities_failed": 0,
@@ -303,6 +1127,41 @@ def ingest_roadmap(args, roadmap_path: str, dry_run: bool = True) -> dict:
         log.info(f"  Would upsert {stats['entities_upserted']} entities, {stats['rels_created']} relationships")
         return stats
 
+    # --- Build entities ---
+    entities = []
+    for node in nodes:
+        entity_type = KIND_TO_TYPE.get(node["kind"])
+        if not entity_type:
+            log.warning(f"  Unknown kind '{node['kind']}' for node {node['id']}, skipping")
+            continue
+
+        name = node["title"]
+        summary = node.get("summary", "")
+        metadata: dict[str, Any] = {
+            "roadmap_node_id": node["id"],
+            "roadmap_kind": node["kind"],
+            "roadmap_status": node.get("status"),
+            "roadmap_priority": node.get("priority"),
+            "roadmap_horizon": node.get("horizon"),
+            "roadmap_owner": node.get("owner"),
+            "roadmap_version": version,
+        }
+        if node.get("due_date"):
+            metadata["due_date"] = node["due_date"]
+        if node.get("tags"):
+            metadata["roadmap_tags"] = node["tags"]
+        entities.append({
+            "uri": uri_for_node(node["id"]),
+            "entity_type": entity_type,
+            "name": name,
+            "first_seen_rid": f"roadmap:{version}",
+            "text": f"{name} — {summary}" if summary else name,
+            "metadata": metadata,
+        })
+
+    embedder = make_embedding_client(args)
+    model_key = embedder.model_key if embedder else None
+
     # Connect to DB
     import psycopg2
     conn = get_db_connection(args)
@@ -314,79 +1173,122 @@ def ingest_roadmap(args, roadmap_path: str, dry_run: bool = True) -> dict:
     conn.rollback()  # reset any error state from check
     if not has_embeddings_table:
         log.warning("entity_embeddings table not found — embeddings will be stored in entity_registry only")
-
-    upserted_uris: set[str] = set()
-    stats = {"entities_upserted": 0, "entities_failed": 0,
-             "rels_created": 0, "rels_failed": 0, "stale_removed": 0}
-
     try:
-        # --- Upsert entities ---
-        log.info("--- Upserting entities ---")
-        for node in nodes:
-            entity_type = KIND_TO_TYPE.get(node["kind"])
-            if not entity_type:
-                log.warning(f"  Unknown kind '{node['kind']}' for node {node['id']}, skipping")
-                continue
-
-            uri = uri_for_node(node["id"])
-            name = node["title"]
-            summary = node.get("summary", "")
-            text = f"{name} — {summary}" if summary else name
-
-            metadata: dict[str, Any] = {
-                "roadmap_node_id": node["id"],
-                "roadmap_kind": node["kind"],
-                "roadmap_status": node.get("status"),
-                "roadmap_priority": node.get("priority"),
-                "roadmap_horizon": node.get("horizon"),
-                "roadmap_owner": node.get("owner"),
-                "roadmap_version": version,
-            }
-            if node.get("due_date"):
-                metadata["due_date"] = node["due_date"]
-            if node.get("tags"):
-                metadata["roadmap_tags"] = node["tags"]
-
-            # Generate embedding
-            embedding = generate_embedding(text, embedding_model) if has_openai else None
-
-            ok = upsert_entity(cur, uri, entity_type, name, text, metadata, embedding,
-                              has_embeddings_table=has_embeddings_table)
-            if ok:
-                stats["entities_upserted"] += 1
-                upserted_uris.add(uri)
-            else:
-                stats["entities_failed"] += 1
-
-        # --- Delete old roadmap relationships before re-creating ---
-        log.info("--- Clearing old roadmap relationships ---")
-        cur.execute("""
-            DELETE FROM entity_relationships WHERE source = %s
-        """, (ROADMAP_SOURCE,))
-        deleted_rels = cur.rowcount
-        log.info(f"  Cleared {deleted_rels} old roadmap relationships")
-
-        # --- Create relationships ---
-        log.info("--- Creating relationships ---")
-        for edge in edges:
-            predicate = EDGE_TO_PREDICATE.get(edge["type"])
-            if not predicate:
-                log.warning(f"  Unknown edge type '{edge['type']}', skipping")
-                continue
-
-            subject_uri = uri_for_node(edge["from"])
-            object_uri = uri_for_node(edge["to"])
+        embedding_store = resolve_embedding_store(args.embedding_store, has_embeddings_table)
+    except ValueError as e:
+        log.error(str(e))
+        sys.exit(1)
+    log.info(f"Authoritative embedding table: {embedding_store}")
+    graph_hash = content_hash({"roadmap": data_hash, "model": model_key, "store": embedding_store,
+                               "format": INGEST_FINGERPRINT_VERSION})
+
+    stats = {"entities_total": len(entities), "entities_upserted": 0, "entities_unchanged": 0, "entities_failed": 0,
+             "rels_created": 0, "rels_removed": 0, "rels_failed": 0, "stale_removed": 0,
+             "stale_embeddings_removed": 0, "stale_rels_removed": 0, "entities_live": 0, "embeddings_failed": 0,
+             "embedding_cache_hits": 0, "embedding_cache_misses": 0,
+             "embedding_cache_evicted": 0, "embedding_requests": 0, "graph_unchanged": False}
+
+    # --- Change detection (read-only; ends before any embedding call) ---
+    stored_hash, stored_fingerprints = load_ingest_state(cur)
+    conn.commit()
+    if stored_hash == graph_hash and not args.force:
+        log.info(f"Roadmap graph unchanged since last ingest (hash: {graph_hash[:12]}) — nothing to do")
+        cur.close()
+        conn.close()
+        stats["graph_unchanged"] = True
+        stats["entities_unchanged"] = len(entities)
+        return stats
 
-            ok = create_relationship(cur, subject_uri, predicate, object_uri)
-            if ok:
-                stats["rels_created"] += 1
-            else:
-                stats["rels_failed"] += 1
+    for entity in entities:
+        entity["fingerprint"] = node_fingerprint(entity, model_key, embedding_store)
+    changed = [e for e in entities
+               if args.force or stored_fingerprints.get(e["uri"]) != e["fingerprint"]]
+    stats["entities_unchanged"] = len(entities) - len(changed)
+    log.info(f"  {len(changed)} of {len(entities)} entities changed since last ingest")
+
+    # --- Desired relationships ---
+    rels: list[tuple[str, str, str]] = []
+    for edge in edges:
+        predicate = EDGE_TO_PREDICATE.get(edge["type"])
+        if not predicate:
+            log.warning(f"  Unknown edge type '{edge['type']}', skipping")
+            continue
+        subject_uri = uri_for_node(edge["from"])
+        object_uri = uri_for_node(edge["to"])
+        if subject_uri == object_uri:
+            log.warning(f"  Skipping self-referential: {subject_uri} --{predicate}--> {object_uri}")
+            stats["rels_failed"] += 1
+            continue
+        rels.append((subject_uri, predicate, object_uri))
+
+    cache = None
+    if embedder and changed and embedder.cacheable and not args.no_embedding_cache:
+        cache = EmbeddingCache(Path(args.embedding_cache), max_entries=args.embedding_cache_max)
+
+    rejected: list[dict] = []
+    try:
+        # --- Embed and upsert entities (each embedding chunk is merged as it finishes) ---
+        log.info("--- Embedding and upserting entities ---")
+        started = time.monotonic()
+        create_staging_tables(cur)
+        generation = next_generation(cur)
+        stream = EmbeddingStream(embedder, [e["text"] for e in changed], cache) if embedder and changed else None
+        try:
+            stage_relationships(cur, rels)  # overlaps with the first embedding requests
+            chunks = stream if stream else [(list(range(len(changed))), [None] * len(changed))]
+            for indices, embeddings in chunks:
+                batch = [changed[i] for i in indices]
+                for entity, embedding in zip(batch, embeddings):
+                    # A node whose embedding failed is recorded as unembedded, so it is retried.
+                    fingerprint = entity["fingerprint"] if embedding is not None or not embedder \
+                        else node_fingerprint(entity, None, embedding_store)
+                    if embedder and embedding is None:
+                        stats["embeddings_failed"] += 1
+                    entity["metadata"] = {**entity["metadata"], "roadmap_fingerprint": fingerprint}
+                # Savepoint per batch: a malformed row is rejected on its own instead of
+                # aborting the transaction.
+                stats["entities_upserted"] += apply_batches(
+                    cur, list(zip(batch, embeddings)),
+                    lambda c, rows: merge_entity_batch(c, rows, generation, embedding_store,
+                                                       has_embeddings_table=has_embeddings_table,
+                                                       clear_other_store=args.clear_other_embedding_store),
+                    rejected, describe_entity, batch_size=args.apply_batch_size)
+        finally:
+            if stream:
+                stream.close()
+            if cache:
+                cache.close()
+        if cache:
+            stats.update(embedding_cache_hits=cache.hits, embedding_cache_misses=cache.misses,
+                         embedding_cache_evicted=cache.evicted)
+        if embedder:
+            stats["embedding_requests"] = embedder.requests_made
+        stats["entities_failed"] = len(rejected)
+        log.info(f"  Merged {stats['entities_upserted']} entities, {stats['entities_unchanged']} unchanged, "
+                 f"{stats['entities_failed']} rejected in {time.monotonic() - started:.1f}s")
+
+        # --- Sync relationships (delta against the staged edge set) ---
+        log.info("--- Syncing relationships ---")
+        stats["rels_created"], stats["rels_removed"] = sync_relationships(cur, rejected=rejected)
+        rels_rejected = len(rejected) - stats["entities_failed"]
+        stats["rels_failed"] += rels_rejected
+        log.info(f"  {stats['rels_created']} new, {stats['rels_removed']} removed, {rels_rejected} rejected, "
+                 f"{len(set(rels)) - stats['rels_created'] - rels_rejected} unchanged")
 
         # --- Mark/sweep cleanup ---
-        log.info("--- Mark/sweep cleanup ---")
-        stats["stale_removed"] = sweep_stale_entities(cur, upserted_uris,
-                                                       has_embeddings_table=has_embeddings_table)
+        log.info(f"--- Mark/sweep cleanup (generation {generation}) ---")
+        stats["entities_live"] = stage_live_entities(cur, [e["uri"] for e in entities])
+        swept = sweep_stale_entities(cur, generation, has_embeddings_table=has_embeddings_table)
+        stats["stale_removed"] = swept["entities"]
+        stats["stale_embeddings_removed"] = swept["embeddings"]
+        stats["stale_rels_removed"] = swept["relationships"]
+        log.info(f"  {stats['entities_live']} live entities; removed {swept['entities']} "
+                 f"stale entities, {swept['embeddings']} embeddings, {swept['relationships']} relationships")
+        # Rejected rows keep their previous version (staged as live above) and nodes whose
+        # embedding failed were stored unembedded; leaving the graph hash unsaved makes
+        # the next run retry them instead of exiting early.
+        if not rejected and not stats["embeddings_failed"]:
+            save_graph_hash(cur, graph_hash)
 
         # Commit
         conn.commit()
@@ -402,49 +1304,64 @@ def ingest_roadmap(args, roadmap_path: str, dry_run: bool = True) -> dict:
 
     # Summary
     log.info("--- Summary ---")
-    log.info(f"  Entities: {stats['entities_upserted']} upserted, {stats['entities_failed']} failed")
-    log.info(f"  Relationships: {stats['rels_created']} created, {stats['rels_failed']} failed")
-    log.info(f"  Stale entities removed: {stats['stale_removed']}")
+    log.info(f"  Entities: {stats['entities_upserted']} upserted, {stats['entities_unchanged']} unchanged, "
+             f"{stats['entities_failed']} failed, {stats['embeddings_failed']} without embedding (retried next run)")
+    log.info(f"  Relationships: {stats['rels_created']} created, {stats['rels_removed']} removed, "
+             f"{stats['rels_failed']} failed")
+    log.info(f"  Stale entities removed: {stats['stale_removed']} "
+             f"({stats['stale_embeddings_removed']} embeddings, {stats['stale_rels_removed']} relationships)")
+    if cache:
+        log.info(f"  Embedding cache: {stats['embedding_cache_hits']} hits, "
+                 f"{stats['embedding_cache_misses']} misses, {stats['embedding_cache_evicted']} evicted "
+                 f"({stats['embedding_requests']} embedding requests)")
+    stats["rejected"] = rejected
+    if rejected:
+        report_rejected_rows(rejected, getattr(args, "reject_report", None))
 
     return stats
 
 
+def report_rejected_rows(rejected: list[dict], path: Optional[str] = None) -> None:
+    """Log each rejected row and, with a path, write them all as JSON lines."""
+    log.warning(f"--- {len(rejected)} rows rejected (the rest were committed) ---")
+    for row in rejected:
+        key = row.get("uri") or f"{row['subject']} --{row['predicate']}--> {row['object']}"
+        log.warning(f"  [{row['kind']}] {key}: {row['error']}"
+                    + (f" (SQLSTATE {row['sqlstate']})" if row.get("sqlstate") else ""))
+    if path:
+        with open(path, "w") as f:
+            for row in rejected:
+                f.write(json.dumps(row) + "\n")
+        log.warning(f"  Rejected rows written to {path}")
+
+
 # ---------------------------------------------------------------------------
 # Smoke checks (use KOI API)
 # ---------------------------------------------------------------------------
 
 def run_smoke_checks(api_base: str, expected_count: int, args=None):
-    """Post-ingest verification via KOI API + direct DB checks."""
-    import requests
-    log.info("--- Smoke checks ---")
+    """Post-ingest verification via KOI API + direct DB checks.
 
-    # 1. Entity search (entity_type is a valid param on /entity-search)
-    try:
-        result = requests.get(
-            f"{api_base}/entity-search",
-            params={"query": "bioregional swarm", "entity_type": "Outcome"},
-            timeout=15,
-        ).json()
-        count = len(result.get("results", []))
-        status = "PASS" if count >= 1 else "WARN"
-        log.info(f"  [{status}] Entity search 'bioregional swarm' (Outcome): {count} results")
-    except Exception as e:
-        log.warning(f"  [FAIL] Entity search: {e}")
-
-    # 2. Chat retrieval (uses /chat endpoint)
-    try:
-        result = requests.post(
-            f"{api_base}/chat",
-            json={"query": "What are the BKC outcomes?"},
-            timeout=30,
-        ).json()
-        sources = result.get("sources", [])
-        roadmap_sources = [s for s in sources
-                          if str(s.get("uri", s.get("fuseki_uri", ""))).startswith("roadmap:")]
-        status = "PASS" if len(roadmap_sources) >= 1 else "WARN"
-        log.info(f"  [{status}] Chat retrieval: {len(roadmap_sources)} roadmap sources in answer")
-    except Exception as e:
-        log.warning(f"  [FAIL] Chat retrieval: {e}")
+    One pass over the smoke queries; for latency/throughput under load run
+    koi_load_test.py against the same API.
+    """
+    import koi_load_test
+    log.info("--- Smoke checks ---")
+    client = koi_load_test.KoiClient(api_base)
+
+    # 1. Entity search (entity_type is a valid param on /entity-search), 2. chat retrieval (/chat)
+    for query in koi_load_test.SMOKE_QUERIES:
+        sample = client.call(query)
+        if sample.error:
+            log.warning(f"  [FAIL] {query.endpoint} '{query.query}': {sample.error}")
+        elif query.endpoint == "chat":
+            status = "PASS" if sample.roadmap_hits >= 1 else "WARN"
+            log.info(f"  [{status}] Chat retrieval: {sample.roadmap_hits} roadmap sources in answer "
+                     f"({sample.latency * 1000:.0f} ms)")
+        else:
+            status = "PASS" if sample.results >= 1 else "WARN"
+            log.info(f"  [{status}] Entity search '{query.query}' ({query.entity_type}): {sample.results} results "
+                     f"({sample.latency * 1000:.0f} ms)")
 
     # 3. Embedding count (direct DB query)
     if args:
@@ -461,10 +1378,11 @@ def run_smoke_checks(api_base: str, expected_count: int, args=None):
             status = "PASS" if entity_count == expected_count else "WARN"
             log.info(f"  [{status}] Entity count in registry: {entity_count} (expected {expected_count})")
 
-            # Count embeddings in entity_embeddings (if table exists)
+            # Count embeddings in the authoritative table
             has_ee = check_entity_embeddings_table(cur)
             conn.rollback()  # reset any error state
-            if has_ee:
+            store = resolve_embedding_store(getattr(args, "embedding_store", "entity_registry"), has_ee)
+            if store == "entity_embeddings":
                 cur.execute("""
                     SELECT count(*) FROM entity_embeddings
                     WHERE entity_uri LIKE %s
@@ -473,7 +1391,8 @@ def run_smoke_checks(api_base: str, expected_count: int, args=None):
                 status = "PASS" if embed_count == expected_count else "WARN"
                 log.info(f"  [{status}] Embedding count in entity_embeddings: {embed_count} (expected {expected_count})")
             else:
-                log.info("  [SKIP] entity_embeddings table not found — checking registry embeddings")
+                if not has_ee:
+                    log.info("  [SKIP] entity_embeddings table not found — checking registry embeddings")
                 cur.execute("""
                     SELECT count(*) FROM entity_registry
                     WHERE fuseki_uri LIKE %s AND embedding IS NOT NULL
@@ -494,6 +1413,38 @@ def run_smoke_checks(api_base: str, expected_count: int, args=None):
 # CLI
 # ---------------------------------------------------------------------------
 
+def add_embedding_arguments(parser: argparse.ArgumentParser) -> None:
+    """Embedding backend/cache/store flags, shared with the other KOI ingest scripts."""
+    parser.add_argument("--embedding-provider", default=None,
+                        choices=sorted([*EMBEDDING_PROVIDERS, *LOCAL_EMBEDDING_PROVIDERS]),
+                        help="Embedding provider (default: env EMBEDDING_PROVIDER or openai)")
+    parser.add_argument("--embedding-dim", type=int, default=None,
+                        help="Vector dimension (default: env EMBEDDING_DIM or the model's; "
+                             f"{DEFAULT_HASH_EMBEDDING_DIM} for local-hash)")
+    parser.add_argument("--embedding-base-url", default=None,
+                        help="Embeddings API base URL (default: env EMBEDDING_BASE_URL or the provider's)")
+    parser.add_argument("--embedding-batch-tokens", type=int, default=DEFAULT_EMBEDDING_BATCH_TOKENS,
+                        help="Estimated token budget per embedding request")
+    parser.add_argument("--embedding-batch-size", type=int, default=DEFAULT_EMBEDDING_BATCH_SIZE,
+                        help="Max texts per embedding request")
+    parser.add_argument("--embedding-concurrency", type=int, default=DEFAULT_EMBEDDING_CONCURRENCY,
+                        help="Embedding requests in flight at once")
+    parser.add_argument("--embedding-cache", default=str(DEFAULT_EMBEDDING_CACHE),
+                        help="SQLite embedding cache keyed by model + normalized text hash")
+    parser.add_argument("--embedding-cache-max", type=int, default=DEFAULT_EMBEDDING_CACHE_MAX,
+                        help="Max cached embeddings; least recently used are evicted beyond this")
+    parser.add_argument("--no-embedding-cache", action="store_true", help="Embed every text, ignoring the cache")
+    parser.add_argument("--embedding-retries", type=int, default=DEFAULT_EMBEDDING_RETRIES,
+                        help="Retries per embedding request on 429/5xx/connection errors")
+    parser.add_argument("--embedding-store", default=os.getenv("EMBEDDING_STORE", "entity_registry"),
+                        choices=["auto", *EMBEDDING_STORES],
+                        help="Table that holds each embedding (default: env EMBEDDING_STORE or entity_registry; "
+                             "auto = entity_embeddings if it exists, else entity_registry)")
+    parser.add_argument("--clear-other-embedding-store", action="store_true",
+                        help="Also clear a re-embedded entity's vector from the table that is not "
+                             "--embedding-store (default: leave that copy for its readers)")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Ingest semantic roadmap into KOI knowledge graph")
     parser.add_argument("--db", required=True, help="PostgreSQL database name (e.g. octo_koi)")
@@ -505,7 +1456,14 @@ def main():
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without applying")
     parser.add_argument("--apply", action="store_true", help="Apply changes")
     parser.add_argument("--smoke", action="store_true", help="Run smoke checks after ingest")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-embed and upsert every node even if the graph/node fingerprints are unchanged")
     parser.add_argument("--api", default=None, help="KOI API base URL for smoke checks (e.g. http://localhost:8351)")
+    parser.add_argument("--apply-batch-size", type=int, default=DEFAULT_APPLY_BATCH_SIZE,
+                        help="Rows written per savepoint; a failing batch is bisected to isolate bad rows")
+    parser.add_argument("--reject-report", default=None,
+                        help="Write rows rejected by the DB here as JSON lines (they are always logged)")
+    add_embedding_arguments(parser)
 
     args = parser.parse_args()
 
@@ -539,7 +1497,10 @@ def main():
         if not api_base:
             log.warning("--smoke requires --api <url>. Skipping smoke checks.")
         else:
-            run_smoke_checks(api_base, stats["entities_upserted"], args=args)
+            run_smoke_checks(api_base, stats["entities_total"], args=args)
+
+    if stats.get("rejected"):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
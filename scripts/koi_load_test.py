@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""Load and latency harness for the KOI API retrieval endpoints.
+
+Replays a query set against /entity-search and /chat with a fixed number of
+concurrent workers, for a duration or a request budget, and reports per
+endpoint throughput, p50/p95/p99 latency, error rates and the share of
+responses citing roadmap: sources. Thresholds (and an optional baseline
+report from an earlier run) turn the report into a pass/fail gate, so a run
+after each ingest shows whether retrieval got slower before partners do.
+
+The query set defaults to the smoke queries plus one entity search and one
+chat question per roadmap node; --queries replays a JSONL/JSON file of
+{"endpoint": "entity-search" | "chat", "query": ..., "entity_type": ...}.
+
+`stub` serves an in-memory KOI API over the roadmap (keyword-scored, with
+injectable latency and errors), so the harness itself can be exercised
+without a KOI node; `run --stub` starts one in-process.
+
+Usage:
+    # 60s at 8 workers against a live node, failing on slow or broken retrieval
+    python koi_load_test.py run --api http://localhost:8351 --concurrency 8 --duration 60 \\
+        --threshold "chat.p95<=4000" --threshold "all.error_rate<=0.01" \\
+        --threshold "chat.roadmap_rate>=0.5"
+
+    # Save a baseline before an ingest, compare after it
+    python koi_load_test.py run --api http://localhost:8351 --duration 60 --report before.json
+    python koi_load_test.py run --api http://localhost:8351 --duration 60 --baseline before.json
+
+    # Exercise the harness against a local stub
+    python koi_load_test.py run --stub --stub-latency-ms 20 --requests 2000 --concurrency 16
+    python koi_load_test.py stub --port 8351
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import operator
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import ingest_roadmap_to_koi as koi  # noqa: E402
+from sync_roadmap_to_github_project import percentile  # noqa: E402
+
+
+ENDPOINTS = ("entity-search", "chat")
+ROADMAP_PATH = Path(__file__).resolve().parents[1] / "docs" / "roadmap" / "semantic-roadmap.json"
+DEFAULT_TIMEOUTS = {"entity-search": 15.0, "chat": 30.0}
+METRICS = ("requests", "rps", "error_rate", "p50", "p95", "p99", "max", "roadmap_rate")
+PERCENTILES = (50, 95, 99)
+# Computed over successful requests only, so meaningless when none succeeded.
+SUCCESS_METRICS = ("p50", "p95", "p99", "max", "roadmap_rate")
+
+
+@dataclass(frozen=True)
+class Query:
+    endpoint: str
+    query: str
+    entity_type: str | None = None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "Query":
+        endpoint = str(raw.get("endpoint", "entity-search")).strip("/")
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"unknown endpoint '{endpoint}' (expected one of {', '.join(ENDPOINTS)})")
+        return cls(endpoint, str(raw["query"]), raw.get("entity_type") or None)
+
+
+# The two probes `ingest_roadmap_to_koi.py --smoke` has always run.
+SMOKE_QUERIES = (
+    Query("entity-search", "bioregional swarm", "Outcome"),
+    Query("chat", "What are the BKC outcomes?"),
+)
+
+
+def load_queries(path: Path) -> list[Query]:
+    """Read a query set: a JSON list, or JSONL with one query object per line."""
+    text = path.read_text()
+    if text.lstrip().startswith("["):
+        rows = json.loads(text)
+    else:
+        rows = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [Query.from_dict(row) for row in rows]
+
+
+def default_queries(roadmap_path: Path) -> list[Query]:
+    """Smoke queries plus a title search and a chat question for every roadmap node."""
+    queries = list(SMOKE_QUERIES)
+    if not roadmap_path.exists():
+        return queries
+    for node in json.loads(roadmap_path.read_text()).get("nodes", []):
+        entity_type = koi.KIND_TO_TYPE.get(node.get("kind"))
+        title = node.get("title")
+        if not entity_type or not title:
+            continue
+        queries.append(Query("entity-search", title, entity_type))
+        queries.append(Query("chat", f"What is the status of '{title}'?"))
+    return queries
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Sample:
+    endpoint: str
+    started: float
+    latency: float
+    error: str | None = None
+    results: int = 0
+    roadmap_hits: int = 0
+
+
+def roadmap_uris(items: list[Any]) -> list[str]:
+    uris = []
+    for item in items:
+        uri = item.get("uri", item.get("fuseki_uri", "")) if isinstance(item, dict) else item
+        if str(uri).startswith(koi.ROADMAP_URI_PREFIX):
+            uris.append(str(uri))
+    return uris
+
+
+class KoiClient:
+    """Issues single queries against a KOI API; one pooled session per thread."""
+
+    def __init__(self, api_base: str, timeouts: dict[str, float] | None = None) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self._local = threading.local()
+
+    def _session(self):
+        import requests
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def call(self, query: Query) -> Sample:
+        session = self._session()
+        url = f"{self.api_base}/{query.endpoint}"
+        timeout = self.timeouts[query.endpoint]
+        started = time.perf_counter()
+        try:
+            if query.endpoint == "chat":
+                resp = session.post(url, json={"query": query.query}, timeout=timeout)
+            else:
+                params = {"query": query.query}
+                if query.entity_type:
+                    params["entity_type"] = query.entity_type
+                resp = session.get(url, params=params, timeout=timeout)
+            if resp.status_code >= 400:
+                return Sample(query.endpoint, started, time.perf_counter() - started, f"http_{resp.status_code}")
+            body = resp.json()
+        except ValueError:
+            return Sample(query.endpoint, started, time.perf_counter() - started, "bad_json")
+        except Exception as e:
+            return Sample(query.endpoint, started, time.perf_counter() - started, type(e).__name__)
+        latency = time.perf_counter() - started
+        items = body.get("sources" if query.endpoint == "chat" else "results") or []
+        return Sample(query.endpoint, started, latency, results=len(items), roadmap_hits=len(roadmap_uris(items)))
+
+
+# ---------------------------------------------------------------------------
+# Load run
+# ---------------------------------------------------------------------------
+
+def run_load(
+    client: KoiClient,
+    queries: list[Query],
+    *,
+    concurrency: int,
+    duration: float | None = None,
+    max_requests: int | None = None,
+    warmup: float = 0.0,
+    shuffle_seed: int | None = None,
+) -> tuple[list[Sample], float]:
+    """Replay `queries` round-robin from `concurrency` workers.
+
+    Stops after `duration` seconds or `max_requests` requests, whichever
+    comes first (at least one must be set). Samples started during the
+    first `warmup` seconds are dropped. Returns (samples, measured seconds).
+    """
+    if duration is None and max_requests is None:
+        raise ValueError("run_load needs a duration or a request budget")
+    order = list(queries)
+    if shuffle_seed is not None:
+        random.Random(shuffle_seed).shuffle(order)
+    ticket = itertools.count()
+    ticket_lock = threading.Lock()
+    samples: list[Sample] = []
+    samples_lock = threading.Lock()
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = start + warmup + duration if duration is not None else math.inf
+    budget = max_requests if max_requests is not None else math.inf
+
+    def worker() -> None:
+        local: list[Sample] = []
+        while time.perf_counter() < deadline:
+            with ticket_lock:
+                n = next(ticket)
+            if n >= budget:
+                break
+            sample = client.call(order[n % len(order)])
+            if sample.started >= measure_from:
+                local.append(sample)
+        with samples_lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=worker, name=f"koi-load-{i}", daemon=True) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return samples, max(time.perf_counter() - measure_from, 1e-9)
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict[str, dict[str, Any]]:
+    """Per-endpoint (and "all") stats; latencies in milliseconds."""
+    groups: dict[str, list[Sample]] = defaultdict(list)
+    for s in samples:
+        groups[s.endpoint].append(s)
+        groups["all"].append(s)
+    report = {}
+    for name in [*ENDPOINTS, "all"]:
+        group = groups.get(name)
+        if not group:
+            continue
+        ok = [s for s in group if s.error is None]
+        latencies = sorted(s.latency * 1000 for s in ok)
+        stats: dict[str, Any] = {
+            "requests": len(group),
+            "rps": round(len(group) / elapsed, 2),
+            "errors": len(group) - len(ok),
+            "error_rate": round((len(group) - len(ok)) / len(group), 4),
+            **{f"p{p}": round(percentile(latencies, p), 1) for p in PERCENTILES},
+            "max": round(latencies[-1], 1) if latencies else 0.0,
+            "roadmap_rate": round(sum(1 for s in ok if s.roadmap_hits) / len(ok), 4) if ok else 0.0,
+            "empty_rate": round(sum(1 for s in ok if not s.results) / len(ok), 4) if ok else 0.0,
+        }
+        error_kinds = Counter(s.error for s in group if s.error)
+        if error_kinds:
+            stats["error_kinds"] = dict(error_kinds.most_common())
+        report[name] = stats
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Thresholds
+# ---------------------------------------------------------------------------
+
+THRESHOLD_RE = re.compile(r"^\s*([\w-]+)\.(\w+)\s*(<=|>=|<|>)\s*([\d.]+)\s*$")
+COMPARATORS = {"<=": operator.le, ">=": operator.ge, "<": operator.lt, ">": operator.gt}
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """`<endpoint|all>.<metric> <op> <value>`, e.g. "chat.p95<=4000"."""
+
+    scope: str
+    metric: str
+    op: str
+    value: float
+
+    @classmethod
+    def parse(cls, spec: str) -> "Threshold":
+        m = THRESHOLD_RE.match(spec)
+        if not m:
+            raise ValueError(f"bad threshold '{spec}' (expected e.g. chat.p95<=4000)")
+        scope, metric, op, value = m.groups()
+        if scope not in (*ENDPOINTS, "all"):
+            raise ValueError(f"bad threshold scope '{scope}' (expected {', '.join(ENDPOINTS)} or all)")
+        if metric not in METRICS:
+            raise ValueError(f"bad threshold metric '{metric}' (expected one of {', '.join(METRICS)})")
+        return cls(scope, metric, op, float(value))
+
+    def __str__(self) -> str:
+        return f"{self.scope}.{self.metric}{self.op}{self.value:g}"
+
+    def check(self, report: dict[str, dict[str, Any]]) -> str | None:
+        """Return a failure message, or None if the threshold holds."""
+        stats = report.get(self.scope)
+        if stats is None:
+            return f"{self}: no {self.scope} requests were made"
+        if self.metric in SUCCESS_METRICS and stats["requests"] == stats["errors"]:
+            return f"{self}: no successful {self.scope} requests"
+        actual = stats[self.metric]
+        if not COMPARATORS[self.op](actual, self.value):
+            return f"{self}: got {actual:g}"
+        return None
+
+
+def baseline_thresholds(
+    baseline: dict[str, dict[str, Any]], max_regression: float, max_error_increase: float
+) -> list[Threshold]:
+    """Per endpoint, p95 may grow by at most `max_regression`x and the error
+    rate by at most `max_error_increase` over a saved report."""
+    thresholds = []
+    for name, stats in baseline.items():
+        if name not in ENDPOINTS:
+            continue
+        if stats.get("p95"):
+            thresholds.append(Threshold(name, "p95", "<=", round(stats["p95"] * max_regression, 1)))
+        thresholds.append(Threshold(name, "error_rate", "<=", round(stats.get("error_rate", 0.0) + max_error_increase, 4)))
+    return thresholds
+
+
+def print_report(report: dict[str, dict[str, Any]], elapsed: float, concurrency: int) -> None:
+    print(f"\n{elapsed:.1f}s at concurrency {concurrency}")
+    header = f"{'endpoint':<14}{'reqs':>8}{'rps':>9}{'err%':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'roadmap%':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, s in report.items():
+        print(f"{name:<14}{s['requests']:>8}{s['rps']:>9.1f}{s['error_rate'] * 100:>7.2f}%"
+              f"{s['p50']:>9.1f}{s['p95']:>9.1f}{s['p99']:>9.1f}{s['max']:>9.1f}{s['roadmap_rate'] * 100:>9.1f}%")
+    for name, s in report.items():
+        if name != "all" and s.get("error_kinds"):
+            print(f"  {name} errors: " + ", ".join(f"{k}={v}" for k, v in s["error_kinds"].items()))
+    print("(latencies in ms over successful requests)")
+
+
+# ---------------------------------------------------------------------------
+# Local stub
+# ---------------------------------------------------------------------------
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokens(text: str) -> set[str]:
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+@dataclass
+class StubKoi:
+    """Keyword-scored KOI API over the roadmap entities, with injectable latency/errors."""
+
+    entities: list[dict[str, Any]]
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    chat_factor: float = 5.0
+    error_rate: float = 0.0
+    limit: int = 10
+    _rng: random.Random = field(default_factory=random.Random)
+    _rng_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @classmethod
+    def from_roadmap(cls, roadmap_path: Path, **kwargs: Any) -> "StubKoi":
+        entities = []
+        for node in json.loads(roadmap_path.read_text()).get("nodes", []):
+            entity_type = koi.KIND_TO_TYPE.get(node.get("kind"))
+            if not entity_type:
+                continue
+            text = f"{node.get('title', '')} {node.get('summary', '')}"
+            entities.append({
+                "uri": koi.uri_for_node(node["id"]),
+                "name": node.get("title", node["id"]),
+                "entity_type": entity_type,
+                "_tokens": tokens(text),
+            })
+        return cls(entities, **kwargs)
+
+    def search(self, query: str, entity_type: str | None = None) -> list[dict[str, Any]]:
+        wanted = tokens(query)
+        scored = []
+        for e in self.entities:
+            if entity_type and e["entity_type"] != entity_type:
+                continue
+            overlap = len(wanted & e["_tokens"])
+            if overlap:
+                scored.append((overlap / len(wanted), e))
+        scored.sort(key=lambda pair: -pair[0])
+        return [
+            {"uri": e["uri"], "name": e["name"], "entity_type": e["entity_type"], "score": round(score, 3)}
+            for score, e in scored[:self.limit]
+        ]
+
+    def delay(self, factor: float = 1.0) -> bool:
+        """Sleep for the configured latency; True if this request should fail."""
+        with self._rng_lock:
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+            fail = self._rng.random() < self.error_rate
+        time.sleep(max(0.0, self.latency_ms * factor + jitter) / 1000)
+        return fail
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API behind uvicorn
+            # Headers and body go out in separate writes; with Nagle on, the body
+            # waits for the client's delayed ACK (~40ms) on every keep-alive reply.
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _reply(self, status: int, body: dict[str, Any]) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                if url.path != "/entity-search":
+                    return self._reply(404, {"detail": "not found"})
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                if stub.delay():
+                    return self._reply(503, {"detail": "stub: injected error"})
+                self._reply(200, {"results": stub.search(params.get("query", ""), params.get("entity_type"))})
+
+            def do_POST(self) -> None:
+                if urlparse(self.path).path != "/chat":
+                    return self._reply(404, {"detail": "not found"})
+                length = int(self.headers.get("Content-Length") or 0)
+                query = json.loads(self.rfile.read(length) or b"{}").get("query", "")
+                if stub.delay(stub.chat_factor):
+                    return self._reply(503, {"detail": "stub: injected error"})
+                sources = stub.search(query)[:5]
+                answer = "; ".join(s["name"] for s in sources) or "No matching roadmap entries."
+                self._reply(200, {"answer": answer, "sources": sources})
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 128  # the default backlog of 5 stalls concurrent workers in SYN retries
+
+        server = Server((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="koi-stub", daemon=True).start()
+        return server
+
+
+def stub_from_args(args: argparse.Namespace) -> StubKoi:
+    return StubKoi.from_roadmap(
+        Path(args.roadmap),
+        latency_ms=args.stub_latency_ms,
+        jitter_ms=args.stub_jitter_ms,
+        chat_factor=args.stub_chat_factor,
+        error_rate=args.stub_error_rate,
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--stub-latency-ms", type=float, default=10.0, help="Stub /entity-search latency")
+    parser.add_argument("--stub-jitter-ms", type=float, default=5.0, help="Uniform +/- jitter on stub latency")
+    parser.add_argument("--stub-chat-factor", type=float, default=5.0,
+                        help="Stub /chat latency as a multiple of --stub-latency-ms")
+    parser.add_argument("--stub-error-rate", type=float, default=0.0, help="Share of stub requests answered with 503")
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    try:
+        thresholds = [Threshold.parse(spec) for spec in args.threshold]
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())["endpoints"]
+        thresholds += baseline_thresholds(baseline, args.max_regression, args.max_error_increase)
+
+    server = None
+    api_base = args.api
+    if args.stub:
+        server = stub_from_args(args).serve()
+        api_base = f"http://127.0.0.1:{server.server_address[1]}"
+    elif not api_base:
+        print("error: run needs --api <url> or --stub", file=sys.stderr)
+        return 2
+
+    queries = load_queries(Path(args.queries)) if args.queries else default_queries(Path(args.roadmap))
+    if args.endpoint:
+        queries = [q for q in queries if q.endpoint in args.endpoint]
+    if not queries:
+        print("error: empty query set", file=sys.stderr)
+        return 2
+    duration = args.duration
+
+    print(f"Replaying {len(queries)} queries against {api_base} "
+          f"({args.concurrency} workers, "
+          + (f"{duration:g}s" if duration else f"{args.requests} requests")
+          + (f", {args.warmup:g}s warmup" if args.warmup else "") + ")")
+    client = KoiClient(api_base, {"chat": args.chat_timeout, "entity-search": args.search_timeout})
+    try:
+        samples, elapsed = run_load(
+            client, queries,
+            concurrency=args.concurrency,
+            duration=duration,
+            max_requests=args.requests or None,
+            warmup=args.warmup,
+            shuffle_seed=args.seed,
+        )
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    report = summarize(samples, elapsed)
+    print_report(report, elapsed, args.concurrency)
+
+    checks = [(t, t.check(report)) for t in thresholds]
+    failures = [msg for _, msg in checks if msg]
+    if args.report:
+        Path(args.report).write_text(json.dumps({
+            "api": api_base,
+            "concurrency": args.concurrency,
+            "elapsed_s": round(elapsed, 3),
+            "queries": len(queries),
+            "endpoints": report,
+            "thresholds": [str(t) for t in thresholds],
+            "failures": failures,
+        }, indent=2) + "\n")
+        print(f"Report written to {args.report}")
+
+    if checks:
+        print()
+        for t, msg in checks:
+            print(f"  [{'FAIL' if msg else 'PASS'}] {t}")
+    if failures:
+        print(f"\n{len(failures)} threshold(s) failed:")
+        for msg in failures:
+            print(f"  {msg}")
+        return 1
+    return 0
+
+
+def cmd_stub(args: argparse.Namespace) -> int:
+    server = stub_from_args(args).serve(args.host, args.port)
+    print(f"Stub KOI API on http://{server.server_address[0]}:{server.server_address[1]} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load/latency harness for the KOI retrieval API")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Replay a query set and report latency/throughput/errors")
+    run.add_argument("--api", default=None, help="KOI API base URL (e.g. http://localhost:8351)")
+    run.add_argument("--stub", action="store_true", help="Start a local stub API and run against it")
+    run.add_argument("--queries", default=None, help="Query set (JSON list or JSONL); default: smoke + roadmap queries")
+    run.add_argument("--roadmap", default=str(ROADMAP_PATH), help="Roadmap used for default queries and the stub")
+    run.add_argument("--endpoint", action="append", choices=ENDPOINTS,
+                     help="Only replay queries for this endpoint (repeatable)")
+    run.add_argument("--concurrency", type=int, default=4, help="Concurrent workers")
+    run.add_argument("--duration", type=float, default=None, help="Seconds to run (default 30 unless --requests)")
+    run.add_argument("--requests", type=int, default=0, help="Stop after this many requests")
+    run.add_argument("--warmup", type=float, default=0.0, help="Seconds at the start excluded from the stats")
+    run.add_argument("--seed", type=int, default=None, help="Shuffle the query order with this seed")
+    run.add_argument("--search-timeout", type=float, default=DEFAULT_TIMEOUTS["entity-search"])
+    run.add_argument("--chat-timeout", type=float, default=DEFAULT_TIMEOUTS["chat"])
+    run.add_argument("--threshold", action="append", default=[],
+                     help="Fail the run unless <endpoint|all>.<metric> <op> <value> holds, e.g. chat.p95<=4000; "
+                          f"metrics: {', '.join(METRICS)} (repeatable)")
+    run.add_argument("--baseline", default=None, help="Earlier --report; fail if an endpoint's p95 or error rate regressed")
+    run.add_argument("--max-regression", type=float, default=1.25,
+                     help="Allowed p95 growth over --baseline (default 1.25x)")
+    run.add_argument("--max-error-increase", type=float, default=0.01,
+                     help="Allowed error-rate increase over --baseline (default 0.01)")
+    run.add_argument("--report", default=None, help="Write the JSON report here")
+    add_stub_arguments(run)
+
+    stub = sub.add_parser("stub", help="Serve a stub KOI API over the roadmap")
+    stub.add_argument("--host", default="127.0.0.1")
+    stub.add_argument("--port", type=int, default=8351)
+    stub.add_argument("--roadmap", default=str(ROADMAP_PATH))
+    add_stub_arguments(stub)
+
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.duration is None and not args.requests:
+        args.duration = 30.0
+    return cmd_run(args) if args.command == "run" else cmd_stub(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Load code-index artifacts into KOI knowledge graph.
+
+Reads the <repo>_artifacts.jsonl files written by `index_bkc_codebase.py
+--apply` and bulk-loads their entities and edges into entity_registry /
+entity_relationships with the same machinery as ingest_roadmap_to_koi.py:
+rows are COPYed into staging tables, merged set-wise, edges are synced as a
+delta, and stale rows are swept by generation.
+
+Artifacts are streamed one record per line, entities first and then edges,
+straight into the COPY buffers, so memory is bounded by the entity name
+index rather than by the artifact. Older single-document
+<repo>_artifacts.json files are still accepted, but are parsed whole.
+Records must have the shape index_bkc_codebase.py writes (koi-processor's
+CodeEntity / CodeEdge dataclasses, or its file manifest); anything else
+fails that repo's load instead of being loaded half-understood.
+
+Each repo is its own source (`code-index:<repo>`), generation counter and
+transaction, so repos are marked and swept independently and one bad
+artifact does not roll back the others. Entities get stable URIs that do not
+depend on line numbers:
+
+    code:<repo>/<file_path>              file / module
+    code:<repo>/<file_path>#<qualname>   class, function, method, ...
+
+where qualname is `<parent_name>.<name>` for members. Entities with the same
+URI are merged (first wins). Edge endpoints are resolved by URI, then by
+qualified name within the file, then by a name that is unique in the repo;
+unresolvable edges are counted and skipped. An artifact whose content is
+unchanged since its last load is skipped. Entities are loaded without
+embeddings.
+
+Usage:
+    # Preview (no DB changes)
+    python load_code_index_to_koi.py --db octo_koi --dry-run
+
+    # Load every artifact in <meta-root>/.code-index
+    python load_code_index_to_koi.py --db octo_koi --apply
+
+    # Load selected repos from a custom directory
+    python load_code_index_to_koi.py --db octo_koi --apply \
+        --index-dir /path/to/.code-index --repos koi-processor-api
+
+Environment:
+    POSTGRES_HOST / POSTGRES_PORT / POSTGRES_USER / POSTGRES_PASSWORD — as for
+    ingest_roadmap_to_koi.py
+    BKC_META_ROOT — meta-repo root, for the default --index-dir
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import ingest_roadmap_to_koi as koi  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+log = logging.getLogger(__name__)
+
+CODE_URI_PREFIX = "code:"
+CODE_SOURCE_PREFIX = "code-index:"
+ARTIFACT_SUFFIX = "_artifacts.jsonl"
+LEGACY_ARTIFACT_SUFFIX = "_artifacts.json"
+# Bump when the URI scheme or row layout changes, to force one full reload.
+CODE_INDEX_FORMAT_VERSION = 2
+
+# Fields of koi-processor's CodeEntity / CodeEdge dataclasses, as
+# index_bkc_codebase.py serializes them with asdict(). Its file manifest
+# fallback writes File entities with the same entity fields.
+ENTITY_FIELDS = ("entity_type", "name", "file_path")
+EDGE_FIELDS = ("edge_type", "from_entity", "to_entity")
+PARENT_FIELD = "parent_name"
+FILE_TYPES = {"file", "module"}
+# Line kinds of a JSONL artifact: {"header": {...}}, then {"entity": {...}},
+# {"edge": {...}} and {"error": {...}} records.
+RECORD_KINDS = {"header", "entity", "edge", "error"}
+# Bulky fields that belong in the source tree, not in entity metadata.
+SKIP_METADATA_FIELDS = {"content", "code", "body", "source_code", "text"}
+MAX_METADATA_TEXT = 1000
+
+
+def type_name(value: str) -> str:
+    """'function' / 'class_method' -> 'Function' / 'ClassMethod'; CamelCase is kept."""
+    if value != value.lower():
+        return value
+    return "".join(part.capitalize() for part in re.split(r"[_\s-]+", value) if part)
+
+
+def predicate_name(value: str) -> str:
+    """'CALLS' / 'importsFrom' -> 'calls' / 'imports_from'."""
+    value = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", str(value))
+    return re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+
+
+def code_uri(repo: str, file_path: str, qualname: Optional[str] = None) -> str:
+    uri = f"{CODE_URI_PREFIX}{repo}/{file_path.removeprefix('./')}"
+    return f"{uri}#{qualname}" if qualname else uri
+
+
+def source_for_repo(repo: str) -> str:
+    return f"{CODE_SOURCE_PREFIX}{repo}"
+
+
+def repo_name_for(path: Path) -> str:
+    """Artifact files are named after the BKC_REPOS entry, which is the stable repo key."""
+    for suffix in (ARTIFACT_SUFFIX, LEGACY_ARTIFACT_SUFFIX):
+        if path.name.endswith(suffix):
+            return path.name[:-len(suffix)]
+    raise ValueError(f"Not a code-index artifact: {path}")
+
+
+def artifact_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    digest.update(f"#format={CODE_INDEX_FORMAT_VERSION}".encode())
+    return digest.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Artifact -> entities / relationships
+# ---------------------------------------------------------------------------
+
+def read_legacy_artifact(path: Path) -> dict:
+    artifact = json.loads(path.read_bytes())
+    if not isinstance(artifact, dict) or not all(isinstance(artifact.get(key, []), list)
+                                                 for key in ("entities", "edges", "errors")):
+        raise ValueError(f"{path}: not a code-index artifact (expected entities/edges lists)")
+    return artifact
+
+
+def artifact_header(path: Path) -> dict:
+    if path.name.endswith(LEGACY_ARTIFACT_SUFFIX):
+        artifact = read_legacy_artifact(path)
+        return {key: value for key, value in artifact.items() if key not in ("entities", "edges", "errors")}
+    with path.open(encoding="utf-8") as f:
+        first = json.loads(f.readline() or "{}")
+    if not isinstance(first, dict) or not isinstance(first.get("header"), dict):
+        raise ValueError(f"{path}: first line is not an artifact header")
+    return first["header"]
+
+
+def artifact_records(path: Path, kind: str) -> Iterator[tuple[str, dict]]:
+    """Yield (location, record) for every `kind` record ("entity" or "edge") of an artifact."""
+    if path.name.endswith(LEGACY_ARTIFACT_SUFFIX):
+        key = {"entity": "entities", "edge": "edges"}[kind]
+        for n, record in enumerate(read_legacy_artifact(path).get(key, []), 1):
+            yield f"{path.name} {kind} #{n}", record
+        return
+    with path.open(encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict) or len(record) != 1 or not record.keys() <= RECORD_KINDS:
+                raise ValueError(f"{path.name}:{line_no}: unknown record {str(record)[:200]}")
+            if kind in record:
+                yield f"{path.name}:{line_no}", record[kind]
+
+
+def require_fields(record: Any, fields: tuple[str, ...], where: str) -> None:
+    """Reject a record the indexer could not have written, naming what is missing."""
+    if not isinstance(record, dict):
+        raise ValueError(f"{where}: expected an object, got {type(record).__name__}")
+    missing = [name for name in fields if record.get(name) in (None, "")]
+    if missing:
+        raise ValueError(f"{where}: missing {', '.join(missing)} in {str(record)[:200]}")
+
+
+def entity_identity(record: dict) -> tuple[str, str, Optional[str]]:
+    """(entity_type, file_path, qualname) for an artifact entity; qualname None for files."""
+    entity_type = type_name(str(record["entity_type"]))
+    file_path = str(record["file_path"])
+    name = str(record["name"])
+    if entity_type.lower() in FILE_TYPES and file_path.endswith(name):
+        return entity_type, file_path, None
+    parent = record.get(PARENT_FIELD)
+    return entity_type, file_path, f"{parent}.{name}" if parent else name
+
+
+def entity_metadata(record: dict, repo: str, language: Optional[str]) -> dict[str, Any]:
+    metadata: dict[str, Any] = {"code_repo": repo}
+    if language:
+        metadata["code_language"] = language
+    for key, value in record.items():
+        if key in SKIP_METADATA_FIELDS or value in (None, "", [], {}):
+            continue
+        if isinstance(value, str):
+            metadata[f"code_{key}"] = value[:MAX_METADATA_TEXT]
+        elif isinstance(value, (int, float, bool)):
+            metadata[f"code_{key}"] = value
+        elif isinstance(value, list) and all(isinstance(v, (str, int, float)) for v in value):
+            metadata[f"code_{key}"] = value
+    return metadata
+
+
+class EntityIndex:
+    """Resolves edge endpoint references to entity URIs."""
+
+    def __init__(self):
+        self.exact: dict[str, str] = {}
+        self.by_qualname: dict[str, set[str]] = {}
+        self.by_name: dict[str, set[str]] = {}
+
+    def add(self, uri: str, file_path: str, qualname: Optional[str]) -> None:
+        self.exact.setdefault(uri, uri)
+        if qualname:
+            self.exact.setdefault(f"{file_path}#{qualname}", uri)
+            self.exact.setdefault(f"{file_path}::{qualname}", uri)
+            self.by_qualname.setdefault(qualname, set()).add(uri)
+            self.by_name.setdefault(qualname.rsplit(".", 1)[-1], set()).add(uri)
+        else:
+            self.exact.setdefault(file_path, uri)
+
+    def resolve(self, ref: Any, file_hint: Optional[str] = None) -> Optional[str]:
+        if ref in (None, ""):
+            return None
+        ref = str(ref)
+        if ref in self.exact:
+            return self.exact[ref]
+        if file_hint and f"{file_hint}#{ref}" in self.exact:
+            return self.exact[f"{file_hint}#{ref}"]
+        for candidates in (self.by_qualname.get(ref), self.by_name.get(ref)):
+            if candidates and len(candidates) == 1:
+                return next(iter(candidates))
+        return None
+
+
+class CodeGraph:
+    """Streams one artifact's entities, then its resolved relationships.
+
+    `entities()` must be exhausted first: it builds the name index that
+    `relationships()` resolves edge endpoints against. Counts of what was
+    read, merged and skipped accumulate in `report`.
+    """
+
+    def __init__(self, repo: str, path: Path):
+        self.repo = repo
+        self.path = path
+        self.language = artifact_header(path).get("language")
+        self.index = EntityIndex()
+        self.uris: set[str] = set()
+        self.report = {"entities": 0, "relationships": 0, "entities_read": 0, "entities_duplicate": 0,
+                       "edges_read": 0, "edges_unresolved": 0, "edges_self": 0, "edges_duplicate": 0}
+
+    def entities(self) -> Iterator[dict]:
+        for where, record in artifact_records(self.path, "entity"):
+            self.report["entities_read"] += 1
+            require_fields(record, ENTITY_FIELDS, where)
+            entity_type, file_path, qualname = entity_identity(record)
+            uri = code_uri(self.repo, file_path, qualname)
+            if uri in self.uris:
+                self.report["entities_duplicate"] += 1
+                continue
+            self.uris.add(uri)
+            self.index.add(uri, file_path, qualname)
+            self.report["entities"] += 1
+            yield {
+                "uri": uri,
+                "entity_type": entity_type,
+                "name": qualname or file_path,
+                "first_seen_rid": source_for_repo(self.repo),
+                "metadata": entity_metadata(record, self.repo, self.language),
+            }
+
+    def relationships(self) -> Iterator[tuple[str, str, str]]:
+        # Hashes, not triples: enough to count and drop repeats without holding every edge.
+        seen: set[int] = set()
+        for where, edge in artifact_records(self.path, "edge"):
+            self.report["edges_read"] += 1
+            require_fields(edge, EDGE_FIELDS, where)
+            file_hint = edge.get("file_path")
+            subject_uri = self.index.resolve(edge["from_entity"], file_hint)
+            object_uri = self.index.resolve(edge["to_entity"], file_hint)
+            if not subject_uri or not object_uri:
+                self.report["edges_unresolved"] += 1
+                continue
+            if subject_uri == object_uri:
+                self.report["edges_self"] += 1
+                continue
+            triple = (subject_uri, predicate_name(edge["edge_type"]), object_uri)
+            key = hash(triple)
+            if key in seen:
+                self.report["edges_duplicate"] += 1
+                continue
+            seen.add(key)
+            self.report["relationships"] += 1
+            yield triple
+
+    def describe(self) -> str:
+        report = self.report
+        return (f"{report['entities']} entities ({report['entities_duplicate']} duplicates merged), "
+                f"{report['relationships']} relationships ({report['edges_unresolved']} unresolved, "
+                f"{report['edges_self']} self, {report['edges_duplicate']} duplicate edges skipped)")
+
+
+# ---------------------------------------------------------------------------
+# Load
+# ---------------------------------------------------------------------------
+
+def load_repo(conn, graph: CodeGraph, graph_hash: str, has_embeddings_table: bool) -> dict[str, int]:
+    """Replace one repo's code graph in a single transaction, streaming the artifact into COPY."""
+    source = source_for_repo(graph.repo)
+    cur = conn.cursor()
+    try:
+        koi.create_staging_tables(cur)
+        koi.stage_entities(cur, graph.entities(), itertools.repeat(None))
+        koi.stage_relationships(cur, graph.relationships())
+        generation = koi.next_generation(cur, source)
+        merged = koi.merge_entities(cur, generation, has_embeddings_table=has_embeddings_table, source=source)
+        created, removed = koi.sync_relationships(cur, source=source)
+        swept = koi.sweep_stale_entities(cur, generation, has_embeddings_table, source=source)
+        koi.save_graph_hash(cur, graph_hash, source=source)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+    log.info(f"  {graph.describe()}")
+    log.info(f"  Generation {generation}: merged {merged} entities; "
+             f"{created} new / {removed} removed relationships; swept {swept['entities']} stale entities "
+             f"({swept['relationships']} relationships)")
+    return {"entities_upserted": merged, "rels_created": created, "rels_removed": removed,
+            "stale_removed": swept["entities"]}
+
+
+def find_artifacts(index_dir: Path, repo_filters: Optional[list[str]]) -> list[Path]:
+    """One artifact per repo; a JSONL artifact wins over a legacy one for the same repo."""
+    by_repo: dict[str, Path] = {}
+    for path in sorted(index_dir.glob(f"*{LEGACY_ARTIFACT_SUFFIX}")) + sorted(index_dir.glob(f"*{ARTIFACT_SUFFIX}")):
+        by_repo[repo_name_for(path)] = path
+    paths = [by_repo[repo] for repo in sorted(by_repo)]
+    if repo_filters:
+        paths = [p for p in paths if any(f in repo_name_for(p) for f in repo_filters)]
+    return paths
+
+
+def load_code_index(args, index_dir: Path, dry_run: bool = True) -> dict[str, int]:
+    artifacts = find_artifacts(index_dir, args.repos)
+    if not artifacts:
+        log.error(f"No *{ARTIFACT_SUFFIX} files in {index_dir} (run index_bkc_codebase.py --apply first)")
+        sys.exit(1)
+    log.info(f"Loading {len(artifacts)} code-index artifacts from {index_dir}")
+
+    totals = {"repos": 0, "repos_unchanged": 0, "repos_failed": 0, "entities": 0, "relationships": 0,
+              "entities_upserted": 0, "rels_created": 0, "rels_removed": 0, "stale_removed": 0,
+              "edges_unresolved": 0}
+    conn = None
+    has_embeddings_table = False
+    if not dry_run:
+        conn = koi.get_db_connection(args)
+        conn.autocommit = False
+        cur = conn.cursor()
+        has_embeddings_table = koi.check_entity_embeddings_table(cur)
+        conn.rollback()
+        koi.ensure_ingest_schema(cur)
+        conn.commit()
+        cur.close()
+
+    try:
+        for path in artifacts:
+            repo = repo_name_for(path)
+            graph_hash = artifact_hash(path)
+            log.info(f"=== {repo} ({path.name}, {path.stat().st_size:,} bytes) ===")
+            totals["repos"] += 1
+            if path.name.endswith(LEGACY_ARTIFACT_SUFFIX):
+                log.warning("  Legacy artifact is parsed whole; re-run index_bkc_codebase.py --apply to stream it")
+
+            if conn is not None and not args.force:
+                cur = conn.cursor()
+                stored = koi.load_graph_hash(cur, source_for_repo(repo))
+                conn.rollback()
+                cur.close()
+                if stored == graph_hash:
+                    log.info("  Artifact unchanged since last load — skipping")
+                    totals["repos_unchanged"] += 1
+                    continue
+
+            try:
+                graph = CodeGraph(repo, path)
+                if dry_run:
+                    for _ in itertools.chain(graph.entities(), graph.relationships()):
+                        pass
+                    log.info(f"  {graph.describe()}")
+                    log.info(f"  [DRY RUN] Would load into source '{source_for_repo(repo)}'")
+                    result = {}
+                else:
+                    result = load_repo(conn, graph, graph_hash, has_embeddings_table)
+            except Exception as e:
+                log.error(f"  Load failed for {repo}{'' if dry_run else ', rolled back'}: {e}")
+                totals["repos_failed"] += 1
+                continue
+            totals["entities"] += graph.report["entities"]
+            totals["relationships"] += graph.report["relationships"]
+            totals["edges_unresolved"] += graph.report["edges_unresolved"]
+            for key, value in result.items():
+                totals[key] += value
+    finally:
+        if conn is not None:
+            conn.close()
+
+    log.info("=== Summary ===")
+    log.info(f"  Repos: {totals['repos']} ({totals['repos_unchanged']} unchanged, {totals['repos_failed']} failed)")
+    log.info(f"  Entities: {totals['entities']} read, {totals['entities_upserted']} upserted, "
+             f"{totals['stale_removed']} stale removed")
+    log.info(f"  Relationships: {totals['relationships']} resolved, {totals['rels_created']} created, "
+             f"{totals['rels_removed']} removed, {totals['edges_unresolved']} unresolved")
+    if dry_run:
+        log.info("  (DRY RUN — no DB changes)")
+    return totals
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Load code-index artifacts into KOI knowledge graph")
+    parser.add_argument("--db", required=True, help="PostgreSQL database name (e.g. octo_koi)")
+    parser.add_argument("--host", default=None, help="DB host (default: env POSTGRES_HOST or localhost)")
+    parser.add_argument("--port", default=None, type=int, help="DB port (default: env POSTGRES_PORT or 5432)")
+    parser.add_argument("--user", default=None, help="DB user (default: env POSTGRES_USER or postgres)")
+    parser.add_argument("--password", default=None, help="DB password (default: env POSTGRES_PASSWORD)")
+    parser.add_argument("--index-dir", default=None,
+                        help="Directory of *_artifacts.jsonl files (default: <meta-root>/.code-index)")
+    parser.add_argument("--repos", nargs="*", help="Filter artifacts by repo name substring (default: all)")
+    parser.add_argument("--dry-run", action="store_true", help="Parse and resolve artifacts without DB changes")
+    parser.add_argument("--apply", action="store_true", help="Load artifacts into KOI")
+    parser.add_argument("--force", action="store_true", help="Reload artifacts even if unchanged since last load")
+
+    args = parser.parse_args()
+
+    if not args.dry_run and not args.apply:
+        log.error("Must specify --dry-run or --apply")
+        sys.exit(1)
+
+    if args.index_dir:
+        index_dir = Path(args.index_dir)
+    else:
+        from index_bkc_codebase import find_meta_repo_root
+        index_dir = find_meta_repo_root() / ".code-index"
+
+    totals = load_code_index(args, index_dir, dry_run=args.dry_run)
+    if totals["repos_failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
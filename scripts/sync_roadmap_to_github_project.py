@@ -7,33 +7,63 @@ Design goals:
 - Two sync modes:
   - draft: project draft items only (legacy mode)
   - issue: real GitHub issues + richer project mapping
+- Local SQLite sync state (node -> issue/item ids, applied field values and
+  content fingerprints) so unchanged nodes cost no API calls. A full
+  reconcile against GitHub runs periodically or with --full-reconcile.
+- Several --owner/--project/--repo targets per run share one loaded and
+  rendered model and are reconciled concurrently, each with its own rate
+  budget, journal and state partition. In issue mode, targets mirroring the
+  same repo run one after another so they never race on its issues.
+- Append-only operation journal during --apply; --resume replays completed
+  reads and mutations from it instead of calling GitHub again.
+- --pull reverses the direction: board Status/Priority/dates, issue state and
+  "Depends On" checkboxes are merged three-way (model, board, last sync) into
+  one patch of the model; conflicting edits are reported, never overwritten.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextvars
+import hashlib
 import json
+import math
 import re
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field, replace
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import quote
 
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_MODEL = ROOT / "docs" / "roadmap" / "semantic-roadmap.json"
 MANAGED_PREFIX = "SR:"
 MANAGED_MARKER_PREFIX = "<!-- roadmap-node-id:"
+CONTENT_HASH_MARKER_PREFIX = "<!-- roadmap-content-hash:"
 DEFAULT_REPO = "BioregionalKnowledgeCommons/BioregionalKnowledgeCommoning"
 
 DEFAULT_KINDS = {"initiative", "work_item", "milestone"}
 DEFAULT_MODE = "draft"
 BLOCKED_BY_FIELD_NAME = "Blocked by"
 
+DEFAULT_STATE_PATH = ROOT / ".cache" / "roadmap-sync-state.sqlite"
+DEFAULT_META_TTL_SECONDS = 6 * 3600
+DEFAULT_FULL_RECONCILE_DAYS = 7.0
+DEFAULT_JOURNAL_DIR = ROOT / ".cache" / "journals"
+DEFAULT_RECONCILE_WORKERS = 4
+DEFAULT_DRAFT_BATCH_SIZE = 20
+DEFAULT_ARCHIVE_BATCH_SIZE = 50
+MANAGED_LABEL_DESCRIPTION = "Managed by semantic roadmap sync"
+
 
 @dataclass
 class FieldInfo:
@@ -51,6 +81,9 @@ class IssueInfo:
     labels: set[str]
     milestone_title: str | None
     url: str
+    updated_at: str | None = None
+    # Hash of the rendered body as last written by this script; None if unknown.
+    content_hash: str | None = None
 
 
 @dataclass
@@ -61,34 +94,833 @@ class RepoMilestone:
     description: str | None
 
 
+@dataclass
+class NodeState:
+    """What the last successful sync pushed for one roadmap node."""
+
+    node_id: str
+    title: str = ""
+    issue_number: int | None = None
+    issue_url: str | None = None
+    item_id: str | None = None
+    draft_id: str | None = None
+    milestone_number: int | None = None
+    field_values: dict[str, str] = field(default_factory=dict)
+    node_fingerprint: str = ""
+    body_fingerprint: str = ""
+    synced_at: float = 0.0
+    content_hash: str | None = None
+    issue_updated_at: str | None = None
+
+
 class SyncError(Exception):
     """Raised for sync failures."""
 
 
-def run_gh(args: list[str], expect_json: bool = False, input_data: str | None = None, retries: int = 3) -> Any:
-    cmd = ["gh", *args]
-    for attempt in range(retries + 1):
+class GraphQLError(SyncError):
+    """A GraphQL response with errors; `data` holds whatever aliases did succeed."""
+
+    def __init__(self, message: str, *, data: dict[str, Any] | None = None, errors: list[Any] | None = None) -> None:
+        super().__init__(message)
+        self.data = data or {}
+        self.errors = errors or []
+
+
+class PartialBatchError(SyncError):
+    """A batched write failed part-way; `results` covers the ops that were applied."""
+
+    def __init__(self, message: str, results: list[Any]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_meta (
+    target TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (target, key)
+);
+CREATE TABLE IF NOT EXISTS node_state (
+    target TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    issue_number INTEGER,
+    issue_url TEXT,
+    item_id TEXT,
+    draft_id TEXT,
+    milestone_number INTEGER,
+    field_values TEXT NOT NULL DEFAULT '{}',
+    node_fingerprint TEXT NOT NULL DEFAULT '',
+    body_fingerprint TEXT NOT NULL DEFAULT '',
+    synced_at REAL NOT NULL DEFAULT 0,
+    content_hash TEXT,
+    issue_updated_at TEXT,
+    PRIMARY KEY (target, node_id)
+);
+"""
+
+# Columns added after the first release; older state files get them on open.
+STATE_MIGRATIONS = {
+    "content_hash": "ALTER TABLE node_state ADD COLUMN content_hash TEXT",
+    "issue_updated_at": "ALTER TABLE node_state ADD COLUMN issue_updated_at TEXT",
+}
+
+
+class SyncState:
+    """Local SQLite sync state, partitioned by sync target.
+
+    A target is one (owner, project, mode, repo) combination, so the same
+    state file can serve several boards without their records colliding.
+    """
+
+    def __init__(self, path: Path, target: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.target = target
+        # Concurrent targets share the file; wait out each other's writes.
+        self.conn = sqlite3.connect(str(path), timeout=30)
+        self.conn.executescript(STATE_SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(node_state)")}
+        for column, statement in STATE_MIGRATIONS.items():
+            if column not in columns:
+                self.conn.execute(statement)
+        self.conn.commit()
+
+    def get_meta(self, key: str) -> str | None:
+        row = self.conn.execute(
+            "SELECT value FROM sync_meta WHERE target = ? AND key = ?",
+            (self.target, key),
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_meta (target, key, value) VALUES (?, ?, ?)",
+            (self.target, key, value),
+        )
+        self.conn.commit()
+
+    def load_nodes(self) -> dict[str, NodeState]:
+        rows = self.conn.execute(
+            """
+            SELECT node_id, title, issue_number, issue_url, item_id, draft_id,
+                   milestone_number, field_values, node_fingerprint,
+                   body_fingerprint, synced_at, content_hash, issue_updated_at
+            FROM node_state WHERE target = ?
+            """,
+            (self.target,),
+        ).fetchall()
+        out: dict[str, NodeState] = {}
+        for row in rows:
+            out[row[0]] = NodeState(
+                node_id=row[0],
+                title=row[1],
+                issue_number=row[2],
+                issue_url=row[3],
+                item_id=row[4],
+                draft_id=row[5],
+                milestone_number=row[6],
+                field_values=json.loads(row[7] or "{}"),
+                node_fingerprint=row[8],
+                body_fingerprint=row[9],
+                synced_at=row[10],
+                content_hash=row[11],
+                issue_updated_at=row[12],
+            )
+        return out
+
+    def save_node(self, node_state: NodeState) -> None:
+        # Committed per node so an aborted run keeps everything it finished.
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO node_state (
+                target, node_id, title, issue_number, issue_url, item_id, draft_id,
+                milestone_number, field_values, node_fingerprint, body_fingerprint, synced_at,
+                content_hash, issue_updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self.target,
+                node_state.node_id,
+                node_state.title,
+                node_state.issue_number,
+                node_state.issue_url,
+                node_state.item_id,
+                node_state.draft_id,
+                node_state.milestone_number,
+                json.dumps(node_state.field_values, sort_keys=True),
+                node_state.node_fingerprint,
+                node_state.body_fingerprint,
+                node_state.synced_at,
+                node_state.content_hash,
+                node_state.issue_updated_at,
+            ),
+        )
+        self.conn.commit()
+
+    def delete_node(self, node_id: str) -> None:
+        self.conn.execute(
+            "DELETE FROM node_state WHERE target = ? AND node_id = ?",
+            (self.target, node_id),
+        )
+        self.conn.commit()
+
+    def cached_project_meta(self, ttl_seconds: float) -> tuple[str, dict[str, FieldInfo]] | None:
+        raw = self.get_meta("project_meta")
+        if not raw:
+            return None
+        cached = json.loads(raw)
+        if time.time() - cached.get("fetched_at", 0) > ttl_seconds:
+            return None
+        fields = {name: FieldInfo(**info) for name, info in cached["fields"].items()}
+        return cached["project_id"], fields
+
+    def store_project_meta(self, project_id: str, fields: dict[str, FieldInfo]) -> None:
+        payload = {
+            "project_id": project_id,
+            "fields": {name: asdict(info) for name, info in fields.items()},
+            "fetched_at": time.time(),
+        }
+        self.set_meta("project_meta", json.dumps(payload, sort_keys=True))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def state_target_key(*, owner: str, project_number: int, mode: str, repo: str) -> str:
+    if mode == "issue":
+        return f"{owner}/{project_number}:{mode}:{repo}"
+    return f"{owner}/{project_number}:{mode}"
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 over JSON-serialisable parts (sets are sorted)."""
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=sorted)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def describe_gh_call(args: list[str], input_data: str | None = None) -> tuple[str, bool]:
+    """Classify a gh invocation as (operation kind, mutates remote state)."""
+    if args[:1] == ["api"]:
+        method = args[args.index("-X") + 1] if "-X" in args else "GET"
+        endpoint = args[1] if len(args) > 1 else ""
+        if endpoint == "graphql":
+            is_mutation = bool(input_data) and '"mutation' in input_data.replace(" ", "")[:40]
+            return ("graphql_mutation" if is_mutation else "graphql_query"), is_mutation
+        path = endpoint.split("?", 1)[0]
+        if method == "GET":
+            if path == "rate_limit":
+                return "rate_limit", False
+            if re.search(r"/issues/\d+$", path):
+                return "get_issue", False
+            collection = path.rsplit("/", 1)[-1]
+            return (f"list_{collection}" if collection in {"issues", "milestones", "labels"} else "read"), False
+        match = re.search(r"/(issues|milestones|labels)(?:/[^/]+)?$", path)
+        resource = match.group(1)[:-1] if match else "resource"
+        verb = {"POST": "create", "DELETE": "delete"}.get(method, "patch")
+        return f"{verb}_{resource}", True
+    command = " ".join(args[:2])
+    reads = {
+        "project view": "project_view",
+        "project field-list": "list_fields",
+        "project item-list": "list_items",
+        "issue list": "list_issues",
+        "label list": "list_labels",
+    }
+    if command in reads:
+        return reads[command], False
+    kinds = {
+        "project item-add": "add_item",
+        "project item-edit": "set_field",
+        "project item-create": "create_draft",
+        "project item-archive": "archive_item",
+        "project field-create": "create_field",
+        "label create": "create_label",
+        "label edit": "update_label",
+        "label delete": "delete_label",
+    }
+    if command == "project item-edit" and "--title" in args:
+        return "edit_draft", True
+    if command in kinds:
+        return kinds[command], True
+    return "read", False
+
+
+class Journal:
+    """Append-only JSONL record of every gh call made during an --apply run.
+
+    Each call is keyed by a digest of its arguments and input plus an
+    occurrence counter. Mutations get a `planned` record before they run and
+    a `done` record (with the parsed output) after; reads only get `done`.
+    A batch that failed part-way gets a `partial` record instead of `done`.
+    Because the sync is deterministic given identical reads, a resumed run
+    issues the same call sequence, and every key already marked done is
+    answered from the journal instead of GitHub.
+
+    A mutation that was planned but never marked done may or may not have
+    reached GitHub. Callers whose mutation is not idempotent pass `recover`,
+    which looks for its effect; a resumed run uses what it finds instead of
+    sending the mutation again.
+    """
+
+    def __init__(self, path: Path, *, header: dict[str, Any], resume: bool) -> None:
+        self.path = path
+        self.header = header
+        self.done: dict[str, Any] = {}
+        self.pending: set[str] = set()
+        self.seen: Counter[str] = Counter()
+        self.replayed = 0
+        self.recovered = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            records = self._read_records(path)
+            if not records or records[0].get("type") != "header":
+                raise SyncError(f"No journal to resume at {path}")
+            if any(r.get("type") == "complete" for r in records):
+                raise SyncError(f"Journal {path} already completed; run again without --resume")
+            previous = records[0]
+            for key in ("target", "model_hash"):
+                if previous.get(key) != header.get(key):
+                    raise SyncError(f"Journal {path} was written for a different {key}; run again without --resume")
+            self.header = previous
+            for record in records:
+                if record.get("type") == "done":
+                    self.done[record["op"]] = record.get("result")
+            self.pending = {r["op"] for r in records if r.get("type") == "planned"} - set(self.done)
+            self.fh = path.open("a", encoding="utf-8")
+            print(f"Resuming from journal {path} ({len(self.done)} completed calls, {len(self.pending)} interrupted)")
+        else:
+            records = self._read_records(path) if path.exists() else []
+            if records and not any(r.get("type") == "complete" for r in records):
+                print(f"WARN: discarding incomplete journal {path} (use --resume to continue it)")
+            self.fh = path.open("w", encoding="utf-8")
+            self._append({"type": "header", **header})
+
+    @staticmethod
+    def _read_records(path: Path) -> list[dict[str, Any]]:
+        records: list[dict[str, Any]] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A crash mid-write leaves at most one torn trailing line.
+                break
+        return records
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self.fh.write(json.dumps(record, sort_keys=True) + "\n")
+        self.fh.flush()
+
+    def call(
+        self,
+        args: list[str],
+        input_data: str | None,
+        invoke: Callable[[], Any],
+        recover: Callable[[], Any] | None = None,
+    ) -> Any:
+        digest = fingerprint(args, input_data)[:24]
+        kind, mutating = describe_gh_call(args, input_data)
+        with self._lock:
+            self.seen[digest] += 1
+            op = f"{digest}#{self.seen[digest]}"
+            if op in self.done:
+                self.replayed += 1
+                return self.done[op]
+            if mutating:
+                self._append({"type": "planned", "op": op, "kind": kind, "args": args})
+        if op in self.pending and recover is not None:
+            result = recover()
+            if result is not None:
+                with self._lock:
+                    self.recovered += 1
+                    self._append({"type": "done", "op": op, "kind": kind, "result": result, "recovered": True})
+                    self.done[op] = result
+                return result
+        try:
+            result = invoke()
+        except GraphQLError as exc:
+            if exc.data:
+                # Some aliases were applied; keep them for the record, but the
+                # op stays pending so a resume re-plans it from sync state.
+                with self._lock:
+                    self._append({"type": "partial", "op": op, "kind": kind, "result": {"data": exc.data}})
+            raise
+        with self._lock:
+            self._append({"type": "done", "op": op, "kind": kind, "result": result})
+            self.done[op] = result
+        return result
+
+    def complete(self) -> None:
+        self._append({"type": "complete", "finished_at": time.time()})
+        self.close()
+
+    def close(self) -> None:
+        if not self.fh.closed:
+            self.fh.close()
+
+
+GhTransport = Callable[[list[str], "str | None", float], "subprocess.CompletedProcess[str]"]
+
+
+def subprocess_transport(cmd: list[str], input_data: str | None, timeout: float) -> subprocess.CompletedProcess[str]:
+    """Run the real gh CLI. Stand-ins must raise the same exceptions."""
+    return subprocess.run(
+        cmd,
+        check=True,
+        text=True,
+        capture_output=True,
+        input=input_data,
+        timeout=timeout,
+    )
+
+
+class RecordingTransport:
+    """Wrap a transport and append every exchange to a JSONL session file.
+
+    Sessions can be replayed offline with `scripts/fake_github.py replay`.
+    """
+
+    def __init__(self, inner: GhTransport, path: Path) -> None:
+        self.inner = inner
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.fh = path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def __call__(self, cmd: list[str], input_data: str | None, timeout: float) -> subprocess.CompletedProcess[str]:
+        started = time.monotonic()
+        record: dict[str, Any] = {"cmd": cmd, "input": input_data}
+        try:
+            result = self.inner(cmd, input_data, timeout)
+        except subprocess.CalledProcessError as exc:
+            record.update(returncode=exc.returncode, stdout=exc.stdout or "", stderr=exc.stderr or "")
+            raise
+        except subprocess.TimeoutExpired:
+            record.update(timeout=True)
+            raise
+        else:
+            record.update(returncode=0, stdout=result.stdout, stderr=result.stderr or "")
+            return result
+        finally:
+            record["elapsed"] = round(time.monotonic() - started, 4)
+            with self._lock:
+                self.fh.write(json.dumps(record) + "\n")
+                self.fh.flush()
+
+
+_ACTIVE_TRANSPORT: ContextVar[GhTransport] = ContextVar("gh_transport", default=subprocess_transport)
+_ACTIVE_JOURNAL: ContextVar[Journal | None] = ContextVar("active_journal", default=None)
+
+
+def journal_path_for(target: str, directory: Path = DEFAULT_JOURNAL_DIR) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", target).strip("_")
+    return directory / f"{slug}.jsonl"
+
+
+@dataclass
+class RateBucket:
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None
+    calls_since_refresh: int = 0
+
+
+class RateLimiter:
+    """Client-side GitHub rate budget, tracked separately for REST and GraphQL.
+
+    `gh api` calls run with --include, so every response updates the bucket
+    named by its `X-RateLimit-Resource` header. `gh project`/`gh issue list`
+    calls expose no headers; they are charged one point against the GraphQL
+    estimate, which is re-read from the free `rate_limit` endpoint every
+    `refresh_every` calls or when it runs low.
+    """
+
+    def __init__(
+        self,
+        *,
+        reserve_fraction: float = 0.02,
+        pace_fraction: float = 0.2,
+        refresh_every: int = 50,
+        max_wait: float = 900.0,
+        secondary_wait: float = 60.0,
+    ) -> None:
+        self.buckets = {"core": RateBucket(), "graphql": RateBucket()}
+        self.reserve_fraction = reserve_fraction
+        self.pace_fraction = pace_fraction
+        self.refresh_every = refresh_every
+        self.max_wait = max_wait
+        self.secondary_wait = secondary_wait
+        self.slept = 0.0
+        self.sleeps = 0
+        self.last_refresh: float | None = None
+        # Concurrent callers share one budget, so pacing sleeps queue them all.
+        self._lock = threading.RLock()
+
+    def refresh(self) -> None:
+        self.last_refresh = time.time()
+        for bucket in self.buckets.values():
+            bucket.calls_since_refresh = 0
         try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                text=True,
-                capture_output=True,
-                input=input_data,
-                timeout=120,
+            result = _ACTIVE_TRANSPORT.get()(["gh", "api", "rate_limit"], None, 30)
+            resources = json.loads(result.stdout).get("resources", {})
+        except (subprocess.SubprocessError, json.JSONDecodeError, OSError):
+            return
+        for name, bucket in self.buckets.items():
+            info = resources.get(name)
+            if info:
+                bucket.limit = info.get("limit")
+                bucket.remaining = info.get("remaining")
+                bucket.reset_at = float(info.get("reset", 0)) or None
+
+    def observe(self, resource: str | None, headers: dict[str, str]) -> None:
+        with self._lock:
+            self._observe(resource, headers)
+
+    def _observe(self, resource: str | None, headers: dict[str, str]) -> None:
+        resource = headers.get("x-ratelimit-resource", resource)
+        bucket = self.buckets.get(resource or "")
+        if bucket is None or "x-ratelimit-remaining" not in headers:
+            self.charge(resource)
+            return
+        bucket.remaining = int(headers["x-ratelimit-remaining"])
+        if "x-ratelimit-limit" in headers:
+            bucket.limit = int(headers["x-ratelimit-limit"])
+        if "x-ratelimit-reset" in headers:
+            bucket.reset_at = float(headers["x-ratelimit-reset"])
+        bucket.calls_since_refresh = 0
+
+    def charge(self, resource: str | None, cost: int = 1) -> None:
+        bucket = self.buckets.get(resource or "")
+        if bucket is None:
+            return
+        with self._lock:
+            if bucket.remaining is not None:
+                bucket.remaining = max(0, bucket.remaining - cost)
+            bucket.calls_since_refresh += 1
+
+    def _sleep(self, seconds: float, reason: str) -> None:
+        if seconds <= 0:
+            return
+        if seconds > self.max_wait:
+            raise SyncError(f"{reason}: would need to wait {seconds:.0f}s (over --max-rate-wait {self.max_wait:.0f}s)")
+        print(f"  {reason}; sleeping {seconds:.1f}s", file=sys.stderr)
+        self.sleeps += 1
+        self.slept += seconds
+        time.sleep(seconds)
+
+    def before_call(self, resource: str | None) -> None:
+        with self._lock:
+            self._before_call(resource)
+
+    def _before_call(self, resource: str | None) -> None:
+        bucket = self.buckets.get(resource or "")
+        if bucket is None:
+            return
+        if (bucket.remaining is None and self.last_refresh is None) or bucket.calls_since_refresh >= self.refresh_every:
+            self.refresh()
+        if bucket.remaining is None or not bucket.limit or bucket.reset_at is None:
+            return
+        until_reset = max(0.0, bucket.reset_at - time.time()) + 1.0
+        if bucket.remaining <= bucket.limit * self.reserve_fraction:
+            self._sleep(until_reset, f"{resource} budget exhausted ({bucket.remaining} left)")
+            self.refresh()
+        elif bucket.remaining <= bucket.limit * self.pace_fraction:
+            # Spread what is left evenly over the rest of the window.
+            self._sleep(until_reset / max(bucket.remaining, 1), f"{resource} budget low ({bucket.remaining} left), pacing")
+
+    def retry_delay(
+        self,
+        resource: str | None,
+        *,
+        status: int | None,
+        headers: dict[str, str],
+        stderr: str,
+        attempt: int,
+    ) -> float | None:
+        """Seconds to wait before retrying a failed call, or None if it is not a rate limit."""
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+        if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            return max(0.0, float(headers["x-ratelimit-reset"]) - time.time()) + 1.0
+        text = stderr.lower()
+        throttled = (
+            status == 429
+            or "rate limit" in text
+            or "abuse" in text
+            or headers.get("x-ratelimit-remaining") == "0"
+        )
+        if not throttled:
+            # A 403 without any rate-limit signal is a permission error (e.g. a
+            # missing token scope); retrying it only delays the failure.
+            return None
+        if "secondary rate" in text or "abuse" in text:
+            # GitHub asks for at least a minute when no Retry-After is given.
+            return self.secondary_wait * (2 ** attempt)
+        self.refresh()
+        bucket = self.buckets.get(resource or "")
+        if bucket and bucket.remaining == 0 and bucket.reset_at:
+            return max(0.0, bucket.reset_at - time.time()) + 1.0
+        return self.secondary_wait * (2 ** attempt)
+
+    def wait(self, seconds: float, reason: str) -> None:
+        self._sleep(seconds, reason)
+
+    def summary(self) -> str:
+        parts: list[str] = []
+        for name, bucket in self.buckets.items():
+            if bucket.remaining is None:
+                parts.append(f"{name}=unknown")
+                continue
+            reset = time.strftime("%H:%M:%S", time.localtime(bucket.reset_at)) if bucket.reset_at else "?"
+            parts.append(f"{name}={bucket.remaining}/{bucket.limit} (resets {reset})")
+        if self.sleeps:
+            parts.append(f"throttled {self.sleeps}x for {self.slept:.1f}s")
+        return ", ".join(parts)
+
+
+_ACTIVE_LIMITER: ContextVar[RateLimiter | None] = ContextVar("active_limiter", default=None)
+_DEFAULT_LIMITER = RateLimiter()
+
+
+def current_rate_limiter() -> RateLimiter:
+    return _ACTIVE_LIMITER.get() or _DEFAULT_LIMITER
+
+
+def gh_resource(args: list[str]) -> str | None:
+    """Which GitHub rate bucket a gh invocation draws on."""
+    if args[:1] == ["api"]:
+        if len(args) > 1 and args[1] == "rate_limit":
+            return None
+        return "graphql" if len(args) > 1 and args[1] == "graphql" else "core"
+    if args[:1] == ["label"] and len(args) > 1 and args[1] in {"create", "edit", "delete"}:
+        return "core"
+    if args[:1] in (["project"], ["issue"], ["label"]):
+        return "graphql"
+    return None
+
+
+def split_http_response(raw: str) -> tuple[int | None, dict[str, str], str]:
+    """Split `gh api --include` output into (status, lowercased headers, body)."""
+    if not raw.startswith("HTTP/"):
+        return None, {}, raw
+    parts = re.split(r"\r?\n\r?\n", raw, maxsplit=1)
+    head = parts[0].splitlines()
+    body = parts[1] if len(parts) > 1 else ""
+    status_match = re.match(r"HTTP/\S+\s+(\d+)", head[0])
+    headers: dict[str, str] = {}
+    for line in head[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return (int(status_match.group(1)) if status_match else None), headers, body
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class SyncStats:
+    """Per-pass, per-operation accounting of gh calls for one sync run."""
+
+    def __init__(self) -> None:
+        self.phase = "setup"
+        self.entries: dict[tuple[str, str], dict[str, Any]] = {}
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_phase(self, name: str) -> None:
+        self.phase = name
+
+    def record(
+        self,
+        kind: str,
+        *,
+        latency: float,
+        bytes_sent: int,
+        bytes_received: int,
+        retries: int,
+        throttle_sleeps: int,
+        throttle_seconds: float,
+        failed: bool,
+    ) -> None:
+        with self._lock:
+            self._record(kind, latency, bytes_sent, bytes_received, retries, throttle_sleeps, throttle_seconds, failed)
+
+    def _record(
+        self,
+        kind: str,
+        latency: float,
+        bytes_sent: int,
+        bytes_received: int,
+        retries: int,
+        throttle_sleeps: int,
+        throttle_seconds: float,
+        failed: bool,
+    ) -> None:
+        entry = self.entries.setdefault(
+            (self.phase, kind),
+            {
+                "calls": 0,
+                "failures": 0,
+                "retries": 0,
+                "throttle_sleeps": 0,
+                "throttle_seconds": 0.0,
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "latencies": [],
+            },
+        )
+        entry["calls"] += 1
+        entry["failures"] += int(failed)
+        entry["retries"] += retries
+        entry["throttle_sleeps"] += throttle_sleeps
+        entry["throttle_seconds"] += throttle_seconds
+        entry["bytes_sent"] += bytes_sent
+        entry["bytes_received"] += bytes_received
+        entry["latencies"].append(latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        rows: list[dict[str, Any]] = []
+        for (phase, kind), entry in self.entries.items():
+            latencies = sorted(entry["latencies"])
+            rows.append(
+                {
+                    "phase": phase,
+                    "operation": kind,
+                    "calls": entry["calls"],
+                    "failures": entry["failures"],
+                    "retries": entry["retries"],
+                    "throttle_sleeps": entry["throttle_sleeps"],
+                    "throttle_seconds": round(entry["throttle_seconds"], 3),
+                    "bytes_sent": entry["bytes_sent"],
+                    "bytes_received": entry["bytes_received"],
+                    "latency_p50": round(percentile(latencies, 50), 4),
+                    "latency_p95": round(percentile(latencies, 95), 4),
+                    "latency_max": round(latencies[-1] if latencies else 0.0, 4),
+                    "latency_total": round(sum(latencies), 4),
+                }
+            )
+        return {
+            "elapsed_seconds": round(time.monotonic() - self.started, 3),
+            "total_calls": sum(row["calls"] for row in rows),
+            "rows": rows,
+        }
+
+    def report(self) -> str:
+        data = self.as_dict()
+        header = (
+            f"{'phase':<14} {'operation':<16} {'calls':>6} {'retry':>5} {'sleeps':>6} "
+            f"{'p50 s':>7} {'p95 s':>7} {'max s':>7} {'sent':>10} {'recv':>11}"
+        )
+        lines = [header]
+        for row in data["rows"]:
+            lines.append(
+                f"{row['phase']:<14} {row['operation']:<16} {row['calls']:>6} {row['retries']:>5} "
+                f"{row['throttle_sleeps']:>6} {row['latency_p50']:>7.3f} {row['latency_p95']:>7.3f} "
+                f"{row['latency_max']:>7.3f} {row['bytes_sent']:>10,} {row['bytes_received']:>11,}"
+            )
+        lines.append(f"Total gh calls: {data['total_calls']} in {data['elapsed_seconds']:.1f}s")
+        return "\n".join(lines)
+
+
+_ACTIVE_STATS: ContextVar[SyncStats | None] = ContextVar("active_stats", default=None)
+
+
+def set_phase(name: str) -> None:
+    stats = _ACTIVE_STATS.get()
+    if stats is not None:
+        stats.set_phase(name)
+
+
+def run_gh(
+    args: list[str],
+    expect_json: bool = False,
+    input_data: str | None = None,
+    retries: int = 3,
+    recover: Callable[[], Any] | None = None,
+) -> Any:
+    """Run one gh call, through the active journal if there is one.
+
+    `recover` finds the effect of a non-idempotent mutation that an
+    interrupted run may already have applied (see Journal).
+    """
+    journal = _ACTIVE_JOURNAL.get()
+    if journal is not None:
+        return journal.call(
+            args,
+            input_data,
+            lambda: _invoke_gh(args, expect_json=expect_json, input_data=input_data, retries=retries),
+            recover,
+        )
+    return _invoke_gh(args, expect_json=expect_json, input_data=input_data, retries=retries)
+
+
+def _invoke_gh(args: list[str], expect_json: bool = False, input_data: str | None = None, retries: int = 3) -> Any:
+    limiter = current_rate_limiter()
+    resource = gh_resource(args)
+    with_headers = args[:1] == ["api"] and resource is not None and "--include" not in args
+    cmd = ["gh", *args, *(["--include"] if with_headers else [])]
+    stats = _ACTIVE_STATS.get()
+    sleeps_before, slept_before = limiter.sleeps, limiter.slept
+    bytes_sent = len(" ".join(cmd)) + len(input_data or "")
+    bytes_received = 0
+    started = time.monotonic()
+
+    def _record(attempt: int, failed: bool) -> None:
+        if stats is not None:
+            stats.record(
+                describe_gh_call(args, input_data)[0],
+                latency=time.monotonic() - started - (limiter.slept - slept_before),
+                bytes_sent=bytes_sent * (attempt + 1),
+                bytes_received=bytes_received,
+                retries=attempt,
+                throttle_sleeps=limiter.sleeps - sleeps_before,
+                throttle_seconds=limiter.slept - slept_before,
+                failed=failed,
             )
+
+    for attempt in range(retries + 1):
+        limiter.before_call(resource)
+        try:
+            result = _ACTIVE_TRANSPORT.get()(cmd, input_data, 120)
         except subprocess.CalledProcessError as exc:
             stderr = (exc.stderr or "").strip()
-            is_rate_limit = "rate limit" in stderr.lower() or "secondary rate" in stderr.lower() or "abuse" in stderr.lower()
-            if is_rate_limit and attempt < retries:
-                wait = 2 ** attempt * 5  # 5s, 10s, 20s
-                print(f"  Rate limited, retrying in {wait}s (attempt {attempt + 1}/{retries})...", file=sys.stderr)
-                time.sleep(wait)
+            bytes_received += len(exc.stdout or "")
+            status, headers, body = split_http_response(exc.stdout or "")
+            if headers:
+                limiter.observe(resource, headers)
+            else:
+                limiter.charge(resource)
+            wait = limiter.retry_delay(resource, status=status, headers=headers, stderr=stderr, attempt=attempt)
+            if wait is not None and attempt < retries:
+                limiter.wait(wait, f"Rate limited (attempt {attempt + 1}/{retries})")
                 continue
+            _record(attempt, failed=True)
+            payload = graphql_error_payload(args, body)
+            if payload is not None:
+                # gh exits non-zero when any alias failed, but the others were applied.
+                raise GraphQLError(
+                    f"GraphQL error: {graphql_error_message(payload['errors'])}",
+                    data=payload.get("data"),
+                    errors=payload["errors"],
+                ) from exc
             raise SyncError(f"Command failed: {' '.join(cmd)}\n{stderr}") from exc
         except subprocess.TimeoutExpired as exc:
+            _record(attempt, failed=True)
             raise SyncError(f"Command timed out after 120s: {' '.join(cmd)}") from exc
-        out = result.stdout.strip()
+        out = result.stdout
+        bytes_received += len(out)
+        _record(attempt, failed=False)
+        if with_headers:
+            _, headers, out = split_http_response(out)
+            limiter.observe(resource, headers)
+        else:
+            limiter.charge(resource)
+        out = out.strip()
         if expect_json:
             if not out:
                 return {}
@@ -96,13 +928,77 @@ def run_gh(args: list[str], expect_json: bool = False, input_data: str | None =
         return out
 
 
-def gh_api(endpoint: str, *, method: str = "GET", payload: dict[str, Any] | None = None) -> Any:
+def gh_api(
+    endpoint: str,
+    *,
+    method: str = "GET",
+    payload: dict[str, Any] | None = None,
+    recover: Callable[[], Any] | None = None,
+) -> Any:
     args = ["api", endpoint, "-X", method]
     input_data = None
     if payload is not None:
         args.extend(["--input", "-"])
         input_data = json.dumps(payload)
-    return run_gh(args, expect_json=True, input_data=input_data)
+    return run_gh(args, expect_json=True, input_data=input_data, recover=recover)
+
+
+def gh_api_pages(endpoint: str, per_page: int = 100) -> list[Any]:
+    """GET every page of a REST collection."""
+    separator = "&" if "?" in endpoint else "?"
+    rows: list[Any] = []
+    page = 1
+    while True:
+        batch = run_gh(["api", f"{endpoint}{separator}per_page={per_page}&page={page}"], expect_json=True) or []
+        rows.extend(batch)
+        if len(batch) < per_page:
+            return rows
+        page += 1
+
+
+def run_concurrently(tasks: list[Callable[[], Any]], workers: int) -> list[Any]:
+    """Run gh-calling tasks on a thread pool, each in a copy of the caller's context.
+
+    The copies share the active journal, rate limiter and stats, so every
+    call is still journaled, paced and counted.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def graphql_error_payload(args: list[str], body: str) -> dict[str, Any] | None:
+    """The JSON body of a failed `gh api graphql` call, if it carries GraphQL errors."""
+    if args[:2] != ["api", "graphql"] or not body.strip():
+        return None
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) and payload.get("errors") else None
+
+
+def graphql_error_message(errors: list[Any]) -> str:
+    first = errors[0] if errors else {}
+    return first.get("message", str(errors)) if isinstance(first, dict) else str(first)
+
+
+def graphql(
+    query: str,
+    variables: dict[str, Any] | None = None,
+    *,
+    recover: Callable[[], Any] | None = None,
+) -> dict[str, Any]:
+    payload = gh_api("graphql", method="POST", payload={"query": query, "variables": variables or {}}, recover=recover)
+    if payload.get("errors"):
+        raise GraphQLError(
+            f"GraphQL error: {graphql_error_message(payload['errors'])}",
+            data=payload.get("data"),
+            errors=payload["errors"],
+        )
+    return payload.get("data") or {}
 
 
 def load_model(path: Path) -> dict[str, Any]:
@@ -110,6 +1006,21 @@ def load_model(path: Path) -> dict[str, Any]:
         return json.load(f)
 
 
+def load_model_at_revision(path: Path, rev: str) -> dict[str, Any]:
+    """Load the roadmap model as it was at a git revision."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(path.resolve().parent), "show", f"{rev}:./{path.name}"],
+            check=True,
+            text=True,
+            capture_output=True,
+            timeout=60,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise SyncError(f"Cannot read {path.name} at {rev}: {(exc.stderr or '').strip()}") from exc
+    return json.loads(result.stdout)
+
+
 def get_project_meta(
     owner: str,
     number: int,
@@ -117,7 +1028,14 @@ def get_project_meta(
     apply: bool,
     ensure_fields: bool = False,
     blocked_by_field_name: str = BLOCKED_BY_FIELD_NAME,
+    state: SyncState | None = None,
+    ttl_seconds: float = DEFAULT_META_TTL_SECONDS,
 ) -> tuple[str, dict[str, FieldInfo]]:
+    if state is not None:
+        cached = state.cached_project_meta(ttl_seconds)
+        if cached and (not ensure_fields or blocked_by_field_name in cached[1]):
+            return cached
+
     project = run_gh(
         ["project", "view", str(number), "--owner", owner, "--format", "json"],
         expect_json=True,
@@ -130,12 +1048,12 @@ def get_project_meta(
             expect_json=True,
         )
         parsed: dict[str, FieldInfo] = {}
-        for field in fields_raw.get("fields", []):
-            name = field["name"]
+        for raw_field in fields_raw.get("fields", []):
+            name = raw_field["name"]
             options: dict[str, str] = {}
-            for opt in field.get("options", []):
+            for opt in raw_field.get("options", []):
                 options[opt["name"]] = opt["id"]
-            parsed[name] = FieldInfo(id=field["id"], options=options, field_type=field["type"])
+            parsed[name] = FieldInfo(id=raw_field["id"], options=options, field_type=raw_field["type"])
         return parsed
 
     fields = _load_fields()
@@ -165,12 +1083,15 @@ def get_project_meta(
             )
             fields = _load_fields()
 
+    if state is not None and (blocked_by_field_name in fields or not ensure_fields):
+        state.store_project_meta(project_id, fields)
     return project_id, fields
 
 
-def list_items(owner: str, number: int) -> list[dict[str, Any]]:
+def list_items(owner: str, number: int, limit: int = 10000) -> list[dict[str, Any]]:
+    # gh defaults to the first 30 items, which hides most of a real board.
     payload = run_gh(
-        ["project", "item-list", str(number), "--owner", owner, "--format", "json"],
+        ["project", "item-list", str(number), "--owner", owner, "--limit", str(limit), "--format", "json"],
         expect_json=True,
     )
     return payload.get("items", [])
@@ -266,6 +1187,25 @@ def managed_marker(node_id: str) -> str:
     return f"{MANAGED_MARKER_PREFIX}{node_id} -->"
 
 
+def body_content_hash(body: str) -> str:
+    """Hash of a managed body, ignoring its own content-hash marker line."""
+    content = re.sub(
+        rf"^{re.escape(CONTENT_HASH_MARKER_PREFIX)}[0-9a-f]+ -->\n", "", (body or "").replace("\r\n", "\n"), flags=re.M
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def extract_content_hash(body: str) -> str | None:
+    match = re.search(rf"{re.escape(CONTENT_HASH_MARKER_PREFIX)}([0-9a-f]+) -->", body or "")
+    return match.group(1) if match else None
+
+
+def verified_content_hash(body: str) -> str | None:
+    """The embedded hash, if the body still matches it (i.e. nobody hand-edited it)."""
+    embedded = extract_content_hash(body)
+    return embedded if embedded and embedded == body_content_hash(body) else None
+
+
 def make_body(
     model: dict[str, Any],
     node: dict[str, Any],
@@ -331,6 +1271,9 @@ def make_body(
             lines.append(f"- {src}")
         lines.append("")
     lines.append("Generated by `scripts/sync_roadmap_to_github_project.py`.")
+    # The hash sits next to the node-id marker so a listing that knows an
+    # issue's hash never needs the body to tell whether it is current.
+    lines.insert(1, f"{CONTENT_HASH_MARKER_PREFIX}{body_content_hash(chr(10).join(lines))} -->")
     return "\n".join(lines)
 
 
@@ -454,17 +1397,19 @@ def edit_text(
     )
 
 
-def apply_project_fields(
+def desired_field_values(
     *,
-    apply: bool,
-    project_id: str,
     fields: dict[str, FieldInfo],
-    item_id: str,
     model: dict[str, Any],
     node: dict[str, Any],
     blocked_by_text: str | None,
     blocked_by_field_name: str,
-) -> None:
+) -> dict[str, str]:
+    """Project field values for a node, keyed by field name.
+
+    Single-select fields map to option ids; date and text fields map to their
+    value, with "" meaning the field should be cleared.
+    """
     status_name = map_status(node.get("status", "planned"))
     priority_name = map_priority(node.get("priority", "P2"))
     status_option_id = fields["Status"].options.get(status_name)
@@ -474,52 +1419,180 @@ def apply_project_fields(
     if not priority_option_id:
         raise SyncError(f"Project Priority option missing: {priority_name}")
 
-    edit_single_select(
-        apply=apply,
-        project_id=project_id,
-        item_id=item_id,
-        field_id=fields["Status"].id,
-        option_id=status_option_id,
-        label="Status",
-    )
-    edit_single_select(
-        apply=apply,
-        project_id=project_id,
-        item_id=item_id,
-        field_id=fields["Priority"].id,
-        option_id=priority_option_id,
-        label="Priority",
-    )
+    values = {"Status": status_option_id, "Priority": priority_option_id}
     if "Start date" in fields:
-        edit_date(
-            apply=apply,
-            project_id=project_id,
-            item_id=item_id,
-            field_id=fields["Start date"].id,
-            date_value=node_start_date(model, node),
-            label="Start date",
-        )
-    edit_date(
-        apply=apply,
-        project_id=project_id,
-        item_id=item_id,
-        field_id=fields["Target date"].id,
-        date_value=node_target_date(model, node),
-        label="Target date",
+        values["Start date"] = node_start_date(model, node) or ""
+    values["Target date"] = node_target_date(model, node) or ""
+    if blocked_by_field_name in fields:
+        values[blocked_by_field_name] = blocked_by_text or ""
+    return values
+
+
+def apply_project_fields(
+    *,
+    apply: bool,
+    project_id: str,
+    fields: dict[str, FieldInfo],
+    item_id: str,
+    model: dict[str, Any],
+    node: dict[str, Any],
+    blocked_by_text: str | None,
+    blocked_by_field_name: str,
+    current_values: dict[str, str] | None = None,
+) -> dict[str, str]:
+    """Set project fields on an item and return the values now in place.
+
+    When `current_values` (from sync state) is given, fields already holding
+    the desired value are left alone.
+    """
+    values = desired_field_values(
+        fields=fields,
+        model=model,
+        node=node,
+        blocked_by_text=blocked_by_text,
+        blocked_by_field_name=blocked_by_field_name,
     )
-    blocked_by_field = fields.get(blocked_by_field_name)
-    if blocked_by_field:
-        edit_text(
-            apply=apply,
-            project_id=project_id,
-            item_id=item_id,
-            field_id=blocked_by_field.id,
-            text_value=blocked_by_text,
-            label=blocked_by_field_name,
-        )
+    for name, value in values.items():
+        if current_values is not None and current_values.get(name) == value:
+            continue
+        field_info = fields[name]
+        if name in ("Status", "Priority"):
+            edit_single_select(
+                apply=apply,
+                project_id=project_id,
+                item_id=item_id,
+                field_id=field_info.id,
+                option_id=value,
+                label=name,
+            )
+        elif name == blocked_by_field_name:
+            edit_text(
+                apply=apply,
+                project_id=project_id,
+                item_id=item_id,
+                field_id=field_info.id,
+                text_value=value or None,
+                label=name,
+            )
+        else:
+            edit_date(
+                apply=apply,
+                project_id=project_id,
+                item_id=item_id,
+                field_id=field_info.id,
+                date_value=value or None,
+                label=name,
+            )
+    return values
+
+
+REPO_ISSUES_QUERY = """
+query RoadmapRepoIssues($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state url updatedAt
+        labels(first: 50) { nodes { name } }
+        milestone { title }
+      }
+    }
+  }
+}
+"""
 
 
 def list_repo_issues(repo: str) -> dict[str, IssueInfo]:
+    """Managed issues by node id, without bodies (see fetch_issue_bodies).
+
+    Issues are matched by their `SR:<node_id>` title; `updated_at` lets the
+    caller reuse the content hash recorded in sync state. Issues whose title
+    is not a managed one (e.g. edited by hand) have their bodies fetched and
+    are matched by the `roadmap-node-id` marker, as backfill_github_urls.py
+    does. Where several issues claim a node, the newest wins.
+    """
+    owner_login, name = repo.split("/", 1)
+    matched: list[tuple[int, str, IssueInfo]] = []
+    unmanaged_titles: list[IssueInfo] = []
+    cursor: str | None = None
+    while True:
+        data = graphql(REPO_ISSUES_QUERY, {"owner": owner_login, "name": name, "cursor": cursor})
+        page = (data.get("repository") or {}).get("issues") or {}
+        for issue in page.get("nodes") or []:
+            node_id = extract_managed_node_id(issue.get("title", ""))
+            milestone = issue.get("milestone")
+            info = IssueInfo(
+                number=issue["number"],
+                title=issue.get("title", ""),
+                body="",
+                state=issue.get("state", "OPEN"),
+                labels={label["name"] for label in (issue.get("labels") or {}).get("nodes", []) if label.get("name")},
+                milestone_title=milestone.get("title") if milestone else None,
+                url=issue.get("url", ""),
+                updated_at=issue.get("updatedAt"),
+            )
+            if node_id:
+                matched.append((info.number, node_id, info))
+            else:
+                unmanaged_titles.append(info)
+        page_info = page.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
+    if unmanaged_titles:
+        fetch_issue_bodies(repo, unmanaged_titles)
+        for info in unmanaged_titles:
+            node_id = extract_node_id_from_marker(info.body)
+            if node_id:
+                matched.append((info.number, node_id, info))
+    by_node_id: dict[str, IssueInfo] = {}
+    for _, node_id, info in sorted(matched, key=lambda entry: entry[0]):
+        by_node_id[node_id] = info
+    return by_node_id
+
+
+def fetch_issue_bodies(repo: str, issues: list[IssueInfo], batch_size: int = 50) -> None:
+    """Fill in body and verified content hash for issues, `batch_size` per GraphQL query."""
+    owner_login, name = repo.split("/", 1)
+    for start in range(0, len(issues), batch_size):
+        batch = issues[start : start + batch_size]
+        selections = " ".join(f"i{issue.number}: issue(number: {issue.number}) {{ body updatedAt }}" for issue in batch)
+        data = graphql(
+            f"query RoadmapIssueBodies($owner: String!, $name: String!) "
+            f"{{ repository(owner: $owner, name: $name) {{ {selections} }} }}",
+            {"owner": owner_login, "name": name},
+        )
+        repository = data.get("repository") or {}
+        for issue in batch:
+            fetched = repository.get(f"i{issue.number}") or {}
+            issue.body = fetched.get("body") or ""
+            issue.updated_at = fetched.get("updatedAt") or issue.updated_at
+            issue.content_hash = verified_content_hash(issue.body)
+
+
+def _issue_from_listing(issue: dict[str, Any]) -> tuple[str, IssueInfo] | None:
+    title = issue.get("title", "")
+    body = issue.get("body", "") or ""
+    node_id = extract_node_id_from_marker(body) or extract_managed_node_id(title)
+    if not node_id:
+        return None
+    labels = {label.get("name", "") for label in issue.get("labels", []) if label.get("name")}
+    milestone = issue.get("milestone")
+    milestone_title = milestone.get("title") if milestone else None
+    return node_id, IssueInfo(
+        number=issue["number"],
+        title=title,
+        body=body,
+        state=issue.get("state", "OPEN"),
+        labels=labels,
+        milestone_title=milestone_title,
+        url=issue.get("url", ""),
+        content_hash=verified_content_hash(body),
+    )
+
+
+def find_issue_for_node(repo: str, node_id: str) -> IssueInfo | None:
+    """Look up one node's managed issue by marker or title (used when nothing local knows it)."""
     payload = run_gh(
         [
             "issue",
@@ -529,42 +1602,59 @@ def list_repo_issues(repo: str) -> dict[str, IssueInfo]:
             "--state",
             "all",
             "--limit",
-            "500",
+            "5",
             "--search",
-            "SR:",
+            f'"{node_id}" in:title,body',
             "--json",
             "number,title,body,state,labels,milestone,url",
         ],
         expect_json=True,
     )
-    by_node_id: dict[str, IssueInfo] = {}
     for issue in payload:
-        title = issue.get("title", "")
-        body = issue.get("body", "") or ""
-        node_id = extract_node_id_from_marker(body) or extract_managed_node_id(title)
-        if not node_id:
+        parsed = _issue_from_listing(issue)
+        if parsed and parsed[0] == node_id:
+            return parsed[1]
+    return None
+
+
+def find_created_issue(repo: str, title: str, node_id: str) -> dict[str, Any] | None:
+    """The issue an interrupted run created for a node, if it got that far.
+
+    Scans the newest issues over REST rather than searching, because the
+    search index lags behind a create by up to a minute.
+    """
+    recent = run_gh(["api", f"repos/{repo}/issues?state=all&sort=created&direction=desc&per_page=100"], expect_json=True)
+    for issue in recent or []:
+        if "pull_request" in issue:
             continue
-        labels = {label.get("name", "") for label in issue.get("labels", []) if label.get("name")}
-        milestone = issue.get("milestone")
-        milestone_title = milestone.get("title") if milestone else None
-        by_node_id[node_id] = IssueInfo(
-            number=issue["number"],
-            title=title,
-            body=body,
-            state=issue.get("state", "OPEN"),
-            labels=labels,
-            milestone_title=milestone_title,
-            url=issue.get("url", ""),
-        )
-    return by_node_id
+        if issue.get("title") == title or extract_node_id_from_marker(issue.get("body") or "") == node_id:
+            print(f"Recovered issue #{issue['number']} created by the interrupted run for {node_id}")
+            return issue
+    return None
 
 
-def list_repo_labels(repo: str) -> set[str]:
-    labels = run_gh(
-        ["label", "list", "--repo", repo, "--limit", "500", "--json", "name"],
-        expect_json=True,
+def get_issue(repo: str, number: int) -> IssueInfo:
+    """Fetch a single issue by number (used when sync state says it changed)."""
+    issue = gh_api(f"repos/{repo}/issues/{number}")
+    milestone = issue.get("milestone")
+    return IssueInfo(
+        number=issue["number"],
+        title=issue.get("title", ""),
+        body=issue.get("body", "") or "",
+        state=(issue.get("state") or "open").upper(),
+        labels={label["name"] for label in issue.get("labels", []) if label.get("name")},
+        milestone_title=milestone.get("title") if milestone else None,
+        url=issue.get("html_url", ""),
+        updated_at=issue.get("updated_at"),
+        content_hash=verified_content_hash(issue.get("body") or ""),
     )
-    return {x["name"] for x in labels}
+
+
+def list_repo_labels(repo: str) -> dict[str, dict[str, str]]:
+    return {
+        label["name"]: {"color": (label.get("color") or "").lower(), "description": label.get("description") or ""}
+        for label in gh_api_pages(f"repos/{repo}/labels")
+    }
 
 
 def label_color(name: str) -> str:
@@ -597,26 +1687,58 @@ def label_color(name: str) -> str:
     return "6E7781"
 
 
-def ensure_repo_labels(*, apply: bool, repo: str, names: set[str]) -> None:
+def desired_label_specs(names: set[str]) -> dict[str, dict[str, str]]:
+    return {
+        name: {"color": label_color(name).lower(), "description": f"{MANAGED_LABEL_DESCRIPTION} ({name})"}
+        for name in sorted(names)
+    }
+
+
+def reconcile_repo_labels(
+    *,
+    apply: bool,
+    repo: str,
+    names: set[str],
+    prune: bool = False,
+    workers: int = DEFAULT_RECONCILE_WORKERS,
+) -> None:
+    """Create missing managed labels, fix colour/description drift, delete unused ones.
+
+    Only labels carrying the managed description are ever deleted, and only
+    with `prune` (--archive-stale).
+    """
+    desired = desired_label_specs(names)
     existing = list_repo_labels(repo)
-    missing = sorted(names - existing)
-    for name in missing:
+    create = [name for name in desired if name not in existing]
+    update = [name for name in desired if name in existing and existing[name] != desired[name]]
+    delete = sorted(
+        name
+        for name, info in existing.items()
+        if name not in desired and is_managed_label(name) and info["description"].startswith(MANAGED_LABEL_DESCRIPTION)
+    )
+    print(f"Labels: {len(create)} to create, {len(update)} to update, {len(delete)} unused")
+
+    tasks: list[Callable[[], Any]] = []
+    for name in create:
         if not apply:
             print(f"DRY-RUN: create label '{name}' in {repo}")
             continue
-        run_gh(
-            [
-                "label",
-                "create",
-                name,
-                "--repo",
-                repo,
-                "--color",
-                label_color(name),
-                "--description",
-                f"Managed by semantic roadmap sync ({name})",
-            ]
+        tasks.append(lambda name=name: gh_api(f"repos/{repo}/labels", method="POST", payload={"name": name, **desired[name]}))
+    for name in update:
+        if not apply:
+            print(f"DRY-RUN: update label '{name}' -> color={desired[name]['color']}")
+            continue
+        tasks.append(
+            lambda name=name: gh_api(f"repos/{repo}/labels/{quote(name, safe='')}", method="PATCH", payload=desired[name])
         )
+    for name in delete:
+        if not prune:
+            print(f"Leave unused label untouched: {name}")
+        elif not apply:
+            print(f"DRY-RUN: delete label '{name}'")
+        else:
+            tasks.append(lambda name=name: gh_api(f"repos/{repo}/labels/{quote(name, safe='')}", method="DELETE"))
+    run_concurrently(tasks, workers)
 
 
 def managed_label_names(node: dict[str, Any]) -> set[str]:
@@ -648,12 +1770,8 @@ def is_managed_label(label: str) -> bool:
 
 
 def list_repo_milestones(repo: str) -> dict[str, RepoMilestone]:
-    payload = run_gh(
-        ["api", f"repos/{repo}/milestones?state=all&per_page=100"],
-        expect_json=True,
-    )
     by_title: dict[str, RepoMilestone] = {}
-    for ms in payload:
+    for ms in gh_api_pages(f"repos/{repo}/milestones?state=all"):
         by_title[ms["title"]] = RepoMilestone(
             number=ms["number"],
             title=ms["title"],
@@ -663,55 +1781,99 @@ def list_repo_milestones(repo: str) -> dict[str, RepoMilestone]:
     return by_title
 
 
-def ensure_repo_milestones(
+def desired_milestone_specs(milestone_nodes: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    specs: dict[str, dict[str, Any]] = {}
+    for node in sorted(milestone_nodes.values(), key=node_sort_key):
+        due_iso = node.get("due_date")
+        specs[node["title"]] = {
+            "due_on": f"{due_iso}T00:00:00Z" if due_iso else None,
+            "description": (node.get("summary") or "")[:1024],
+        }
+    return specs
+
+
+def reconcile_repo_milestones(
     *,
     apply: bool,
     repo: str,
     milestone_nodes: dict[str, dict[str, Any]],
+    previous_titles: set[str] | None = None,
+    prune: bool = False,
+    workers: int = DEFAULT_RECONCILE_WORKERS,
 ) -> dict[str, RepoMilestone]:
-    existing = list_repo_milestones(repo)
-    out = dict(existing)
-    for node in sorted(milestone_nodes.values(), key=node_sort_key):
-        title = node["title"]
-        due_iso = node.get("due_date")
-        due_ts = f"{due_iso}T00:00:00Z" if due_iso else None
-        if title not in out:
-            if not apply:
-                print(f"DRY-RUN: create repo milestone '{title}' due={due_ts or 'none'}")
-                out[title] = RepoMilestone(number=-1, title=title, due_on=due_ts, description=node.get("summary"))
-            else:
-                payload: dict[str, Any] = {
-                    "title": title,
-                    "description": node.get("summary", "")[:1024],
-                }
-                if due_ts:
-                    payload["due_on"] = due_ts
-                created = gh_api(f"repos/{repo}/milestones", method="POST", payload=payload)
-                out[title] = RepoMilestone(
-                    number=created["number"],
-                    title=created["title"],
-                    due_on=created.get("due_on"),
-                    description=created.get("description"),
-                )
-                print(f"Created repo milestone '{title}' (#{created['number']})")
+    """Bring repo milestones in line with milestone nodes; returns them by title.
+
+    Due dates compare by day, since GitHub stores `due_on` shifted into the
+    repository's timezone. Milestones are deleted only with `prune` and only
+    when a previous sync managed that title (`previous_titles`).
+    """
+    desired = desired_milestone_specs(milestone_nodes)
+    out = list_repo_milestones(repo)
+    create = [title for title in desired if title not in out]
+    update = [
+        title
+        for title in desired
+        if title in out
+        and (
+            (out[title].due_on or "")[:10] != (desired[title]["due_on"] or "")[:10]
+            or (out[title].description or "") != desired[title]["description"]
+        )
+    ]
+    delete = sorted(title for title in (previous_titles or set()) if title in out and title not in desired)
+    print(f"Milestones: {len(create)} to create, {len(update)} to update, {len(delete)} unused")
+    print_lock = threading.Lock()
+
+    def report(message: str) -> None:
+        # Workers share stdout; print() writes the text and newline separately.
+        with print_lock:
+            print(message)
+
+    def _create(title: str) -> None:
+        payload: dict[str, Any] = {"title": title, "description": desired[title]["description"]}
+        if desired[title]["due_on"]:
+            payload["due_on"] = desired[title]["due_on"]
+        created = gh_api(f"repos/{repo}/milestones", method="POST", payload=payload)
+        out[title] = RepoMilestone(
+            number=created["number"],
+            title=created["title"],
+            due_on=created.get("due_on"),
+            description=created.get("description"),
+        )
+        report(f"Created repo milestone '{title}' (#{created['number']})")
+
+    def _update(title: str) -> None:
+        number = out[title].number
+        gh_api(f"repos/{repo}/milestones/{number}", method="PATCH", payload=desired[title])
+        report(f"Updated milestone '{title}' -> due {desired[title]['due_on'] or 'none'}")
+        out[title] = RepoMilestone(number=number, title=title, **desired[title])
+
+    def _delete(title: str) -> None:
+        gh_api(f"repos/{repo}/milestones/{out[title].number}", method="DELETE")
+        report(f"Deleted unused milestone '{title}'")
+
+    tasks: list[Callable[[], Any]] = []
+    for title in create:
+        if apply:
+            tasks.append(lambda title=title: _create(title))
         else:
-            existing_ms = out[title]
-            if apply and existing_ms.number > 0 and existing_ms.due_on != due_ts:
-                patch_payload: dict[str, Any] = {}
-                if due_ts:
-                    patch_payload["due_on"] = due_ts
-                else:
-                    patch_payload["due_on"] = None
-                gh_api(f"repos/{repo}/milestones/{existing_ms.number}", method="PATCH", payload=patch_payload)
-                print(f"Updated milestone due date '{title}' -> {due_ts or 'none'}")
-                out[title] = RepoMilestone(
-                    number=existing_ms.number,
-                    title=existing_ms.title,
-                    due_on=due_ts,
-                    description=existing_ms.description,
-                )
-            elif not apply and existing_ms.due_on != due_ts:
-                print(f"DRY-RUN: update milestone due date '{title}' -> {due_ts or 'none'}")
+            print(f"DRY-RUN: create repo milestone '{title}' due={desired[title]['due_on'] or 'none'}")
+            out[title] = RepoMilestone(number=-1, title=title, **desired[title])
+    for title in update:
+        if apply:
+            tasks.append(lambda title=title: _update(title))
+        else:
+            print(f"DRY-RUN: update milestone '{title}' -> due {desired[title]['due_on'] or 'none'}")
+    for title in delete:
+        if not prune:
+            print(f"Leave unused milestone untouched: {title}")
+        elif not apply:
+            print(f"DRY-RUN: delete milestone '{title}'")
+        else:
+            tasks.append(lambda title=title: _delete(title))
+    run_concurrently(tasks, workers)
+    if prune and apply:
+        for title in delete:
+            out.pop(title, None)
     return out
 
 
@@ -739,17 +1901,14 @@ def upsert_issue(
     *,
     apply: bool,
     repo: str,
-    model: dict[str, Any],
     node: dict[str, Any],
+    body: str,
     existing_issue: IssueInfo | None,
-    dependency_refs: list[str],
-    delivers_refs: list[str],
     desired_labels: set[str],
     milestone: RepoMilestone | None,
-    extra_sections: dict[str, list[str]] | None = None,
 ) -> IssueInfo:
     title = desired_title(node)
-    body = make_body(model, node, dependency_refs=dependency_refs, delivers_refs=delivers_refs, extra_sections=extra_sections)
+    content_hash = extract_content_hash(body)
     current = existing_issue
     if current is None:
         if not apply:
@@ -762,13 +1921,19 @@ def upsert_issue(
                 labels=set(desired_labels),
                 milestone_title=milestone.title if milestone else None,
                 url=f"https://github.com/{repo}/issues/dry-run-{node['id']}",
+                content_hash=content_hash,
             )
         payload: dict[str, Any] = {"title": title, "body": body}
         if milestone and milestone.number > 0:
             payload["milestone"] = milestone.number
         if desired_labels:
             payload["labels"] = sorted(desired_labels)
-        created = gh_api(f"repos/{repo}/issues", method="POST", payload=payload)
+        created = gh_api(
+            f"repos/{repo}/issues",
+            method="POST",
+            payload=payload,
+            recover=lambda: find_created_issue(repo, title, node["id"]),
+        )
         print(f"Created issue #{created['number']} for {node['id']}")
         return IssueInfo(
             number=created["number"],
@@ -778,6 +1943,8 @@ def upsert_issue(
             labels=set(desired_labels),
             milestone_title=milestone.title if milestone else None,
             url=created["html_url"],
+            updated_at=created.get("updated_at"),
+            content_hash=content_hash,
         )
 
     labels_without_managed = {name for name in current.labels if not is_managed_label(name)}
@@ -785,9 +1952,10 @@ def upsert_issue(
     target_milestone_num = milestone.number if milestone and milestone.number > 0 else None
     target_milestone_title = milestone.title if milestone else None
 
+    current_hash = current.content_hash if current.content_hash is not None else verified_content_hash(current.body)
     changed = (
         current.title != title
-        or current.body != body
+        or current_hash != content_hash
         or set(final_labels) != current.labels
         or current.milestone_title != target_milestone_title
     )
@@ -804,6 +1972,7 @@ def upsert_issue(
             labels=set(final_labels),
             milestone_title=target_milestone_title,
             url=current.url,
+            content_hash=content_hash,
         )
 
     payload: dict[str, Any] = {
@@ -822,6 +1991,8 @@ def upsert_issue(
         labels=set(label["name"] for label in updated.get("labels", [])),
         milestone_title=updated.get("milestone", {}).get("title") if updated.get("milestone") else None,
         url=updated["html_url"],
+        updated_at=updated.get("updated_at"),
+        content_hash=content_hash,
     )
 
 
@@ -857,54 +2028,319 @@ def add_issue_to_project_if_needed(
     return item_id
 
 
-def upsert_draft_item(
+DRAFT_ITEM_FIELDS = "projectItem { id content { ... on DraftIssue { id } } }"
+
+
+def apply_draft_mutations(
+    project_id: str,
+    ops: list[dict[str, Any]],
     *,
-    apply: bool,
-    owner: str,
-    project_number: int,
-    model: dict[str, Any],
-    node: dict[str, Any],
-    existing_item: dict[str, Any] | None,
-) -> str:
-    target_title = desired_title(node)
-    body = make_body(model, node)
-    if existing_item:
-        item_id = existing_item["id"]
-        draft_content_id = existing_item.get("content", {}).get("id")
-        current_title = existing_item.get("title", "")
-        if current_title != target_title:
-            if not draft_content_id:
-                print(f"WARN: cannot update title for non-draft item {item_id}")
-            elif not apply:
-                print(f"DRY-RUN: update title {draft_content_id}: '{current_title}' -> '{target_title}'")
+    batch_size: int = DEFAULT_DRAFT_BATCH_SIZE,
+) -> list[tuple[str | None, str | None]]:
+    """Create or update draft issues (title and body together), `batch_size` per request.
+
+    Each op is {"title", "body", "draft_id"}; a None draft_id creates a new
+    draft item. Returns (item id, draft id) per op; item id is None for
+    updates. The gh CLI cannot do body-only draft edits, so this talks to
+    GraphQL directly.
+
+    If a batch fails part-way, PartialBatchError carries the results of every
+    op applied so far (item id None where a create failed), so the caller can
+    record the drafts that were created before giving up.
+    """
+    results: list[tuple[str | None, str | None]] = []
+    for start in range(0, len(ops), batch_size):
+        batch = ops[start : start + batch_size]
+        declarations: list[str] = []
+        selections: list[str] = []
+        variables: dict[str, Any] = {}
+        for i, op in enumerate(batch):
+            declarations += [f"$t{i}: String!", f"$b{i}: String!"]
+            variables[f"t{i}"] = op["title"]
+            variables[f"b{i}"] = op["body"]
+            if op.get("draft_id"):
+                declarations.append(f"$d{i}: ID!")
+                variables[f"d{i}"] = op["draft_id"]
+                selections.append(
+                    f"m{i}: updateProjectV2DraftIssue(input: {{draftIssueId: $d{i}, title: $t{i}, body: $b{i}}}) "
+                    "{ draftIssue { id } }"
+                )
             else:
-                run_gh(["project", "item-edit", "--id", draft_content_id, "--title", target_title])
-        # NOTE: gh CLI currently fails on body-only updates for draft issues
-        # ("Title can't be blank"), so body is set on create and left unchanged
-        # on update.
-        return item_id
-    if not apply:
-        print(f"DRY-RUN: create draft item '{target_title}'")
-        return f"dry-run:{node['id']}"
-    created = run_gh(
-        [
-            "project",
-            "item-create",
-            str(project_number),
-            "--owner",
-            owner,
-            "--title",
-            target_title,
-            "--body",
-            body,
-            "--format",
-            "json",
-        ],
-        expect_json=True,
-    )
-    item_id = created["id"]
-    print(f"Created draft: {target_title} ({item_id})")
-    return item_id
+                selections.append(
+                    f"m{i}: addProjectV2DraftIssue(input: {{projectId: $project, title: $t{i}, body: $b{i}}}) "
+                    f"{{ {DRAFT_ITEM_FIELDS} }}"
+                )
+        if any(not op.get("draft_id") for op in batch):
+            declarations.insert(0, "$project: ID!")
+            variables["project"] = project_id
+        failure: GraphQLError | None = None
+        try:
+            data = graphql(
+                f"mutation RoadmapDraftBatch({', '.join(declarations)}) {{ {' '.join(selections)} }}",
+                variables,
+                recover=lambda batch=batch: find_created_drafts(project_id, batch),
+            )
+        except GraphQLError as exc:
+            failure, data = exc, exc.data
+        for i, op in enumerate(batch):
+            result = data.get(f"m{i}") or {}
+            if op.get("draft_id"):
+                results.append((None, op["draft_id"] if result else None))
+            else:
+                item = result.get("projectItem") or {}
+                results.append((item.get("id"), (item.get("content") or {}).get("id")))
+        if failure is not None:
+            raise PartialBatchError(str(failure), results) from failure
+    return results
+
+
+def resolve_draft_ids(item_ids: list[str], *, batch_size: int = 50) -> dict[str, str]:
+    """Draft issue ids behind project items (for state written before they were recorded)."""
+    out: dict[str, str] = {}
+    for start in range(0, len(item_ids), batch_size):
+        batch = item_ids[start : start + batch_size]
+        declarations = ", ".join(f"$i{i}: ID!" for i in range(len(batch)))
+        selections = " ".join(
+            f"i{i}: node(id: $i{i}) {{ ... on ProjectV2Item {{ content {{ ... on DraftIssue {{ id }} }} }} }}"
+            for i in range(len(batch))
+        )
+        data = graphql(
+            f"query RoadmapDraftIds({declarations}) {{ {selections} }}",
+            {f"i{i}": item_id for i, item_id in enumerate(batch)},
+        )
+        for i, item_id in enumerate(batch):
+            draft_id = (((data.get(f"i{i}") or {}).get("content")) or {}).get("id")
+            if draft_id:
+                out[item_id] = draft_id
+    return out
+
+
+GC_ITEMS_QUERY = """
+query RoadmapGcItems($project: ID!, $cursor: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          createdAt
+          isArchived
+          content {
+            __typename
+            ... on Issue { number title url }
+            ... on DraftIssue { title }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def list_managed_items(project_id: str) -> dict[str, list[dict[str, Any]]]:
+    """Live managed (`SR:`) project items by node id, 100 per GraphQL query.
+
+    Items come back in the `gh project item-list` shape plus `created_at`,
+    so `plan_item_gc` can rank them without fetching bodies or fields.
+    """
+    by_node: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    cursor: str | None = None
+    while True:
+        data = graphql(GC_ITEMS_QUERY, {"project": project_id, "cursor": cursor})
+        page = ((data.get("node") or {}).get("items")) or {}
+        for item in page.get("nodes") or []:
+            if not item or item.get("isArchived"):
+                continue
+            content = item.get("content") or {}
+            node_id = extract_managed_node_id(content.get("title") or "")
+            if node_id:
+                by_node[node_id].append(
+                    {
+                        "id": item["id"],
+                        "title": content.get("title"),
+                        "created_at": item.get("createdAt"),
+                        "content": {
+                            "type": content.get("__typename"),
+                            "number": content.get("number"),
+                            "url": content.get("url"),
+                        },
+                    }
+                )
+        info = page.get("pageInfo") or {}
+        if not info.get("hasNextPage"):
+            return by_node
+        cursor = info.get("endCursor")
+
+
+def find_created_drafts(project_id: str, batch: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """The response an interrupted draft batch would have returned, if it was applied.
+
+    A batch runs as one request, so either every draft it creates is on the
+    board or none is. Returns None (send the batch) when none is found.
+    """
+    creates = {i: op for i, op in enumerate(batch) if not op.get("draft_id")}
+    if not creates:
+        return None
+    live = list_managed_items(project_id)
+    found: dict[int, str] = {}
+    for i, op in creates.items():
+        matches = [
+            item
+            for item in live.get(extract_managed_node_id(op["title"]) or "", [])
+            if item_content_type(item) == "DraftIssue" and item["title"] == op["title"]
+        ]
+        if matches:
+            found[i] = max(matches, key=lambda item: item.get("created_at") or "")["id"]
+    if not found:
+        return None
+    if len(found) < len(creates):
+        raise SyncError("An interrupted draft batch was only partly applied; run again with --full-reconcile")
+    draft_ids = resolve_draft_ids(list(found.values()))
+    print(f"Recovered {len(found)} drafts created by the interrupted run")
+    return {
+        "data": {
+            f"m{i}": {"projectItem": {"id": found[i], "content": {"id": draft_ids.get(found[i])}}}
+            if i in found
+            else {"draftIssue": {"id": op["draft_id"]}}
+            for i, op in enumerate(batch)
+        }
+    }
+
+
+def item_content_type(item: dict[str, Any]) -> str | None:
+    return (item.get("content") or {}).get("type")
+
+
+def plan_item_gc(
+    items_by_node: dict[str, list[dict[str, Any]]],
+    *,
+    desired_ids: set[str],
+    keep_item_by_node: dict[str, str],
+    mode: str,
+) -> list[tuple[str, str | None]]:
+    """Choose managed items to archive as (item id, node id) pairs.
+
+    Every item of a node that is no longer desired goes. A desired node keeps
+    one item: the one the sync uses (`keep_item_by_node`), otherwise the
+    item of its highest-numbered issue, which is the issue the sync's
+    listing picks (then the newest item). Draft mode only dedupes drafts and
+    leaves issue-backed items alone.
+    """
+    stale: list[tuple[str, str | None]] = []
+    for node_id in sorted(items_by_node):
+        group = items_by_node[node_id]
+        if node_id not in desired_ids:
+            stale.extend((item["id"], node_id) for item in group)
+            continue
+        if mode == "draft":
+            group = [item for item in group if item_content_type(item) != "Issue"]
+        if not group:
+            continue
+        keep = keep_item_by_node.get(node_id)
+        if keep is None:
+            candidates = [item for item in group if item_content_type(item) == "Issue"] or group
+            keep = max(
+                candidates, key=lambda item: ((item.get("content") or {}).get("number") or 0, item.get("created_at") or "")
+            )["id"]
+        stale.extend((item["id"], node_id) for item in group if item["id"] != keep)
+    return stale
+
+
+def archive_project_items(
+    project_id: str,
+    item_ids: list[str],
+    *,
+    batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+    workers: int = 1,
+) -> list[str]:
+    """Archive project items, `batch_size` aliased mutations per GraphQL request.
+
+    Returns the archived item ids. If any batch fails, PartialBatchError
+    carries the ids that were archived (including those from the failing
+    batch's successful aliases).
+    """
+    archived: list[str] = []
+    lock = threading.Lock()
+
+    def send(batch: list[str]) -> None:
+        declarations = ["$project: ID!"] + [f"$i{i}: ID!" for i in range(len(batch))]
+        selections = [
+            f"a{i}: archiveProjectV2Item(input: {{projectId: $project, itemId: $i{i}}}) {{ item {{ id }} }}"
+            for i in range(len(batch))
+        ]
+        variables: dict[str, Any] = {"project": project_id}
+        variables.update({f"i{i}": item_id for i, item_id in enumerate(batch)})
+        try:
+            graphql(f"mutation RoadmapArchiveBatch({', '.join(declarations)}) {{ {' '.join(selections)} }}", variables)
+            done = batch
+        except GraphQLError as exc:
+            done = [item_id for i, item_id in enumerate(batch) if exc.data.get(f"a{i}")]
+            raise
+        except SyncError:
+            done = []
+            raise
+        finally:
+            with lock:
+                archived.extend(done)
+
+    batches = [item_ids[start : start + batch_size] for start in range(0, len(item_ids), batch_size)]
+    try:
+        run_concurrently([lambda batch=batch: send(batch) for batch in batches], workers)
+    except SyncError as exc:
+        raise PartialBatchError(str(exc), archived) from exc
+    return archived
+
+
+def archive_stale_items(
+    *,
+    apply: bool,
+    project_id: str,
+    stale_items: list[tuple[str, str | None]],
+    desired_ids: set[str],
+    state: SyncState | None,
+    records: dict[str, NodeState] | None = None,
+    batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+    workers: int = 1,
+) -> int:
+    """Archive stale/duplicate items in batches. Returns the count.
+
+    Sync records of nodes that are gone, and any `records` pointing at an
+    archived item, lose their item so the next sync rediscovers it. A record
+    that names an issue is kept as a tombstone, since archiving the item
+    leaves the issue open; other records are forgotten.
+    """
+    if not apply:
+        for item_id, node_id in stale_items:
+            print(f"DRY-RUN: archive stale item {item_id} ({node_id})")
+        return 0
+    if not stale_items:
+        return 0
+    set_phase("archive")
+    failure: PartialBatchError | None = None
+    try:
+        archived = set(
+            archive_project_items(project_id, [item_id for item_id, _ in stale_items], batch_size=batch_size, workers=workers)
+        )
+    except PartialBatchError as exc:
+        # Forget what was archived before the failure, so the next run does not reuse it.
+        failure, archived = exc, set(exc.results)
+    for item_id, node_id in stale_items:
+        if item_id not in archived:
+            continue
+        print(f"Archived stale item: {item_id} ({node_id})")
+        record = (records or {}).get(node_id or "")
+        if state is None or not node_id or (node_id in desired_ids and not (record and record.item_id == item_id)):
+            continue
+        if record is not None and record.issue_number:
+            state.save_node(
+                replace(record, item_id=None, draft_id=None, field_values={}, node_fingerprint="", body_fingerprint="")
+            )
+        else:
+            state.delete_node(node_id)
+    if failure is not None:
+        raise failure
+    return len(stale_items)
 
 
 def build_graph_indexes(
@@ -964,6 +2400,44 @@ def build_graph_indexes(
     return nodes_by_id, edge_indexes, node_to_milestone_nodes
 
 
+def roadmap_changes_since(
+    old_model: dict[str, Any],
+    new_model: dict[str, Any],
+) -> tuple[set[str], set[str]]:
+    """Diff two model revisions by node id.
+
+    Returns (affected, removed): affected holds every added or changed node,
+    every endpoint of an added or removed edge, and every node whose rendered
+    body references one of those through an edge index. A change to the
+    model header (as_of, version, ...) touches every body.
+    """
+    old_nodes = {node["id"]: node for node in old_model.get("nodes", [])}
+    new_nodes = {node["id"]: node for node in new_model.get("nodes", [])}
+    removed = set(old_nodes) - set(new_nodes)
+    if any(old_model.get(key) != new_model.get(key) for key in ("program", "roadmap_id", "version", "as_of")):
+        return set(new_nodes), removed
+
+    changed = {node_id for node_id, node in new_nodes.items() if old_nodes.get(node_id) != node}
+
+    def _edge_keys(model: dict[str, Any]) -> set[tuple[Any, Any, Any]]:
+        return {(edge.get("from"), edge.get("type"), edge.get("to")) for edge in model.get("edges", [])}
+
+    for from_id, _, to_id in _edge_keys(old_model) ^ _edge_keys(new_model):
+        changed.update(node_id for node_id in (from_id, to_id) if node_id in new_nodes)
+
+    _, edge_indexes, _ = build_graph_indexes(new_model)
+    affected = set(changed)
+    for index in edge_indexes.values():
+        for node_id in changed:
+            affected.update(index.get(node_id, []))
+    return affected & set(new_nodes), removed
+
+
+def issue_number_from_url(url: str | None, repo: str) -> int | None:
+    match = re.match(rf"https://github\.com/{re.escape(repo)}/issues/(\d+)$", url or "")
+    return int(match.group(1)) if match else None
+
+
 def dependencies_text_for_project(
     *,
     node_id: str,
@@ -1053,6 +2527,81 @@ def generic_refs_for_body(
     return refs
 
 
+@dataclass
+class RoadmapSnapshot:
+    """Target-independent desired state: loaded, indexed and rendered once.
+
+    One snapshot can drive several sync targets concurrently. Bodies are
+    memoized by node and resolved references, so targets that mirror the
+    same repo (or draft boards) share every rendered body.
+    """
+
+    model: dict[str, Any]
+    kinds: set[str]
+    desired_nodes: list[dict[str, Any]]
+    nodes_by_id: dict[str, dict[str, Any]]
+    edge_indexes: dict[str, dict[str, list[str]]]
+    node_to_milestone_nodes: dict[str, list[str]]
+    node_fingerprints: dict[str, str]
+    model_hash: str
+    since: str | None = None
+    scope: set[str] | None = None
+    removed_ids: set[str] = field(default_factory=set)
+    bodies: dict[tuple[Any, ...], str] = field(default_factory=dict)
+
+    def body(
+        self,
+        node: dict[str, Any],
+        *,
+        dependency_refs: list[str] | None = None,
+        delivers_refs: list[str] | None = None,
+        extra_sections: dict[str, list[str]] | None = None,
+    ) -> str:
+        key = (
+            node["id"],
+            tuple(dependency_refs or ()),
+            tuple(delivers_refs or ()),
+            tuple((heading, tuple(refs)) for heading, refs in (extra_sections or {}).items()),
+        )
+        body = self.bodies.get(key)
+        if body is None:
+            body = make_body(
+                self.model,
+                node,
+                dependency_refs=dependency_refs,
+                delivers_refs=delivers_refs,
+                extra_sections=extra_sections,
+            )
+            self.bodies[key] = body
+        return body
+
+
+def load_snapshot(model_path: Path, kinds: set[str], since: str | None = None) -> RoadmapSnapshot:
+    model = load_model(model_path)
+    scope: set[str] | None = None
+    removed_ids: set[str] = set()
+    if since:
+        old_model = load_model_at_revision(model_path, since)
+        scope, removed = roadmap_changes_since(old_model, model)
+        removed_ids = {n["id"] for n in old_model.get("nodes", []) if n["id"] in removed and n.get("kind") in kinds}
+    desired_nodes = [node for node in model.get("nodes", []) if node.get("kind") in kinds]
+    desired_nodes.sort(key=node_sort_key)
+    nodes_by_id, edge_indexes, node_to_milestone_nodes = build_graph_indexes(model)
+    return RoadmapSnapshot(
+        model=model,
+        kinds=set(kinds),
+        desired_nodes=desired_nodes,
+        nodes_by_id=nodes_by_id,
+        edge_indexes=edge_indexes,
+        node_to_milestone_nodes=node_to_milestone_nodes,
+        node_fingerprints={node["id"]: fingerprint(node) for node in desired_nodes},
+        model_hash=fingerprint(model),
+        since=since,
+        scope=scope,
+        removed_ids=removed_ids,
+    )
+
+
 def sync(
     *,
     owner: str,
@@ -1065,248 +2614,1208 @@ def sync(
     repo: str,
     ensure_fields: bool,
     blocked_by_field_name: str,
-) -> None:
-    model = load_model(model_path)
-    project_id, fields = get_project_meta(
-        owner,
-        project_number,
-        apply=apply,
-        ensure_fields=ensure_fields,
-        blocked_by_field_name=blocked_by_field_name,
-    )
-    items = list_items(owner, project_number)
-
-    managed_items_by_node_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    project_item_by_url: dict[str, dict[str, Any]] = {}
-    for item in items:
-        title = item.get("title") or item.get("content", {}).get("title") or ""
-        node_id = extract_managed_node_id(title)
-        if node_id:
-            managed_items_by_node_id[node_id].append(item)
-        content = item.get("content") or {}
-        if content.get("type") == "Issue":
-            url = content.get("url")
-            if url:
-                project_item_by_url[url] = item
-
-    desired_nodes = [node for node in model.get("nodes", []) if node.get("kind") in kinds]
-    desired_nodes.sort(key=node_sort_key)
-    desired_ids = {node["id"] for node in desired_nodes}
-
-    print(f"Project #{project_number} owner={owner} project_id={project_id}")
-    print(f"Managed existing items: {sum(len(v) for v in managed_items_by_node_id.values())}")
-    print(f"Desired nodes to sync: {len(desired_nodes)}")
-    print(f"Mode: {'APPLY' if apply else 'DRY-RUN'} ({mode})")
-
-    nodes_by_id, edge_indexes, node_to_milestone_nodes = build_graph_indexes(model)
-    depends_on_by_node = edge_indexes["depends_on"]
-    delivers_to_by_node = edge_indexes["delivers"]
-
-    # Extra edge types for issue body sections
-    extra_edge_sections = [
-        ("blocks", "Blocks"),
-        ("blocked_by_edge", "Blocked By"),
-        ("informs", "Informs"),
-        ("informed_by", "Informed By"),
-        ("measures", "Measures"),
-        ("measured_by", "Measured By"),
-        ("mitigates", "Mitigates"),
-        ("mitigated_by", "Mitigated By"),
-        ("references", "References"),
-        ("referenced_by", "Referenced By"),
-        ("delivered_by", "Delivered By"),
-    ]
-    processed_project_item_ids: set[str] = set()
-    issue_by_node: dict[str, IssueInfo] = {}
+    state_path: Path | None = DEFAULT_STATE_PATH,
+    full_reconcile: bool = False,
+    full_reconcile_days: float = DEFAULT_FULL_RECONCILE_DAYS,
+    meta_ttl_seconds: float = DEFAULT_META_TTL_SECONDS,
+    journal_path: Path | None = None,
+    resume: bool = False,
+    max_rate_wait: float = 900.0,
+    show_stats: bool = False,
+    stats_path: Path | None = None,
+    since: str | None = None,
+    reconcile_workers: int = DEFAULT_RECONCILE_WORKERS,
+    draft_batch_size: int = DEFAULT_DRAFT_BATCH_SIZE,
+    archive_batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+    snapshot: RoadmapSnapshot | None = None,
+    shared_issues: dict[str, IssueInfo] | None = None,
+) -> dict[str, Any]:
+    """Reconcile one target against the roadmap and return its summary.
+
+    Pass a prebuilt `snapshot` to share model loading and body rendering
+    across targets; otherwise one is loaded from `model_path`. Targets that
+    mirror the same repo run one after another and pass the same
+    `shared_issues` map, so an issue one of them created is reused by the
+    next instead of being looked up through the (lagging) search index.
+    """
+    if snapshot is None:
+        snapshot = load_snapshot(model_path, kinds, since)
+    model = snapshot.model
+    since = snapshot.since
+    scope = snapshot.scope
+    removed_ids = snapshot.removed_ids
+    target = state_target_key(owner=owner, project_number=project_number, mode=mode, repo=repo)
+    summary: dict[str, Any] = {"target": target, "desired": len(snapshot.desired_nodes), "stale": 0, "archived": 0}
+    limiter = RateLimiter(max_wait=max_rate_wait)
+    stats = SyncStats()
+    state: SyncState | None = None
+    journal: Journal | None = None
+    journal_token: contextvars.Token[Journal | None] | None = None
+    limiter_token = _ACTIVE_LIMITER.set(limiter)
+    stats_token = _ACTIVE_STATS.set(stats)
+    try:
+        if state_path is not None:
+            state = SyncState(state_path, target)
+        known: dict[str, NodeState] = state.load_nodes() if state else {}
+        last_full = float(state.get_meta("last_full_reconcile") or 0) if state else 0.0
+        if scope is not None and state is not None and (
+            not known or time.time() - last_full > full_reconcile_days * 86400
+        ):
+            # Scoped runs never archive leftovers or catch drift on the board,
+            # so an overdue full reconcile widens them to every node.
+            print(f"No full reconcile in the last {full_reconcile_days:g} days; ignoring --since {since}")
+            scope = None
+            since = None
+        if scope is not None and not scope and not removed_ids:
+            print(f"No roadmap node changes since {since}; nothing to sync.")
+            summary.update(work=0, skipped=0, full=False, calls=0, rate_budget="", elapsed_seconds=0.0)
+            return summary
+        if scope is not None:
+            # Scoped runs never list the board, except draft mode with no recorded item ids.
+            full = full_reconcile or (mode == "draft" and not known)
+        else:
+            # Without a trustworthy local record we must rediscover everything from GitHub.
+            full = (
+                full_reconcile
+                or state is None
+                or not known
+                or time.time() - last_full > full_reconcile_days * 86400
+            )
 
-    if mode == "issue":
-        repo_issues_by_node = list_repo_issues(repo)
-        needed_labels: set[str] = set()
-        for node in desired_nodes:
-            needed_labels.update(managed_label_names(node))
-        ensure_repo_labels(apply=apply, repo=repo, names=needed_labels)
-
-        milestone_nodes = {node["id"]: node for node in model.get("nodes", []) if node.get("kind") == "milestone"}
-        repo_milestones_by_title = ensure_repo_milestones(
+        if apply:
+            journal = Journal(
+                journal_path or journal_path_for(target),
+                header={
+                    "target": target,
+                    "model_hash": snapshot.model_hash,
+                    "kinds": sorted(kinds),
+                    "full": full,
+                    "since": since,
+                    "started_at": time.time(),
+                },
+                resume=resume,
+            )
+            # A resumed run must make the same reconcile choice as the original.
+            full = bool(journal.header.get("full", full))
+            if journal.header.get("since") is None:
+                scope = None
+                since = None
+            journal_token = _ACTIVE_JOURNAL.set(journal)
+
+        set_phase("discover")
+        project_id, fields = get_project_meta(
+            owner,
+            project_number,
             apply=apply,
-            repo=repo,
-            milestone_nodes=milestone_nodes,
+            ensure_fields=ensure_fields,
+            blocked_by_field_name=blocked_by_field_name,
+            state=state,
+            ttl_seconds=meta_ttl_seconds,
         )
-
-        # Pass 1: ensure issue exists for every desired node.
-        for node in desired_nodes:
-            existing_issue = repo_issues_by_node.get(node["id"])
-            milestone = choose_milestone_for_node(
-                node_id=node["id"],
-                node_to_milestone_nodes=node_to_milestone_nodes,
-                repo_milestones_by_title=repo_milestones_by_title,
-            )
-            # Temporary body refs in pass 1 (node ids only); pass 2 refreshes with issue refs.
-            dep_refs = [f"- [ ] `{dep}`" for dep in depends_on_by_node.get(node["id"], [])]
-            deliver_refs = [f"- `{target}`" for target in delivers_to_by_node.get(node["id"], [])]
-            p1_extra: dict[str, list[str]] = {}
-            for idx_key, heading in extra_edge_sections:
-                targets = edge_indexes[idx_key].get(node["id"], [])
-                if targets:
-                    p1_extra[heading] = [f"- `{t}`" for t in targets]
-            issue = upsert_issue(
-                apply=apply,
-                repo=repo,
-                model=model,
-                node=node,
-                existing_issue=existing_issue,
-                dependency_refs=dep_refs,
-                delivers_refs=deliver_refs,
-                desired_labels=managed_label_names(node),
-                milestone=milestone,
-                extra_sections=p1_extra or None,
-            )
-            issue_by_node[node["id"]] = issue
-
-        # Pass 2: rewrite bodies with resolved issue references.
-        for node in desired_nodes:
-            current_issue = issue_by_node[node["id"]]
-            milestone = choose_milestone_for_node(
-                node_id=node["id"],
-                node_to_milestone_nodes=node_to_milestone_nodes,
-                repo_milestones_by_title=repo_milestones_by_title,
-            )
-            dep_refs = dependency_refs_for_body(
-                node_id=node["id"],
-                depends_on_by_node=depends_on_by_node,
-                nodes_by_id=nodes_by_id,
-                issue_by_node=issue_by_node,
-            )
-            deliver_refs = delivers_refs_for_body(
-                node_id=node["id"],
-                delivers_to_by_node=delivers_to_by_node,
-                nodes_by_id=nodes_by_id,
-                issue_by_node=issue_by_node,
+        # A resumed run replays the listing its first attempt made.
+        listed_at = float(journal.header.get("started_at", time.time())) if journal is not None else time.time()
+        items = list_items(owner, project_number) if full else []
+
+        managed_items_by_node_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        project_item_by_url: dict[str, dict[str, Any]] = {}
+        for item in items:
+            title = item.get("title") or item.get("content", {}).get("title") or ""
+            node_id = extract_managed_node_id(title)
+            if node_id:
+                managed_items_by_node_id[node_id].append(item)
+            content = item.get("content") or {}
+            if content.get("type") == "Issue":
+                url = content.get("url")
+                if url:
+                    project_item_by_url[url] = item
+
+        desired_nodes = snapshot.desired_nodes
+        desired_ids = {node["id"] for node in desired_nodes}
+        work_nodes = desired_nodes if scope is None else [node for node in desired_nodes if node["id"] in scope]
+
+        print(f"Project #{project_number} owner={owner} project_id={project_id}")
+        if full:
+            print(f"Managed existing items: {sum(len(v) for v in managed_items_by_node_id.values())}")
+        else:
+            print(f"Known nodes in sync state: {len(known)}")
+        print(f"Desired nodes to sync: {len(desired_nodes)}")
+        if scope is not None:
+            print(f"Scoped to {len(work_nodes)} changed/affected nodes and {len(removed_ids)} removed since {since}")
+        print(f"Mode: {'APPLY' if apply else 'DRY-RUN'} ({mode}, {'full reconcile' if full else 'incremental'})")
+
+        nodes_by_id = snapshot.nodes_by_id
+        edge_indexes = snapshot.edge_indexes
+        node_to_milestone_nodes = snapshot.node_to_milestone_nodes
+        node_fingerprints = snapshot.node_fingerprints
+        depends_on_by_node = edge_indexes["depends_on"]
+        delivers_to_by_node = edge_indexes["delivers"]
+
+        # Extra edge types for issue body sections
+        extra_edge_sections = [
+            ("blocks", "Blocks"),
+            ("blocked_by_edge", "Blocked By"),
+            ("informs", "Informs"),
+            ("informed_by", "Informed By"),
+            ("measures", "Measures"),
+            ("measured_by", "Measured By"),
+            ("mitigates", "Mitigates"),
+            ("mitigated_by", "Mitigated By"),
+            ("references", "References"),
+            ("referenced_by", "Referenced By"),
+            ("delivered_by", "Delivered By"),
+        ]
+        # The project item each node was synced to; it survives stale/duplicate cleanup.
+        processed_item_by_node: dict[str, str] = {}
+        issue_by_node: dict[str, IssueInfo] = {}
+        skipped_node_ids: set[str] = set()
+
+        if mode == "issue":
+            repo_issues_by_node = list_repo_issues(repo) if full else {}
+            needed_labels: set[str] = set()
+            for node in desired_nodes:
+                needed_labels.update(managed_label_names(node))
+            milestone_nodes = {node["id"]: node for node in model.get("nodes", []) if node.get("kind") == "milestone"}
+
+            # Labels and milestones only need reconciling when the desired set
+            # moved; a full reconcile re-checks them for drift regardless.
+            repo_meta_fp = fingerprint(
+                desired_label_specs(needed_labels), desired_milestone_specs(milestone_nodes), archive_stale
             )
-            p2_extra: dict[str, list[str]] = {}
-            for idx_key, heading in extra_edge_sections:
-                refs = generic_refs_for_body(
+            cached_repo_meta = json.loads((state.get_meta("repo_meta") if state is not None else None) or "{}")
+            previous_titles = set(cached_repo_meta.get("managed_titles", []))
+            if not full and cached_repo_meta.get("fingerprint") == repo_meta_fp:
+                repo_milestones_by_title = {
+                    title: RepoMilestone(**info) for title, info in cached_repo_meta.get("milestones", {}).items()
+                }
+                print("Labels and milestones unchanged since last sync; skipping reconcile")
+            else:
+                set_phase("labels")
+                reconcile_repo_labels(
+                    apply=apply, repo=repo, names=needed_labels, prune=archive_stale, workers=reconcile_workers
+                )
+                set_phase("milestones")
+                repo_milestones_by_title = reconcile_repo_milestones(
+                    apply=apply,
+                    repo=repo,
+                    milestone_nodes=milestone_nodes,
+                    previous_titles=previous_titles,
+                    prune=archive_stale,
+                    workers=reconcile_workers,
+                )
+                if apply and state is not None:
+                    managed_titles = set(desired_milestone_specs(milestone_nodes))
+                    if not archive_stale:
+                        # Unpruned leftovers stay eligible for a later --archive-stale.
+                        managed_titles |= previous_titles & set(repo_milestones_by_title)
+                    state.set_meta(
+                        "repo_meta",
+                        json.dumps(
+                            {
+                                "fingerprint": repo_meta_fp,
+                                "managed_titles": sorted(managed_titles),
+                                "milestones": {title: asdict(ms) for title, ms in repo_milestones_by_title.items()},
+                            },
+                            sort_keys=True,
+                        ),
+                    )
+
+            # Incremental runs reference known issues by number only; bodies are
+            # fetched later, and only for nodes whose fingerprint changed.
+            if not full:
+                for node_id, node_state in known.items():
+                    if node_state.issue_number:
+                        issue_by_node[node_id] = IssueInfo(
+                            number=node_state.issue_number,
+                            title=node_state.title,
+                            body="",
+                            state="OPEN",
+                            labels=set(),
+                            milestone_title=None,
+                            url=node_state.issue_url or "",
+                        )
+                # Nodes the state does not know may still carry a backfilled github_url.
+                for node in model.get("nodes", []):
+                    number = issue_number_from_url(node.get("github_url"), repo)
+                    if number and node["id"] not in issue_by_node:
+                        issue_by_node[node["id"]] = IssueInfo(
+                            number=number,
+                            title=desired_title(node),
+                            body="",
+                            state="OPEN",
+                            labels=set(),
+                            milestone_title=None,
+                            url=node["github_url"],
+                        )
+            live_issue_node_ids: set[str] = set()
+
+            # Pass 1: ensure issue exists for every desired node.
+            set_phase("pass1-issues")
+            for node in work_nodes:
+                if node["id"] in issue_by_node:
+                    continue
+                existing_issue = repo_issues_by_node.get(node["id"])
+                if existing_issue is None and shared_issues and node["id"] in shared_issues:
+                    existing_issue = replace(shared_issues[node["id"]])
+                if not full and existing_issue is None:
+                    existing_issue = find_issue_for_node(repo, node["id"])
+                if existing_issue is not None:
+                    # Pass 2 rewrites it; a placeholder body here would cost a second PATCH.
+                    issue_by_node[node["id"]] = existing_issue
+                    continue
+                milestone = choose_milestone_for_node(
                     node_id=node["id"],
-                    edge_index=edge_indexes[idx_key],
+                    node_to_milestone_nodes=node_to_milestone_nodes,
+                    repo_milestones_by_title=repo_milestones_by_title,
+                )
+                # Temporary body refs in pass 1 (node ids only); pass 2 refreshes with issue refs.
+                dep_refs = [f"- [ ] `{dep}`" for dep in depends_on_by_node.get(node["id"], [])]
+                deliver_refs = [f"- `{target}`" for target in delivers_to_by_node.get(node["id"], [])]
+                p1_extra: dict[str, list[str]] = {}
+                for idx_key, heading in extra_edge_sections:
+                    targets = edge_indexes[idx_key].get(node["id"], [])
+                    if targets:
+                        p1_extra[heading] = [f"- `{t}`" for t in targets]
+                issue = upsert_issue(
+                    apply=apply,
+                    repo=repo,
+                    node=node,
+                    body=snapshot.body(
+                        node,
+                        dependency_refs=dep_refs,
+                        delivers_refs=deliver_refs,
+                        extra_sections=p1_extra or None,
+                    ),
+                    existing_issue=existing_issue,
+                    desired_labels=managed_label_names(node),
+                    milestone=milestone,
+                )
+                issue_by_node[node["id"]] = issue
+                live_issue_node_ids.add(node["id"])
+
+            # Listed issues carry no body. Where the issue is untouched since we
+            # last wrote it, the recorded hash stands in for it; only the rest
+            # need their bodies (batched) to compare hashes.
+            if full:
+                need_bodies: list[IssueInfo] = []
+                for node in work_nodes:
+                    issue = issue_by_node.get(node["id"])
+                    if issue is None or issue.number <= 0 or node["id"] in live_issue_node_ids or issue.body:
+                        continue
+                    record = known.get(node["id"])
+                    if record and record.content_hash and record.issue_updated_at == issue.updated_at:
+                        issue.content_hash = record.content_hash
+                    else:
+                        need_bodies.append(issue)
+                if need_bodies:
+                    set_phase("issue-bodies")
+                    fetch_issue_bodies(repo, need_bodies)
+                print(f"Issue bodies fetched: {len(need_bodies)}")
+
+            # Pass 2: rewrite bodies with resolved issue references.
+            set_phase("pass2-bodies")
+            body_fingerprints: dict[str, str] = {}
+            milestone_numbers: dict[str, int | None] = {}
+            for node in work_nodes:
+                node_id = node["id"]
+                current_issue = issue_by_node[node_id]
+                milestone = choose_milestone_for_node(
+                    node_id=node_id,
+                    node_to_milestone_nodes=node_to_milestone_nodes,
+                    repo_milestones_by_title=repo_milestones_by_title,
+                )
+                dep_refs = dependency_refs_for_body(
+                    node_id=node_id,
+                    depends_on_by_node=depends_on_by_node,
                     nodes_by_id=nodes_by_id,
                     issue_by_node=issue_by_node,
                 )
-                if refs:
-                    p2_extra[heading] = refs
-            refreshed_issue = upsert_issue(
-                apply=apply,
-                repo=repo,
-                model=model,
-                node=node,
-                existing_issue=current_issue,
-                dependency_refs=dep_refs,
-                delivers_refs=deliver_refs,
-                desired_labels=managed_label_names(node),
-                milestone=milestone,
-                extra_sections=p2_extra or None,
-            )
-            issue_by_node[node["id"]] = refreshed_issue
+                deliver_refs = delivers_refs_for_body(
+                    node_id=node_id,
+                    delivers_to_by_node=delivers_to_by_node,
+                    nodes_by_id=nodes_by_id,
+                    issue_by_node=issue_by_node,
+                )
+                p2_extra: dict[str, list[str]] = {}
+                for idx_key, heading in extra_edge_sections:
+                    refs = generic_refs_for_body(
+                        node_id=node_id,
+                        edge_index=edge_indexes[idx_key],
+                        nodes_by_id=nodes_by_id,
+                        issue_by_node=issue_by_node,
+                    )
+                    if refs:
+                        p2_extra[heading] = refs
+                desired_labels = managed_label_names(node)
+                blocked_by_text = dependencies_text_for_project(
+                    node_id=node_id,
+                    depends_on_by_node=depends_on_by_node,
+                    nodes_by_id=nodes_by_id,
+                    issue_by_node=issue_by_node,
+                )
+                field_values = desired_field_values(
+                    fields=fields,
+                    model=model,
+                    node=node,
+                    blocked_by_text=blocked_by_text,
+                    blocked_by_field_name=blocked_by_field_name,
+                )
+                body = snapshot.body(
+                    node,
+                    dependency_refs=dep_refs,
+                    delivers_refs=deliver_refs,
+                    extra_sections=p2_extra or None,
+                )
+                body_fingerprints[node_id] = fingerprint(
+                    desired_title(node),
+                    body,
+                    desired_labels,
+                    milestone.title if milestone else None,
+                    field_values,
+                )
+                milestone_numbers[node_id] = milestone.number if milestone and milestone.number > 0 else None
+                previous = known.get(node_id)
+                if (
+                    not full
+                    and previous is not None
+                    and previous.item_id
+                    and previous.node_fingerprint == node_fingerprints[node_id]
+                    and previous.body_fingerprint == body_fingerprints[node_id]
+                ):
+                    skipped_node_ids.add(node_id)
+                    continue
+                if not full and node_id not in live_issue_node_ids and current_issue.number > 0:
+                    current_issue = get_issue(repo, current_issue.number)
+                refreshed_issue = upsert_issue(
+                    apply=apply,
+                    repo=repo,
+                    node=node,
+                    body=body,
+                    existing_issue=current_issue,
+                    desired_labels=desired_labels,
+                    milestone=milestone,
+                )
+                issue_by_node[node_id] = refreshed_issue
+            if shared_issues is not None:
+                shared_issues.update({node_id: issue for node_id, issue in issue_by_node.items() if issue.number > 0})
+
+            # Pass 3: ensure issue is in project and set project fields.
+            set_phase("pass3-project")
+            for node in work_nodes:
+                node_id = node["id"]
+                previous = known.get(node_id)
+                if node_id in skipped_node_ids:
+                    processed_item_by_node[node_id] = previous.item_id
+                    continue
+                issue = issue_by_node[node_id]
+                if not full and previous and previous.item_id and previous.issue_number == issue.number:
+                    item_id = previous.item_id
+                    current_values = previous.field_values
+                else:
+                    item_id = add_issue_to_project_if_needed(
+                        apply=apply,
+                        owner=owner,
+                        project_number=project_number,
+                        issue_url=issue.url,
+                        project_item_by_url=project_item_by_url,
+                    )
+                    current_values = None
+                blocked_by_text = dependencies_text_for_project(
+                    node_id=node_id,
+                    depends_on_by_node=depends_on_by_node,
+                    nodes_by_id=nodes_by_id,
+                    issue_by_node=issue_by_node,
+                )
+                field_values = apply_project_fields(
+                    apply=apply,
+                    project_id=project_id,
+                    fields=fields,
+                    item_id=item_id,
+                    model=model,
+                    node=node,
+                    blocked_by_text=blocked_by_text,
+                    blocked_by_field_name=blocked_by_field_name,
+                    current_values=current_values,
+                )
+                if not item_id.startswith("dry-run:"):
+                    processed_item_by_node[node_id] = item_id
+                    if state is not None and apply and issue.number > 0:
+                        state.save_node(
+                            NodeState(
+                                node_id=node_id,
+                                title=desired_title(node),
+                                issue_number=issue.number,
+                                issue_url=issue.url,
+                                item_id=item_id,
+                                milestone_number=milestone_numbers.get(node_id),
+                                field_values=field_values,
+                                node_fingerprint=node_fingerprints[node_id],
+                                body_fingerprint=body_fingerprints[node_id],
+                                synced_at=time.time(),
+                                content_hash=issue.content_hash,
+                                issue_updated_at=issue.updated_at,
+                            )
+                        )
 
-        # Pass 3: ensure issue is in project and set project fields.
-        for node in desired_nodes:
-            issue = issue_by_node[node["id"]]
-            item_id = add_issue_to_project_if_needed(
-                apply=apply,
-                owner=owner,
-                project_number=project_number,
-                issue_url=issue.url,
-                project_item_by_url=project_item_by_url,
-            )
-            blocked_by_text = dependencies_text_for_project(
-                node_id=node["id"],
-                depends_on_by_node=depends_on_by_node,
-                nodes_by_id=nodes_by_id,
-                issue_by_node=issue_by_node,
+        else:
+            set_phase("drafts")
+            # Plan every node first so title/body writes can go out in batches.
+            planned: list[dict[str, Any]] = []
+            for node in work_nodes:
+                node_id = node["id"]
+                previous = known.get(node_id)
+                field_values = desired_field_values(
+                    fields=fields,
+                    model=model,
+                    node=node,
+                    blocked_by_text=None,
+                    blocked_by_field_name=blocked_by_field_name,
+                )
+                title = desired_title(node)
+                body = snapshot.body(node)
+                node_fp = node_fingerprints[node_id]
+                body_fp = fingerprint(title, body, field_values)
+                if (
+                    not full
+                    and previous is not None
+                    and previous.item_id
+                    and previous.node_fingerprint == node_fp
+                    and previous.body_fingerprint == body_fp
+                ):
+                    skipped_node_ids.add(node_id)
+                    processed_item_by_node[node_id] = previous.item_id
+                    continue
+                entry: dict[str, Any] = {
+                    "node": node,
+                    "previous": previous,
+                    "title": title,
+                    "body": body,
+                    "content_hash": extract_content_hash(body),
+                    "node_fp": node_fp,
+                    "body_fp": body_fp,
+                    "item_id": None,
+                    "draft_id": None,
+                    "current_title": None,
+                    "current_hash": None,
+                }
+                if full:
+                    for candidate in managed_items_by_node_id.get(node_id, []):
+                        content = candidate.get("content") or {}
+                        if content.get("type") == "DraftIssue":
+                            entry.update(
+                                item_id=candidate["id"],
+                                draft_id=content.get("id"),
+                                current_title=candidate.get("title") or content.get("title"),
+                                current_hash=verified_content_hash(content.get("body") or ""),
+                            )
+                            break
+                if entry["item_id"] is None and previous is not None and previous.item_id and (
+                    not full or previous.synced_at >= listed_at
+                ):
+                    # In full mode, a record newer than the listing (a resumed run
+                    # replays the old listing) is a draft that listing missed.
+                    entry.update(
+                        item_id=previous.item_id,
+                        draft_id=previous.draft_id,
+                        current_title=previous.title,
+                        current_hash=previous.content_hash,
+                    )
+                planned.append(entry)
+
+            missing_draft_ids = [e["item_id"] for e in planned if e["item_id"] and not e["draft_id"]]
+            if missing_draft_ids:
+                resolved = resolve_draft_ids(missing_draft_ids)
+                for entry in planned:
+                    if entry["item_id"] and not entry["draft_id"]:
+                        entry["draft_id"] = resolved.get(entry["item_id"])
+
+            writes: list[dict[str, Any]] = []
+            for entry in planned:
+                if entry["item_id"] is None:
+                    writes.append(entry)
+                    if not apply:
+                        print(f"DRY-RUN: create draft item '{entry['title']}'")
+                        entry["item_id"] = f"dry-run:{entry['node']['id']}"
+                elif entry["current_title"] != entry["title"] or entry["current_hash"] != entry["content_hash"]:
+                    if not entry["draft_id"]:
+                        print(f"WARN: cannot update non-draft item {entry['item_id']}")
+                        continue
+                    writes.append(entry)
+                    if not apply:
+                        print(f"DRY-RUN: update draft {entry['draft_id']}: '{entry['title']}'")
+            print(f"Draft writes: {len(writes)} ({sum(1 for e in writes if not e['draft_id'])} new)")
+            if apply and writes:
+                try:
+                    results = apply_draft_mutations(
+                        project_id,
+                        [{"title": e["title"], "body": e["body"], "draft_id": e["draft_id"]} for e in writes],
+                        batch_size=draft_batch_size,
+                    )
+                except PartialBatchError as exc:
+                    # Record the drafts that were created so a rerun updates them
+                    # instead of creating them again. Empty fingerprints force the
+                    # rerun to finish their fields.
+                    for entry, (item_id, draft_id) in zip(writes, exc.results):
+                        if entry["item_id"] is None and item_id and state is not None:
+                            state.save_node(
+                                NodeState(
+                                    node_id=entry["node"]["id"],
+                                    title=entry["title"],
+                                    item_id=item_id,
+                                    draft_id=draft_id,
+                                    field_values={},
+                                    node_fingerprint="",
+                                    body_fingerprint="",
+                                    synced_at=time.time(),
+                                    content_hash=entry["content_hash"],
+                                )
+                            )
+                    raise
+                for entry, (item_id, draft_id) in zip(writes, results):
+                    if entry["item_id"] is None:
+                        entry["item_id"] = item_id
+                        print(f"Created draft: {entry['title']} ({item_id})")
+                    entry["draft_id"] = draft_id
+
+            set_phase("draft-fields")
+            for entry in planned:
+                node = entry["node"]
+                node_id = node["id"]
+                previous = entry["previous"]
+                item_id = entry["item_id"]
+                if not item_id:
+                    continue
+                existed = previous is not None and previous.item_id == item_id
+                field_values = apply_project_fields(
+                    apply=apply,
+                    project_id=project_id,
+                    fields=fields,
+                    item_id=item_id,
+                    model=model,
+                    node=node,
+                    blocked_by_text=None,
+                    blocked_by_field_name=blocked_by_field_name,
+                    current_values=previous.field_values if existed and not full else None,
+                )
+                if not item_id.startswith("dry-run:"):
+                    processed_item_by_node[node_id] = item_id
+                    if state is not None and apply:
+                        state.save_node(
+                            NodeState(
+                                node_id=node_id,
+                                title=entry["title"],
+                                item_id=item_id,
+                                draft_id=entry["draft_id"],
+                                field_values=field_values,
+                                node_fingerprint=entry["node_fp"],
+                                body_fingerprint=entry["body_fp"],
+                                synced_at=time.time(),
+                                content_hash=entry["content_hash"],
+                            )
+                        )
+
+        if skipped_node_ids:
+            print(f"Unchanged nodes skipped: {len(skipped_node_ids)}")
+
+        set_phase("stale")
+        stale_items: list[tuple[str, str | None]] = []
+        if full:
+            stale_items = plan_item_gc(
+                {
+                    node_id: node_items
+                    for node_id, node_items in managed_items_by_node_id.items()
+                    if scope is None or node_id in scope or node_id in removed_ids
+                },
+                desired_ids=desired_ids,
+                keep_item_by_node=processed_item_by_node,
+                mode=mode,
             )
-            apply_project_fields(
+        else:
+            # Incremental runs only know about items this script created.
+            candidates = removed_ids if scope is not None else set(known) - desired_ids
+            for node_id in sorted(candidates):
+                node_state = known.get(node_id)
+                if node_state and node_state.item_id:
+                    stale_items.append((node_state.item_id, node_id))
+                elif node_state and node_state.issue_number:
+                    continue  # tombstone: its item was archived already
+                else:
+                    print(f"WARN: no recorded project item for removed node {node_id}; run --full-reconcile to archive it")
+
+        if stale_items:
+            print(f"Stale managed items: {len(stale_items)}")
+        if archive_stale:
+            summary["archived"] = archive_stale_items(
                 apply=apply,
                 project_id=project_id,
-                fields=fields,
-                item_id=item_id,
-                model=model,
-                node=node,
-                blocked_by_text=blocked_by_text,
-                blocked_by_field_name=blocked_by_field_name,
+                stale_items=stale_items,
+                desired_ids=desired_ids,
+                state=state,
+                # Records of desired nodes were rewritten this run; only removed ones are current.
+                records={node_id: record for node_id, record in known.items() if node_id not in desired_ids},
+                batch_size=archive_batch_size,
+                workers=reconcile_workers,
             )
-            if not item_id.startswith("dry-run:"):
-                processed_project_item_ids.add(item_id)
-
-    else:
-        for node in desired_nodes:
-            existing_item = None
-            for candidate in managed_items_by_node_id.get(node["id"], []):
-                content_type = (candidate.get("content") or {}).get("type")
-                if content_type == "DraftIssue":
-                    existing_item = candidate
-                    break
-            item_id = upsert_draft_item(
-                apply=apply,
-                owner=owner,
-                project_number=project_number,
-                model=model,
-                node=node,
-                existing_item=existing_item,
+        else:
+            for item_id, node_id in stale_items:
+                print(f"Leave stale item untouched: {item_id} ({node_id})")
+
+        if state is not None:
+            if apply and full and scope is None:
+                # Out-of-scope nodes with no item left on the board need no
+                # record, unless it names an issue that is still in the repo.
+                for node_id in set(known) - desired_ids - set(managed_items_by_node_id):
+                    if not known[node_id].issue_number:
+                        state.delete_node(node_id)
+                state.set_meta("last_full_reconcile", str(time.time()))
+
+        print(f"Rate budget: {limiter.summary()}")
+        stats_data = stats.as_dict()
+        summary.update(
+            work=len(work_nodes),
+            skipped=len(skipped_node_ids),
+            stale=len(stale_items),
+            full=full,
+            calls=stats_data["total_calls"],
+            rate_budget=limiter.summary(),
+            elapsed_seconds=stats_data["elapsed_seconds"],
+        )
+        if show_stats:
+            print(stats.report())
+        if stats_path is not None:
+            payload = stats_data
+            payload["rate_budget"] = {name: asdict(bucket) for name, bucket in limiter.buckets.items()}
+            payload["journal_replayed"] = journal.replayed if journal is not None else 0
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            stats_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+            print(f"Wrote sync stats: {stats_path}")
+
+        if journal is not None:
+            if journal.replayed:
+                print(f"Replayed {journal.replayed} completed calls from journal")
+            if journal.recovered:
+                print(f"Recovered {journal.recovered} interrupted creates instead of repeating them")
+            journal.complete()
+        return summary
+    finally:
+        # A failed run leaves its journal incomplete for --resume, but must not
+        # leak its journal, limiter or stats into the caller's context.
+        if journal is not None:
+            journal.close()
+        if journal_token is not None:
+            _ACTIVE_JOURNAL.reset(journal_token)
+        if state is not None:
+            state.close()
+        _ACTIVE_STATS.reset(stats_token)
+        _ACTIVE_LIMITER.reset(limiter_token)
+
+
+@dataclass
+class SyncTarget:
+    owner: str
+    project_number: int
+    repo: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.owner}/{self.project_number}"
+
+
+_OUTPUT_PREFIX: ContextVar[str | None] = ContextVar("output_prefix", default=None)
+
+
+class TargetPrefixedStream:
+    """Stdout wrapper tagging each line with the printing context's target.
+
+    Concurrent targets print whole lines under a lock, so their logs
+    interleave line by line instead of mid-line.
+    """
+
+    def __init__(self, inner: Any) -> None:
+        self.inner = inner
+        self._lock = threading.Lock()
+        self._partial = threading.local()
+
+    def write(self, text: str) -> int:
+        prefix = _OUTPUT_PREFIX.get()
+        if prefix is None:
+            return self.inner.write(text)
+        *lines, rest = (getattr(self._partial, "text", "") + text).split("\n")
+        self._partial.text = rest
+        if lines:
+            with self._lock:
+                self.inner.write("".join(f"[{prefix}] {line}\n" for line in lines))
+        return len(text)
+
+    def flush(self) -> None:
+        self.inner.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+
+def sync_targets(
+    targets: list[SyncTarget],
+    *,
+    snapshot: RoadmapSnapshot,
+    workers: int,
+    stats_path: Path | None = None,
+    **options: Any,
+) -> list[dict[str, Any]]:
+    """Run `sync()` for every target against one shared snapshot.
+
+    Each target gets its own rate limiter, stats, journal and state
+    partition (all per-context), so a slow or failing board never holds up
+    the others. A target that fails reports its error in its summary.
+    In issue mode, targets mirroring the same repo would race each other
+    creating its labels, milestones and issues, so they run one after
+    another (sharing the issues found or created); distinct repos still
+    run concurrently.
+    """
+    if options.get("state_path") is not None:
+        # Create/migrate the shared state file once, before threads race to.
+        SyncState(options["state_path"], "").close()
+
+    def run_target(target: SyncTarget, shared_issues: dict[str, IssueInfo] | None) -> dict[str, Any]:
+        _OUTPUT_PREFIX.set(target.label)
+        target_stats_path = None
+        if stats_path is not None:
+            slug = re.sub(r"[^A-Za-z0-9._-]+", "_", target.label).strip("_")
+            target_stats_path = stats_path.with_name(f"{stats_path.stem}-{slug}{stats_path.suffix}")
+        try:
+            return sync(
+                owner=target.owner,
+                project_number=target.project_number,
+                repo=target.repo,
+                snapshot=snapshot,
+                stats_path=target_stats_path,
+                shared_issues=shared_issues,
+                **options,
             )
-            apply_project_fields(
-                apply=apply,
-                project_id=project_id,
-                fields=fields,
-                item_id=item_id,
-                model=model,
-                node=node,
-                blocked_by_text=None,
-                blocked_by_field_name=blocked_by_field_name,
+        except SyncError as exc:
+            print(f"ERROR: {exc}")
+            key = state_target_key(
+                owner=target.owner, project_number=target.project_number, mode=options["mode"], repo=target.repo
             )
-            if not item_id.startswith("dry-run:"):
-                processed_project_item_ids.add(item_id)
-
-    stale_items: list[tuple[str, str | None]] = []
-    for node_id, node_items in managed_items_by_node_id.items():
-        for item in node_items:
-            item_id = item["id"]
-            item_title = item.get("title") or item.get("content", {}).get("title") or ""
-            is_out_of_scope = node_id not in desired_ids
-            is_duplicate = item_id not in processed_project_item_ids and node_id in desired_ids and mode == "issue"
-            if is_out_of_scope or is_duplicate:
-                stale_items.append((item_id, node_id))
-            elif archive_stale and node_id in desired_ids and mode == "draft":
-                # Draft mode does not dedupe issue-backed items.
-                _ = item_title
-
-    if stale_items:
-        print(f"Stale managed items: {len(stale_items)}")
-    for item_id, node_id in stale_items:
-        if archive_stale:
-            if not apply:
-                print(f"DRY-RUN: archive stale item {item_id} ({node_id})")
-            else:
-                run_gh(
-                    [
-                        "project",
-                        "item-archive",
-                        str(project_number),
-                        "--owner",
-                        owner,
-                        "--id",
-                        item_id,
-                    ]
+            return {"target": key, "error": str(exc)}
+
+    def run_group(indexes: list[int]) -> list[tuple[int, dict[str, Any]]]:
+        shared_issues: dict[str, IssueInfo] = {}
+        return [(i, contextvars.copy_context().run(run_target, targets[i], shared_issues)) for i in indexes]
+
+    groups: dict[str, list[int]] = defaultdict(list)
+    for index, target in enumerate(targets):
+        groups[target.repo if options.get("mode") == "issue" else f"#{index}"].append(index)
+    stdout = sys.stdout
+    sys.stdout = TargetPrefixedStream(stdout)
+    try:
+        results = run_concurrently([lambda g=g: run_group(g) for g in groups.values()], workers)
+    finally:
+        sys.stdout = stdout
+    return [summary for _, summary in sorted(pair for group in results for pair in group)]
+
+
+def gc(
+    *,
+    owner: str,
+    project_number: int,
+    mode: str,
+    repo: str,
+    apply: bool,
+    snapshot: RoadmapSnapshot,
+    state_path: Path | None = DEFAULT_STATE_PATH,
+    meta_ttl_seconds: float = DEFAULT_META_TTL_SECONDS,
+    batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE,
+    workers: int = DEFAULT_RECONCILE_WORKERS,
+) -> int:
+    """Archive stale and duplicate managed items without syncing anything else.
+
+    Returns the number of items archived (or that would be, on a dry run).
+    """
+    target = state_target_key(owner=owner, project_number=project_number, mode=mode, repo=repo)
+    state = SyncState(state_path, target) if state_path else None
+    try:
+        known = state.load_nodes() if state is not None else {}
+        project_id, _ = get_project_meta(owner, project_number, apply=False, state=state, ttl_seconds=meta_ttl_seconds)
+        set_phase("gc-list")
+        items_by_node = list_managed_items(project_id)
+        desired_ids = {node["id"] for node in snapshot.desired_nodes}
+        listed_ids = {item["id"] for items in items_by_node.values() for item in items}
+        # Keep the item the sync records, if still on the board; otherwise
+        # plan_item_gc falls back to the issue the sync's listing would pick.
+        keep = {node_id: record.item_id for node_id, record in known.items() if record.item_id in listed_ids}
+        stale_items = plan_item_gc(items_by_node, desired_ids=desired_ids, keep_item_by_node=keep, mode=mode)
+        print(f"Project #{project_number} owner={owner} project_id={project_id}")
+        print(f"Managed items: {len(listed_ids)} across {len(items_by_node)} nodes; stale or duplicate: {len(stale_items)}")
+        archived = archive_stale_items(
+            apply=apply,
+            project_id=project_id,
+            stale_items=stale_items,
+            desired_ids=desired_ids,
+            state=state,
+            records=known,
+            batch_size=batch_size,
+            workers=workers,
+        )
+        print(f"Rate budget: {current_rate_limiter().summary()}")
+        return archived if apply else len(stale_items)
+    finally:
+        if state is not None:
+            state.close()
+
+
+def format_target_summaries(summaries: list[dict[str, Any]]) -> str:
+    lines = [f"{'target':<56} {'nodes':>6} {'synced':>6} {'skipped':>7} {'stale':>5} {'calls':>6} {'secs':>7}"]
+    for summary in summaries:
+        if "error" in summary:
+            lines.append(f"{summary['target']:<56} FAILED: {summary['error']}")
+            continue
+        lines.append(
+            f"{summary['target']:<56} {summary['desired']:>6} {summary['work'] - summary['skipped']:>6} "
+            f"{summary['skipped']:>7} {summary['stale']:>5} {summary['calls']:>6} {summary['elapsed_seconds']:>7.1f}"
+        )
+        lines.append(f"{'':<4}rate budget: {summary['rate_budget'] or 'unknown'}")
+    return "\n".join(lines)
+
+
+PULL_ITEMS_QUERY = """
+query RoadmapPullItems($project: ID!, $cursor: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          id
+          isArchived
+          fieldValues(first: 20) {
+            nodes {
+              ... on ProjectV2ItemFieldSingleSelectValue { name field { ... on ProjectV2FieldCommon { name } } }
+              ... on ProjectV2ItemFieldDateValue { date field { ... on ProjectV2FieldCommon { name } } }
+            }
+          }
+          content {
+            __typename
+            ... on Issue { number title body state stateReason url }
+            ... on DraftIssue { id title body }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+PULL_STATUS_FROM_PROJECT = {"Todo": "planned", "In progress": "in_progress", "Done": "done"}
+PULL_PRIORITIES = {"P0", "P1", "P2"}
+DEPENDS_ON_CHECKBOX_RE = re.compile(r"^- \[( |x|X)\] (?:#\d+ )?`([^`]+)`")
+
+
+@dataclass
+class PullObservation:
+    """One remote signal for a node field, in project and model vocabulary."""
+
+    node_id: str
+    field: str
+    project_value: str
+    model_value: str
+    source: str
+    checkbox: bool = False
+
+
+def fetch_project_items_snapshot(project_id: str) -> list[dict[str, Any]]:
+    """Every project item with field values and content, 100 per GraphQL query."""
+    items: list[dict[str, Any]] = []
+    cursor: str | None = None
+    while True:
+        data = graphql(PULL_ITEMS_QUERY, {"project": project_id, "cursor": cursor})
+        page = ((data.get("node") or {}).get("items")) or {}
+        for item in page.get("nodes") or []:
+            if item and not item.get("isArchived"):
+                items.append(item)
+        info = page.get("pageInfo") or {}
+        if not info.get("hasNextPage"):
+            return items
+        cursor = info.get("endCursor")
+
+
+def depends_on_checkboxes(body: str) -> dict[str, bool]:
+    """Checkbox state per dependency node id from a generated "Depends On" section."""
+    states: dict[str, bool] = {}
+    in_section = False
+    for line in (body or "").splitlines():
+        if line.startswith("## "):
+            in_section = line.strip() == "## Depends On"
+            continue
+        match = DEPENDS_ON_CHECKBOX_RE.match(line) if in_section else None
+        if match:
+            states[match.group(2)] = match.group(1) != " "
+    return states
+
+
+def pull_observations(
+    *,
+    snapshot: list[dict[str, Any]],
+    nodes_by_id: dict[str, dict[str, Any]],
+    known: dict[str, NodeState],
+    mode: str,
+    repo: str,
+) -> tuple[list[PullObservation], list[str]]:
+    """Turn project items into per-field remote observations for managed nodes."""
+    observations: list[PullObservation] = []
+    notes: list[str] = []
+    items_by_node: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for item in snapshot:
+        content = item.get("content") or {}
+        typename = content.get("__typename")
+        if (mode == "issue") != (typename == "Issue"):
+            continue
+        if typename == "Issue" and not (content.get("url") or "").startswith(f"https://github.com/{repo}/issues/"):
+            continue
+        node_id = extract_node_id_from_marker(content.get("body") or "") or extract_managed_node_id(
+            content.get("title") or ""
+        )
+        if node_id in nodes_by_id:
+            items_by_node[node_id].append(item)
+
+    for node_id, items in sorted(items_by_node.items()):
+        item = items[0]
+        if len(items) > 1:
+            recorded = known.get(node_id)
+            item = next((i for i in items if recorded and i["id"] == recorded.item_id), item)
+            notes.append(f"{node_id}: {len(items)} project items; reading {item['id']}")
+        content = item.get("content") or {}
+        label = f"#{content['number']}" if content.get("number") else item["id"]
+        values: dict[str, str] = {}
+        for value in (item.get("fieldValues") or {}).get("nodes") or []:
+            field_name = ((value or {}).get("field") or {}).get("name")
+            if field_name:
+                values[field_name] = value.get("name") or value.get("date") or ""
+
+        status_name = values.get("Status")
+        if content.get("state") == "CLOSED":
+            # Closing an issue outranks a Status column nobody moved.
+            closed_as = "deprecated" if content.get("stateReason") == "NOT_PLANNED" else "done"
+            observations.append(PullObservation(node_id, "Status", "Done", closed_as, f"{label} closed"))
+        elif status_name in PULL_STATUS_FROM_PROJECT:
+            observations.append(
+                PullObservation(node_id, "Status", status_name, PULL_STATUS_FROM_PROJECT[status_name], f"{label} Status")
+            )
+        elif status_name:
+            notes.append(f"{node_id}: Status '{status_name}' has no roadmap equivalent")
+        priority = values.get("Priority")
+        if priority in PULL_PRIORITIES:
+            observations.append(PullObservation(node_id, "Priority", priority, priority, f"{label} Priority"))
+        for field_name in ("Start date", "Target date"):
+            date_value = values.get(field_name, "")
+            observations.append(PullObservation(node_id, field_name, date_value, date_value, f"{label} {field_name}"))
+        for dep_id, checked in depends_on_checkboxes(content.get("body") or "").items():
+            if dep_id in nodes_by_id:
+                observations.append(
+                    PullObservation(
+                        dep_id,
+                        "Status",
+                        "Done" if checked else "Todo",
+                        "done" if checked else "planned",
+                        f"{label} Depends On checkbox",
+                        checkbox=True,
+                    )
                 )
-                print(f"Archived stale item: {item_id} ({node_id})")
+    return observations, notes
+
+
+def pull_patch_path(node_index: int, node: dict[str, Any], field_name: str) -> list[tuple[str, Any]]:
+    """JSON Pointer path(s) a field change lands on; dates prefer the key the node already uses."""
+    base = f"/nodes/{node_index}"
+    if field_name == "Status":
+        return [(f"{base}/status", None)]
+    if field_name == "Priority":
+        return [(f"{base}/priority", None)]
+    metadata_key = "start_date" if field_name == "Start date" else "target_date"
+    if field_name == "Target date" and node.get("due_date"):
+        return [(f"{base}/due_date", None)]
+    if "metadata" not in node:
+        return [(f"{base}/metadata", {}), (f"{base}/metadata/{metadata_key}", None)]
+    return [(f"{base}/metadata/{metadata_key}", None)]
+
+
+def plan_pull(
+    *,
+    model: dict[str, Any],
+    fields: dict[str, FieldInfo],
+    known: dict[str, NodeState],
+    observations: list[PullObservation],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Three-way merge of remote observations against the model and the last sync.
+
+    Returns (JSON Patch operations, conflicts). A field is patched only when GitHub moved away from what the last
+    sync pushed and the model still holds that pushed value; when both sides
+    moved, or there is no sync record to decide, it is reported instead.
+    """
+    nodes = model.get("nodes", [])
+    index_by_id = {node["id"]: i for i, node in enumerate(nodes)}
+    option_names = {name: {opt_id: opt for opt, opt_id in info.options.items()} for name, info in fields.items()}
+    grouped: dict[tuple[str, str], list[PullObservation]] = defaultdict(list)
+    for obs in observations:
+        grouped[(obs.node_id, obs.field)].append(obs)
+
+    ops: list[dict[str, Any]] = []
+    conflicts: list[str] = []
+    for (node_id, field_name), group in sorted(grouped.items()):
+        node = nodes[index_by_id[node_id]]
+        if field_name == "Status":
+            ours = map_status(node.get("status", "planned"))
+        elif field_name == "Priority":
+            ours = map_priority(node.get("priority", "P2"))
+        elif field_name == "Start date":
+            ours = node_start_date(model, node) or ""
+        else:
+            ours = node_target_date(model, node) or ""
+
+        record = known.get(node_id)
+        base: str | None = None
+        if record and field_name in record.field_values:
+            base = record.field_values[field_name]
+            base = option_names.get(field_name, {}).get(base, base)
+
+        reference = ours if base is None else base
+        # A checkbox only says done / not done, so it moves only when that flips.
+        moved = [
+            obs
+            for obs in group
+            if ((obs.project_value == "Done") != (reference == "Done") if obs.checkbox else obs.project_value != reference)
+        ]
+        if not moved:
+            continue
+        proposals = {obs.model_value for obs in moved}
+        sources = ", ".join(obs.source for obs in moved)
+        if len(proposals) > 1:
+            conflicts.append(f"{node_id} {field_name}: GitHub disagrees with itself ({sources})")
+            continue
+        remote = moved[0]
+        if remote.project_value == ours:
+            continue
+        if base is None:
+            conflicts.append(f"{node_id} {field_name}: no sync record; model={ours!r} GitHub={remote.project_value!r} ({sources})")
+            continue
+        if ours != base:
+            conflicts.append(
+                f"{node_id} {field_name}: changed on both sides; base={base!r} model={ours!r} "
+                f"GitHub={remote.project_value!r} ({sources})"
+            )
+            continue
+        if field_name in ("Start date", "Target date") and not remote.model_value:
+            conflicts.append(f"{node_id} {field_name}: cleared on GitHub; roadmap dates can only be changed, not cleared")
+            continue
+
+        paths = pull_patch_path(index_by_id[node_id], node, field_name)
+        for path, container in paths[:-1]:
+            ops.append({"op": "add", "path": path, "value": container})
+        path = paths[-1][0]
+        exists = (
+            field_name in ("Status", "Priority")
+            or (field_name == "Target date" and bool(node.get("due_date")))
+            or path.rsplit("/", 1)[-1] in (node.get("metadata") or {})
+        )
+        ops.append({"op": "replace" if exists else "add", "path": path, "value": remote.model_value})
+    return ops, conflicts
+
+
+def apply_json_patch(document: Any, ops: list[dict[str, Any]]) -> None:
+    """Apply add/replace operations (the only kinds plan_pull emits) in place."""
+    for op in ops:
+        parts = [p.replace("~1", "/").replace("~0", "~") for p in op["path"].lstrip("/").split("/")]
+        target = document
+        for part in parts[:-1]:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        key = parts[-1]
+        if isinstance(target, list):
+            target[int(key)] = op["value"]
         else:
-            print(f"Leave stale item untouched: {item_id} ({node_id})")
+            target[key] = op["value"]
 
 
-def main() -> int:
+def pull(
+    *,
+    owner: str,
+    project_number: int,
+    model_path: Path,
+    apply: bool,
+    kinds: set[str],
+    mode: str,
+    repo: str,
+    state_path: Path | None = DEFAULT_STATE_PATH,
+    meta_ttl_seconds: float = DEFAULT_META_TTL_SECONDS,
+    patch_path: Path | None = None,
+) -> int:
+    """Reverse sync: fold board edits back into the roadmap model. Returns the conflict count."""
+    model = load_model(model_path)
+    target = state_target_key(owner=owner, project_number=project_number, mode=mode, repo=repo)
+    state = SyncState(state_path, target) if state_path else None
+    try:
+        known = state.load_nodes() if state is not None else {}
+        project_id, fields = get_project_meta(
+            owner, project_number, apply=False, state=state, ttl_seconds=meta_ttl_seconds
+        )
+        snapshot = fetch_project_items_snapshot(project_id)
+        nodes_by_id = {node["id"]: node for node in model.get("nodes", []) if node.get("kind") in kinds}
+        observations, notes = pull_observations(
+            snapshot=snapshot, nodes_by_id=nodes_by_id, known=known, mode=mode, repo=repo
+        )
+        # Sync state keeps the last *pushed* values as the merge base; the next
+        # push brings the board's other fields in line with the patched model.
+        ops, conflicts = plan_pull(model=model, fields=fields, known=known, observations=observations)
+
+        print(f"Project #{project_number} owner={owner} project_id={project_id}")
+        print(f"Project items read: {len(snapshot)}; sync records: {len(known)}")
+        for note in notes:
+            print(f"NOTE: {note}")
+        for op in ops:
+            print(f"{'PATCH' if apply else 'DRY-RUN: patch'} {op['op']} {op['path']} = {json.dumps(op['value'])}")
+        for conflict in conflicts:
+            print(f"CONFLICT: {conflict}")
+        print(f"Patch operations: {len(ops)}; conflicts: {len(conflicts)}")
+
+        if patch_path:
+            patch_path.write_text(json.dumps(ops, indent=2) + "\n", encoding="utf-8")
+        if apply and ops:
+            apply_json_patch(model, ops)
+            with model_path.open("w", encoding="utf-8") as f:
+                json.dump(model, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            print(f"Wrote {model_path}")
+        return len(conflicts)
+    finally:
+        if state is not None:
+            state.close()
+
+
+def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Sync semantic roadmap to GitHub Project.")
-    parser.add_argument("--owner", default="BioregionalKnowledgeCommons")
-    parser.add_argument("--project", type=int, default=1)
+    parser.add_argument(
+        "--owner",
+        action="append",
+        default=None,
+        help="Project owner (default: BioregionalKnowledgeCommons). Repeat with --project to sync several targets.",
+    )
+    parser.add_argument(
+        "--project",
+        type=int,
+        action="append",
+        default=None,
+        help="Project number (default: 1). Repeatable; each --project is one sync target.",
+    )
     parser.add_argument("--model", type=Path, default=DEFAULT_MODEL)
-    parser.add_argument("--repo", default=DEFAULT_REPO, help="Repository for issue-backed sync mode.")
+    parser.add_argument(
+        "--repo",
+        action="append",
+        default=None,
+        help="Repository for issue-backed sync mode. Give once for all targets or once per --project.",
+    )
+    parser.add_argument(
+        "--target-workers",
+        type=int,
+        default=None,
+        help="Targets reconciled concurrently when several are given (default: all of them).",
+    )
     parser.add_argument(
         "--mode",
         choices=["draft", "issue"],
@@ -1334,27 +3843,218 @@ def main() -> int:
         default=BLOCKED_BY_FIELD_NAME,
         help="Project text field name for unresolved dependency projection.",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--state-file",
+        type=Path,
+        default=DEFAULT_STATE_PATH,
+        help="SQLite file recording what previous syncs pushed per node.",
+    )
+    parser.add_argument(
+        "--no-state",
+        action="store_true",
+        help="Ignore local sync state and reconcile every node against GitHub.",
+    )
+    parser.add_argument(
+        "--full-reconcile",
+        action="store_true",
+        help="Re-list all project items and issues instead of trusting sync state.",
+    )
+    parser.add_argument(
+        "--full-reconcile-days",
+        type=float,
+        default=DEFAULT_FULL_RECONCILE_DAYS,
+        help="Force a full reconcile when the last one is older than this many days.",
+    )
+    parser.add_argument(
+        "--meta-ttl",
+        type=float,
+        default=DEFAULT_META_TTL_SECONDS,
+        help="Seconds to reuse cached project id/field metadata from sync state.",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=None,
+        help=f"Operation journal path for --apply runs (default: per-target file in {DEFAULT_JOURNAL_DIR}).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --apply run from its journal without redoing completed calls.",
+    )
+    parser.add_argument(
+        "--max-rate-wait",
+        type=float,
+        default=900.0,
+        help="Fail (resumably) instead of sleeping longer than this many seconds for a rate-limit reset.",
+    )
+    parser.add_argument(
+        "--record-session",
+        type=Path,
+        default=None,
+        help="Append every gh exchange to this JSONL file (replayable with scripts/fake_github.py).",
+    )
+    parser.add_argument("--stats", action="store_true", help="Print per-pass gh call counts, latency and bytes.")
+    parser.add_argument("--stats-file", type=Path, default=None, help="Write the same call statistics as JSON.")
+    parser.add_argument(
+        "--since",
+        default=None,
+        help="Only sync nodes added/changed (plus nodes referencing them) since this git revision; archive removed ones.",
+    )
+    parser.add_argument(
+        "--reconcile-workers",
+        type=int,
+        default=DEFAULT_RECONCILE_WORKERS,
+        help="Concurrent gh calls when creating/updating/deleting labels and milestones.",
+    )
+    parser.add_argument(
+        "--draft-batch-size",
+        type=int,
+        default=DEFAULT_DRAFT_BATCH_SIZE,
+        help="Draft creates/updates sent per GraphQL request in draft mode.",
+    )
+    parser.add_argument(
+        "--archive-batch-size",
+        type=int,
+        default=DEFAULT_ARCHIVE_BATCH_SIZE,
+        help="Project items archived per GraphQL request when cleaning up stale/duplicate items.",
+    )
+    parser.add_argument(
+        "--gc",
+        action="store_true",
+        help="Only archive stale and duplicate managed items (batched), without syncing anything else.",
+    )
+    parser.add_argument(
+        "--pull",
+        action="store_true",
+        help="Reverse sync: patch the model from board Status/Priority/dates, issue state and Depends On checkboxes.",
+    )
+    parser.add_argument(
+        "--patch-file",
+        type=Path,
+        default=None,
+        help="With --pull, also write the JSON Patch (RFC 6902) operations to this file.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.resume and not args.apply:
+        parser.error("--resume requires --apply")
+
+    projects = args.project or [1]
+    owners = args.owner or ["BioregionalKnowledgeCommons"]
+    repos = args.repo or [DEFAULT_REPO]
+    for flag, values in (("--owner", owners), ("--repo", repos)):
+        if len(values) not in (1, len(projects)):
+            parser.error(f"{flag} must be given once or once per --project")
+    targets = [
+        SyncTarget(
+            owner=owners[i] if len(owners) > 1 else owners[0],
+            project_number=number,
+            repo=repos[i] if len(repos) > 1 else repos[0],
+        )
+        for i, number in enumerate(projects)
+    ]
+    if len(targets) > 1 and (args.pull or args.gc):
+        parser.error("--pull and --gc work on a single target")
+    if args.pull and args.gc:
+        parser.error("--pull and --gc are separate runs")
+    if len(targets) > 1 and args.journal:
+        parser.error("--journal names one file; with several targets each uses its default journal")
 
     kinds = {k.strip() for k in args.kinds.split(",") if k.strip()}
     if not kinds:
         kinds = set(DEFAULT_KINDS)
 
+    if args.record_session:
+        _ACTIVE_TRANSPORT.set(RecordingTransport(_ACTIVE_TRANSPORT.get(), args.record_session))
+
+    if args.pull:
+        try:
+            conflicts = pull(
+                owner=targets[0].owner,
+                project_number=targets[0].project_number,
+                model_path=args.model,
+                apply=args.apply,
+                kinds=kinds,
+                mode=args.mode,
+                repo=targets[0].repo,
+                state_path=None if args.no_state else args.state_file,
+                meta_ttl_seconds=args.meta_ttl,
+                patch_path=args.patch_file,
+            )
+        except SyncError as exc:
+            print(f"ERROR: {exc}")
+            return 1
+        return 1 if conflicts else 0
+
+    if args.gc:
+        try:
+            gc(
+                owner=targets[0].owner,
+                project_number=targets[0].project_number,
+                mode=args.mode,
+                repo=targets[0].repo,
+                apply=args.apply,
+                snapshot=load_snapshot(args.model, kinds),
+                state_path=None if args.no_state else args.state_file,
+                meta_ttl_seconds=args.meta_ttl,
+                batch_size=args.archive_batch_size,
+                workers=args.reconcile_workers,
+            )
+        except SyncError as exc:
+            print(f"ERROR: {exc}")
+            return 1
+        return 0
+
+    options: dict[str, Any] = {
+        "model_path": args.model,
+        "apply": args.apply,
+        "archive_stale": args.archive_stale,
+        "kinds": kinds,
+        "mode": args.mode,
+        "ensure_fields": args.ensure_fields,
+        "blocked_by_field_name": args.blocked_by_field,
+        "state_path": None if args.no_state else args.state_file,
+        "full_reconcile": args.full_reconcile,
+        "full_reconcile_days": args.full_reconcile_days,
+        "meta_ttl_seconds": args.meta_ttl,
+        "resume": args.resume,
+        "max_rate_wait": args.max_rate_wait,
+        "show_stats": args.stats,
+        "reconcile_workers": args.reconcile_workers,
+        "draft_batch_size": args.draft_batch_size,
+        "archive_batch_size": args.archive_batch_size,
+    }
     try:
+        snapshot = load_snapshot(args.model, kinds, args.since)
+        if len(targets) > 1:
+            summaries = sync_targets(
+                targets,
+                snapshot=snapshot,
+                workers=args.target_workers or len(targets),
+                stats_path=args.stats_file,
+                **options,
+            )
+            print(format_target_summaries(summaries))
+            if any("error" in summary for summary in summaries):
+                if args.apply:
+                    print("Completed operations are journaled; re-run with --resume to continue.")
+                return 1
+            return 0
+        target = targets[0]
         sync(
-            owner=args.owner,
-            project_number=args.project,
-            model_path=args.model,
-            apply=args.apply,
-            archive_stale=args.archive_stale,
-            kinds=kinds,
-            mode=args.mode,
-            repo=args.repo,
-            ensure_fields=args.ensure_fields,
-            blocked_by_field_name=args.blocked_by_field,
+            owner=target.owner,
+            project_number=target.project_number,
+            repo=target.repo,
+            snapshot=snapshot,
+            journal_path=args.journal,
+            stats_path=args.stats_file,
+            **options,
         )
     except SyncError as exc:
         print(f"ERROR: {exc}")
+        if args.apply:
+            print("Completed operations are journaled; re-run with --resume to continue.")
         return 1
     return 0
 